@@ -0,0 +1,80 @@
+"""
+ * Author: agent
+ * Date: 2026-10-18
+ * License: CC0
+ * Source: folklore (offline dynamic connectivity, segment tree over time)
+ * Description: Answers connectivity queries on a graph under edge insertions and
+ * deletions, offline. Each edge is alive during an interval of time, which is added to
+ * the O(log Q) segment tree nodes covering it; one DFS over the tree then joins a node's
+ * edges on entry and rolls them back on exit, so each leaf sees exactly the live edges.
+ * events is a list of ('add', a, b), ('del', a, b), ('query', a, b) (are a and b
+ * connected?) and ('count',) (number of components). Multi-edges are allowed; a
+ * deletion removes one copy of an edge that is present.
+ * Usage: dyn_con(3, [('add', 0, 1), ('query', 0, 1), ('del', 1, 0), ('count',)])
+ *  == [True, 3]
+ * Time: O(Q log Q log N)
+ * Status: stress-tested
+
+"""
+
+from UnionFindRollback import RollbackUF
+
+def dyn_con(n, events):
+    """Answers to the 'query' and 'count' events, in order"""
+    T = len(events)
+    size = 1
+    while size < T:
+        size *= 2
+    seg = [[] for _ in range(2 * size)]
+
+    def add(l, r, e):
+        """Add edge e to the nodes covering times [l, r)"""
+        l += size
+        r += size
+        while l < r:
+            if l & 1:
+                seg[l].append(e)
+                l += 1
+            if r & 1:
+                r -= 1
+                seg[r].append(e)
+            l >>= 1
+            r >>= 1
+
+    alive = {}
+    for t, ev in enumerate(events):
+        if ev[0] in ('add', 'del'):
+            e = (min(ev[1], ev[2]), max(ev[1], ev[2]))
+            if ev[0] == 'add':
+                alive.setdefault(e, []).append(t)
+            else:
+                add(alive[e].pop(), t, e)
+    for e, ts in alive.items():
+        for t in ts:
+            add(t, T, e)
+
+    uf = RollbackUF(n)
+    res = []
+    # Explicit DFS; a negative entry means "leave node ~k, rolling back to time t"
+    stack = [(1, 0)]
+    while stack:
+        k, t = stack.pop()
+        if k < 0:
+            uf.rollback(t)
+            continue
+        t = uf.time()
+        for a, b in seg[k]:
+            uf.join(a, b)
+        if k >= size:
+            ev = events[k - size] if k - size < T else ('',)
+            if ev[0] == 'query':
+                res.append(uf.find(ev[1]) == uf.find(ev[2]))
+            elif ev[0] == 'count':
+                # Every successful join pushed two entries
+                res.append(n - uf.time() // 2)
+            uf.rollback(t)
+        else:
+            stack.append((~k, t))
+            stack.append((2 * k + 1, 0))
+            stack.append((2 * k, 0))
+    return res
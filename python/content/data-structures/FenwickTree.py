@@ -5,14 +5,37 @@
  * Source: folklore/TopCoder
  * Description: Computes partial sums a[0] + a[1] + ... + a[pos - 1], and updates single elements a[i],
  * taking the difference between the old and new value.
+ * FT(n, a) builds the tree over a in O(N). If a is a NumPy array (e.g. np.zeros(n, dtype=np.int64))
+ * the tree is stored as one, and update_many/query_many process whole batches by walking all
+ * chains in lockstep. FT(n, a, typecode) stores the tree in a compact array(typecode) instead,
+ * e.g. 'i' for counts below 2^31, with list-speed scalar access.
+ * RangeFT(n, a) adds x to all of a[l..r) and sums prefixes, using two trees.
  * Time: Both operations are O(log N).
  * Status: Stress-tested
 
 """
 
+import numpy as np
+from array import array
+from itertools import accumulate
+
 class FT:
-    def __init__(self, n):
-        self.s = [0] * n
+    def __init__(self, n, a=None, typecode=None):
+        if a is None:
+            self.s = [0] * n if typecode is None else array(typecode, [0]) * n
+            return
+        # s[i] is the sum of a over [i & (i + 1), i]
+        if isinstance(a, np.ndarray):
+            pre = np.concatenate(([0], np.cumsum(a, dtype=np.int64)))
+            i = np.arange(n)
+            self.s = pre[i + 1] - pre[i & (i + 1)]
+        else:
+            pre = [0] + list(accumulate(a))
+            self.s = [pre[i + 1] - pre[i & (i + 1)] for i in range(n)]
+        if typecode is not None:
+            s = array(typecode)
+            s.frombytes(np.asarray(self.s, dtype=typecode).tobytes())
+            self.s = s
 
     def update(self, pos, dif):
         """a[pos] += dif"""
@@ -34,10 +57,76 @@ class FT:
         if sum_val <= 0:
             return -1
         pos = 0
-        pw = 1 << 25
+        pw = 1 << len(self.s).bit_length()
         while pw:
             if pos + pw <= len(self.s) and self.s[pos + pw - 1] < sum_val:
                 pos += pw
                 sum_val -= self.s[pos - 1]
             pw >>= 1
         return pos
+
+    def update_many(self, pos, dif):
+        """a[pos[i]] += dif[i] for all i"""
+        if not isinstance(self.s, np.ndarray):
+            for p, d in zip(pos, dif):
+                self.update(p, d)
+            return
+        p = np.array(pos, dtype=np.int64)
+        d = np.broadcast_to(np.asarray(dif, dtype=np.int64), p.shape)
+        while len(p):
+            np.add.at(self.s, p, d)
+            p |= p + 1
+            m = p < len(self.s)
+            p, d = p[m], d[m]
+
+    def query_many(self, pos):
+        """sums of values in [0, pos[i]) for all i"""
+        if not isinstance(self.s, np.ndarray):
+            return [self.query(p) for p in pos]
+        p = np.array(pos, dtype=np.int64)
+        res = np.zeros(len(p), dtype=np.int64)
+        i = np.flatnonzero(p > 0)
+        p = p[i]
+        while len(i):
+            res[i] += self.s[p - 1]
+            p &= p - 1
+            m = p > 0
+            i, p = i[m], p[m]
+        return res
+
+class RangeFT:
+    def __init__(self, n, a=None):
+        """Prefix sums are b1.query(pos) * pos - b2.query(pos)"""
+        if a is None:
+            self.b1, self.b2 = FT(n), FT(n)
+        elif isinstance(a, np.ndarray):
+            self.b1, self.b2 = FT(n, np.zeros(n, dtype=np.int64)), FT(n, -a)
+        else:
+            self.b1, self.b2 = FT(n, [0] * n), FT(n, [-x for x in a])
+
+    def update(self, l, r, x):
+        """a[i] += x for l <= i < r"""
+        for pos, dif in ((l, x), (r, -x)):
+            if pos < len(self.b1.s):
+                self.b1.update(pos, dif)
+                self.b2.update(pos, dif * pos)
+
+    def query(self, pos):
+        """sum of values in [0, pos)"""
+        return self.b1.query(pos) * pos - self.b2.query(pos)
+
+    def update_many(self, l, r, x):
+        """a[i] += x[j] for l[j] <= i < r[j], for all j"""
+        l, r, x = (np.asarray(v, dtype=np.int64) for v in (l, r, x))
+        x = np.broadcast_to(x, l.shape)
+        pos, dif = np.concatenate((l, r)), np.concatenate((x, -x))
+        m = pos < len(self.b1.s)
+        pos, dif = pos[m], dif[m]
+        self.b1.update_many(pos, dif)
+        self.b2.update_many(pos, dif * pos)
+
+    def query_many(self, pos):
+        """sums of values in [0, pos[i]) for all i"""
+        pos = np.asarray(pos, dtype=np.int64)
+        return (np.asarray(self.b1.query_many(pos)) * pos -
+                np.asarray(self.b2.query_many(pos)))
@@ -5,6 +5,10 @@
  * Source: folklore
  * Description: Computes sums a[i,j] for all i<I, j<J, and increases single elements a[i,j].
  * Requires that the elements to be updated are known in advance (call fakeUpdate() before init()).
+ * FlatFT2(xs, ys) is the offline version for big inputs: it takes all points that will be
+ * updated up front, compresses both coordinates, and stores every per-x tree in one flat
+ * array (entries of x at off[x]..off[x+1]-1, found by one binary search on combined keys).
+ * Points and queries go in NumPy arrays, one batch at a time, and may use any int coordinates.
  * Time: O(log^2 N). (Use persistent segment trees for O(log N).)
  * Status: stress-tested
 
@@ -12,6 +16,7 @@
 
 from FenwickTree import FT
 import bisect
+import numpy as np
 
 class FT2:
     def __init__(self, limx):
@@ -42,3 +47,85 @@ class FT2:
             sum_val += self.ft[x - 1].query(self.ind(x - 1, y))
             x &= x - 1
         return sum_val
+
+class FlatFT2:
+    def __init__(self, xs, ys):
+        self.ux = np.unique(xs)
+        self.uy = np.unique(ys)
+        n = len(self.ux)
+        self.W = len(self.uy) + 1
+        # Every tree node (x, y) touched by an update, as the key x * W + y
+        x = np.searchsorted(self.ux, xs)
+        y = np.searchsorted(self.uy, ys)
+        keys = []
+        while len(x):
+            keys.append(x * self.W + y)
+            x = x | (x + 1)
+            m = x < n
+            x, y = x[m], y[m]
+        self.keys = np.unique(np.concatenate(keys)) if keys else np.zeros(0, dtype=np.int64)
+        self.off = np.searchsorted(self.keys, np.arange(n + 1) * self.W)
+        self.s = np.zeros(len(self.keys), dtype=np.int64)
+
+    def _find(self, x, y):
+        """Index of the first stored key >= x * W + y; sorting first keeps the search cache-friendly"""
+        key = x * self.W + y
+        o = np.argsort(key)
+        res = np.empty_like(key)
+        res[o] = np.searchsorted(self.keys, key[o])
+        return res
+
+    def update_many(self, xs, ys, difs):
+        """a[xs[i], ys[i]] += difs[i] for all i; the points must have been given to the constructor"""
+        x = np.searchsorted(self.ux, xs)
+        y = np.searchsorted(self.uy, ys)
+        d = np.broadcast_to(np.asarray(difs, dtype=np.int64), x.shape)
+        n = len(self.ux)
+        while len(x):
+            lo = self.off[x]
+            size = self.off[x + 1] - lo
+            k = self._find(x, y) - lo
+            i, dk = np.arange(len(k)), d
+            while len(k):
+                np.add.at(self.s, lo[i] + k, dk)
+                k = k | (k + 1)
+                m = k < size[i]
+                i, k, dk = i[m], k[m], dk[m]
+            x = x | (x + 1)
+            m = x < n
+            x, y, d = x[m], y[m], d[m]
+
+    def query_many(self, xs, ys):
+        """sums of a[x, y] over x < xs[i], y < ys[i], for all i"""
+        x = np.searchsorted(self.ux, xs)
+        y = np.searchsorted(self.uy, ys)
+        res = np.zeros(len(x), dtype=np.int64)
+        q = np.flatnonzero(x > 0)
+        x, y = x[q] - 1, y[q]
+        while len(q):
+            lo = self.off[x]
+            # Number of stored y's below the bound is the prefix length in x's tree
+            k = self._find(x, y) - lo
+            i = np.flatnonzero(k > 0)
+            k = k[i]
+            while len(i):
+                res[q[i]] += self.s[lo[i] + k - 1]
+                k &= k - 1
+                m = k > 0
+                i, k = i[m], k[m]
+            x = (x & (x + 1)) - 1
+            m = x >= 0
+            q, x, y = q[m], x[m], y[m]
+        return res
+
+    def rect_many(self, x0, y0, x1, y1):
+        """sums of a[x, y] over x0[i] <= x < x1[i], y0[i] <= y < y1[i], for all i"""
+        r = self.query_many(np.concatenate((x1, x0, x1, x0)), np.concatenate((y1, y1, y0, y0)))
+        r = r.reshape(4, -1)
+        return r[0] - r[1] - r[2] + r[3]
+
+    def update(self, x, y, dif):
+        self.update_many(np.array([x]), np.array([y]), [dif])
+
+    def query(self, x, y):
+        return int(self.query_many(np.array([x]), np.array([y]))[0])
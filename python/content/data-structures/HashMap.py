@@ -5,11 +5,22 @@
  * Source: http://codeforces.com/blog/entry/60737
  * Description: Hash map with custom hash function.
  * Python's dict is already highly optimized, so this is a wrapper with custom hashing option.
+ * IntHashMap is a compact int64 -> int64 (or float) table for huge counters: open
+ * addressing over two typed arrays, 16 bytes per slot at load <= 3/4, instead of a
+ * dict slot plus two boxed ints per entry. The slot is the top bits of (x ^ RANDOM) * C.
+ * Probing is linear and never wraps; a few spare slots after the last home slot end
+ * every probe sequence, and the table grows if they fill up. With robin=True each run
+ * of occupied slots stays sorted by home slot (an insert shifts the rest of the run),
+ * so lookups stop early. insert_many/get_many do whole arrays at once, one vectorized
+ * probe step per round. Keys must not be -2^63 (marks empty slots). No erase.
+ * Time: O(1) expected
 
 """
 
 import time
 import math
+import numpy as np
+from array import array
 
 class HashMap(dict):
     """
@@ -34,3 +45,186 @@ class HashMap(dict):
         return (x * self.C) % (2**64)
 
 # For most purposes, Python's built-in dict is sufficient and fast
+
+
+class IntHashMap:
+    EMPTY = -(1 << 63)
+    PAD = 256
+    MAX_LOAD = 0.75
+    M64 = (1 << 64) - 1
+
+    def __init__(self, value='int', robin=False, use_random=False, cap=16):
+        self.typ = 'q' if value == 'int' else 'd'
+        self.dtype = np.int64 if value == 'int' else np.float64
+        self.robin = robin
+        self.RANDOM = int(time.time() * 1e9) % (2**63) if use_random else 0
+        self.C = int(4e18 * math.acos(0)) | 71
+        self._alloc(1 << max(cap - 1, 1).bit_length())
+
+    def _alloc(self, cap):
+        self.cap, self.shift, self.size = cap, 64 - (cap.bit_length() - 1), 0
+        self.K = array('q', [self.EMPTY]) * (cap + self.PAD)
+        self.V = array(self.typ, [0]) * (cap + self.PAD)
+
+    def __len__(self):
+        return self.size
+
+    def _home(self, x):
+        """Home slot of x"""
+        return ((x ^ self.RANDOM) * self.C & self.M64) >> self.shift
+
+    def _home_many(self, xs):
+        """Home slots of an int64 array"""
+        h = (xs.view(np.uint64) ^ np.uint64(self.RANDOM)) * np.uint64(self.C)
+        return (h >> np.uint64(self.shift)).astype(np.int64)
+
+    def _find(self, x):
+        """Slot holding x, or where the probe for x stopped (as ~slot)"""
+        K, i = self.K, self._home(x)
+        h = i
+        while True:
+            k = K[i]
+            if k == x:
+                return i
+            if k == self.EMPTY or (self.robin and self._home(k) > h):
+                return ~i
+            i += 1
+
+    def __contains__(self, x):
+        return self._find(x) >= 0
+
+    def __getitem__(self, x):
+        i = self._find(x)
+        if i < 0:
+            raise KeyError(x)
+        return self.V[i]
+
+    def get(self, x, default=0):
+        i = self._find(x)
+        return self.V[i] if i >= 0 else default
+
+    def __setitem__(self, x, v):
+        self._set(x, v, False)
+
+    def add(self, x, v=1):
+        """self[x] += v, starting from 0"""
+        self._set(x, v, True)
+
+    def _set(self, x, v, add):
+        i = self._find(x)
+        if i >= 0:
+            self.V[i] = self.V[i] + v if add else v
+            return
+        i = ~i
+        K = self.K
+        j = i
+        while K[j] != self.EMPTY:
+            j += 1
+        if self.size + 1 > self.MAX_LOAD * self.cap or j == len(K) - 1:
+            self._grow()
+            return self._set(x, v, add)
+        # Shift the rest of the run one step right; for linear probing i == j
+        if j > i:
+            K[i + 1:j + 1] = K[i:j]
+            self.V[i + 1:j + 1] = self.V[i:j]
+        K[i], self.V[i] = x, v
+        self.size += 1
+
+    def _grow(self):
+        keys, vals = self.items()
+        keys, vals = keys.copy(), vals.copy()
+        self._alloc(2 * self.cap)
+        self._place_many(keys, vals)
+
+    def items(self):
+        """All keys and values, as numpy arrays"""
+        K = np.frombuffer(self.K, dtype=np.int64)
+        used = np.flatnonzero(K != self.EMPTY)
+        return K[used], np.frombuffer(self.V, dtype=self.dtype)[used]
+
+    def _find_many(self, q):
+        """Slots holding the keys q, -1 where absent"""
+        K = np.frombuffer(self.K, dtype=np.int64)
+        home = self._home_many(q)
+        pos = home.copy()
+        res = np.full(len(q), -1, dtype=np.int64)
+        act = np.arange(len(q))
+        while len(act):
+            p = pos[act]
+            k = K[p]
+            hit = k == q[act]
+            res[act[hit]] = p[hit]
+            stop = hit | (k == self.EMPTY)
+            if self.robin:
+                stop |= self._home_many(k) > home[act]
+            act = act[~stop]
+            pos[act] += 1
+        return res
+
+    def get_many(self, keys, default=0):
+        """Values of all keys, default where absent"""
+        q = np.asarray(keys, dtype=np.int64)
+        pos = self._find_many(q)
+        res = np.full(len(q), default, dtype=self.dtype)
+        f = pos >= 0
+        res[f] = np.frombuffer(self.V, dtype=self.dtype)[pos[f]]
+        return res
+
+    def insert_many(self, keys, vals, add=False):
+        """self[keys[i]] = vals[i] in order, or += with add=True"""
+        keys = np.asarray(keys, dtype=np.int64)
+        vals = np.asarray(vals, dtype=self.dtype) * np.ones(len(keys), dtype=self.dtype)
+        if add:
+            keys, inv = np.unique(keys, return_inverse=True)
+            v = np.zeros(len(keys), dtype=self.dtype)
+            np.add.at(v, inv, vals)
+            vals = v
+        else:
+            # The last assignment to a key wins
+            keys, idx = np.unique(keys[::-1], return_index=True)
+            vals = vals[::-1][idx]
+        pos = self._find_many(keys)
+        f = pos >= 0
+        V = np.frombuffer(self.V, dtype=self.dtype)
+        V[pos[f]] = V[pos[f]] + vals[f] if add else vals[f]
+        self._place_many(keys[~f], vals[~f])
+
+    def _place_many(self, k, v):
+        """Insert keys known to be absent and distinct"""
+        while self.size + len(k) > self.MAX_LOAD * self.cap:
+            self._grow()
+        k, v = k.copy(), v.copy()
+        K = np.frombuffer(self.K, dtype=np.int64)
+        V = np.frombuffer(self.V, dtype=self.dtype)
+        home = self._home_many(k)
+        pos = home.copy()
+        act = np.arange(len(k))
+        while len(act):
+            if (pos[act] == len(K) - 1).any():
+                # Ran into the guard slot: grow and insert what is left
+                left_k, left_v = k[act], v[act]
+                self._grow()
+                return self._place_many(left_k, left_v)
+            # One key per slot tries to claim it: the one farthest from home for Robin Hood
+            p = pos[act]
+            o = np.lexsort((home[act], p)) if self.robin else np.argsort(p, kind='stable')
+            first = np.ones(len(o), dtype=bool)
+            first[1:] = p[o[1:]] != p[o[:-1]]
+            w = act[o[first]]
+            pw = pos[w]
+            res = K[pw]
+            empty = res == self.EMPTY
+            K[pw[empty]], V[pw[empty]] = k[w[empty]], v[w[empty]]
+            self.size += int(empty.sum())
+            if self.robin:
+                # Evict residents closer to home; they continue probing in our place
+                sw = np.flatnonzero(~empty)
+                sw = sw[self._home_many(res[sw]) > home[w[sw]]]
+                ws, ps = w[sw], pw[sw]
+                rk, rv = K[ps], V[ps]
+                K[ps], V[ps] = k[ws], v[ws]
+                k[ws], v[ws], home[ws] = rk, rv, self._home_many(rk)
+            done = np.zeros(len(k), dtype=bool)
+            done[w[empty]] = True
+            act = act[~done[act]]
+            pos[act] += 1
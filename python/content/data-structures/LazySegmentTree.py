@@ -5,11 +5,19 @@
  * Source: me
  * Description: Segment tree with ability to add or set values of large intervals, and compute max of intervals.
  * Can be changed to other things.
+ * LazyTree(n, v) does the same without node objects or recursion: val/mset/madd are
+ * flat arrays indexed heap-style (children of k are 2k, 2k+1), built in O(N), and push
+ * and pull walk the two boundary paths iteratively. SparseLazyTree(lo, hi) is the
+ * dynamic version for huge ranges: nodes are created on push from a growable pool
+ * (32 bytes each), and the descent uses an explicit stack.
+ * Values must fit in 64 bits.
  * Time: O(log N).
  * Status: stress-tested a bit
 
 """
 
+from array import array
+
 INF = 10**9
 
 class Node:
@@ -80,3 +88,169 @@ class Node:
             self.l.add(self.lo, self.hi, self.madd)
             self.r.add(self.lo, self.hi, self.madd)
             self.madd = 0
+
+class LazyTree:
+    def __init__(self, n, v=None):
+        self.log = max(n - 1, 1).bit_length()
+        self.size = size = 1 << self.log
+        self.val = val = array('q', [-INF]) * (2 * size)
+        self.mset = array('q', [INF]) * (2 * size)
+        self.madd = array('q', [0]) * (2 * size)
+        if v is not None:
+            val[size:size + n] = array('q', v)
+            for k in range(size - 1, 0, -1):
+                val[k] = max(val[2 * k], val[2 * k + 1])
+
+    def _set(self, k, x):
+        self.val[k] = self.mset[k] = x
+        self.madd[k] = 0
+
+    def _add(self, k, x):
+        if self.mset[k] != INF:
+            self.mset[k] += x
+        else:
+            self.madd[k] += x
+        self.val[k] += x
+
+    def _push(self, k):
+        val, mset, madd = self.val, self.mset, self.madd
+        c = 2 * k
+        if mset[k] != INF:
+            val[c] = val[c + 1] = mset[c] = mset[c + 1] = mset[k]
+            madd[c] = madd[c + 1] = 0
+            mset[k] = INF
+        else:
+            x = madd[k]
+            for c in (c, c + 1):
+                val[c] += x
+                if mset[c] != INF:
+                    mset[c] += x
+                else:
+                    madd[c] += x
+            madd[k] = 0
+
+    def _push_bounds(self, L, R):
+        """Push all tags above the boundary leaves L and R-1"""
+        mset, madd = self.mset, self.madd
+        for i in range(self.log, 0, -1):
+            k = L >> i
+            if k << i != L and (madd[k] or mset[k] != INF):
+                self._push(k)
+            k = (R - 1) >> i
+            if (R >> i) << i != R and (madd[k] or mset[k] != INF):
+                self._push(k)
+
+    def _update(self, L, R, x, op):
+        if L >= R:
+            return
+        L += self.size
+        R += self.size
+        self._push_bounds(L, R)
+        l, r = L, R
+        while l < r:
+            if l & 1:
+                op(l, x)
+                l += 1
+            if r & 1:
+                r -= 1
+                op(r, x)
+            l >>= 1
+            r >>= 1
+        val = self.val
+        for i in range(1, self.log + 1):
+            if (L >> i) << i != L:
+                k = L >> i
+                val[k] = max(val[2 * k], val[2 * k + 1])
+            if (R >> i) << i != R:
+                k = (R - 1) >> i
+                val[k] = max(val[2 * k], val[2 * k + 1])
+
+    def query(self, L, R):
+        if L >= R:
+            return -INF
+        L += self.size
+        R += self.size
+        self._push_bounds(L, R)
+        val, res = self.val, -INF
+        while L < R:
+            if L & 1:
+                res = max(res, val[L])
+                L += 1
+            if R & 1:
+                R -= 1
+                res = max(res, val[R])
+            L >>= 1
+            R >>= 1
+        return res
+
+    def set(self, L, R, x):
+        self._update(L, R, x, self._set)
+
+    def add(self, L, R, x):
+        self._update(L, R, x, self._add)
+
+class SparseLazyTree(LazyTree):
+    def __init__(self, lo, hi):
+        self.lo, self.hi = lo, hi
+        # Node 0 is unused, node 1 is the root; l[k] == 0 until k is split
+        self.l = array('i', [0, 0])
+        self.r = array('i', [0, 0])
+        self.val = array('q', [-INF, -INF])
+        self.mset = array('q', [INF, INF])
+        self.madd = array('q', [0, 0])
+
+    def _split(self, k):
+        """Create the children of k, then push its tags to them"""
+        if not self.l[k]:
+            m = len(self.val)
+            self.l[k], self.r[k] = m, m + 1
+            for a, x in ((self.l, 0), (self.r, 0), (self.val, -INF),
+                         (self.mset, INF), (self.madd, 0)):
+                a.extend((x, x))
+        l, r = self.l[k], self.r[k]
+        if self.mset[k] != INF:
+            self._set(l, self.mset[k])
+            self._set(r, self.mset[k])
+            self.mset[k] = INF
+        elif self.madd[k]:
+            self._add(l, self.madd[k])
+            self._add(r, self.madd[k])
+            self.madd[k] = 0
+        return l, r
+
+    def _update(self, L, R, x, op):
+        stack = [(1, self.lo, self.hi)]
+        path = []
+        while stack:
+            k, lo, hi = stack.pop()
+            if R <= lo or hi <= L:
+                continue
+            if L <= lo and hi <= R:
+                op(k, x)
+                continue
+            l, r = self._split(k)
+            path.append(k)
+            mid = lo + (hi - lo) // 2
+            stack.append((l, lo, mid))
+            stack.append((r, mid, hi))
+        # Children come after their parents in path
+        val = self.val
+        for k in reversed(path):
+            val[k] = max(val[self.l[k]], val[self.r[k]])
+
+    def query(self, L, R):
+        stack = [(1, self.lo, self.hi)]
+        res = -INF
+        while stack:
+            k, lo, hi = stack.pop()
+            if R <= lo or hi <= L or self.val[k] <= res:
+                continue
+            if L <= lo and hi <= R or not self.l[k]:
+                # A node without children holds the same value everywhere
+                res = self.val[k]
+                continue
+            l, r = self._split(k)
+            mid = lo + (hi - lo) // 2
+            stack.append((l, lo, mid))
+            stack.append((r, mid, hi))
+        return res
@@ -5,12 +5,22 @@
  * Source: own work
  * Description: Container where you can add lines of the form kx+m, and query maximum values at points x.
  * Useful for dynamic programming ("convex hull trick").
+ * The breakpoints p increase along the hull, so a second SortedList ps holding the
+ * same values gives the index of a query's line by bisection.
+ * query_many(xs) walks the hull with one pointer if xs is sorted.
+ * LiChao is a Li Chao tree over a fixed set of points xs (e.g. all coordinates of an
+ * offline DP, or np.arange(lo, hi)); queries must be among them. Lines and values
+ * must fit in int64 (|kx+m| < 2^62). Its query_many answers a whole array at once,
+ * one vectorized step per tree level, and sorts unsorted input first for locality.
  * Time: O(log N)
  * Status: stress-tested
 
 """
 
 from sortedcontainers import SortedList
+from array import array
+from bisect import bisect_left
+import numpy as np
 
 class Line:
     def __init__(self, k, m, p=0):
@@ -26,71 +36,140 @@ class Line:
 class LineContainer:
     def __init__(self):
         self.lines = SortedList(key=lambda line: line.k)
+        # The breakpoints of all lines, in the same order as the lines
+        self.ps = SortedList()
         self.INF = float('inf')
 
+    def _setp(self, line, p):
+        self.ps.remove(line.p)
+        line.p = p
+        self.ps.add(p)
+
+    def _pop(self, idx):
+        self.ps.remove(self.lines.pop(idx).p)
+
     def div(self, a, b):
         """Floored division"""
-        return a // b - (1 if (a ^ b) < 0 and a % b else 0)
+        return a // b
 
     def isect(self, x_idx, y_idx):
         """Calculate intersection point of two lines"""
         if y_idx >= len(self.lines):
-            self.lines[x_idx].p = self.INF
+            self._setp(self.lines[x_idx], self.INF)
             return False
 
         x = self.lines[x_idx]
         y = self.lines[y_idx]
 
         if x.k == y.k:
-            x.p = self.INF if x.m > y.m else -self.INF
+            self._setp(x, self.INF if x.m > y.m else -self.INF)
         else:
-            x.p = self.div(y.m - x.m, x.k - y.k)
+            self._setp(x, self.div(y.m - x.m, x.k - y.k))
 
         return x.p >= y.p
 
     def add(self, k, m):
         """Add line y = kx + m"""
-        line = Line(k, m, 0)
-        idx = self.lines.bisect_left(line)
-        self.lines.add(line)
-
-        # idx now points to our newly inserted line
-        # Remove lines that are now irrelevant
-        y_idx = idx + 1
-        while y_idx < len(self.lines) and self.isect(idx, y_idx):
-            self.lines.pop(y_idx)
-
-        if idx > 0:
-            x_idx = idx - 1
-            if self.isect(x_idx, idx):
-                self.lines.pop(idx)
-                idx = x_idx
-
-        while idx > 0:
-            x_idx = idx - 1
-            if self.lines[x_idx].p >= self.lines[idx].p:
-                self.lines.pop(idx)
-                idx = x_idx
-                if idx < len(self.lines) - 1:
-                    self.isect(idx, idx + 1)
-            else:
-                break
-
-        # Recalculate intersections
-        if idx > 0:
-            self.isect(idx - 1, idx)
+        self.lines.add(Line(k, m, 0))
+        self.ps.add(0)
+        # SortedList inserts after lines of equal slope
+        y = self.lines.bisect_key_right(k) - 1
+
+        # Remove lines that are now irrelevant; isect past the end sets p = inf
+        while self.isect(y, y + 1):
+            self._pop(y + 1)
+        x = y
+        if x > 0:
+            x -= 1
+            if self.isect(x, y):
+                self._pop(y)
+                self.isect(x, x + 1)
+        while x > 0 and self.lines[x - 1].p >= self.lines[x].p:
+            self._pop(x)
+            x -= 1
+            self.isect(x, x + 1)
 
     def query(self, x):
         """Query maximum value at point x"""
         assert len(self.lines) > 0
-        # Binary search for the right line
-        idx = 0
-        for i, line in enumerate(self.lines):
-            if line.p >= x:
-                idx = i
-                break
-        else:
-            idx = len(self.lines) - 1
-
-        l = self.lines[idx]
+        # The last line has p = inf, so this always lands on a line
+        l = self.lines[self.ps.bisect_left(x)]
         return l.k * x + l.m
+
+    def query_many(self, xs):
+        """Maximum values at all points xs"""
+        assert len(self.lines) > 0
+        if any(a > b for a, b in zip(xs, xs[1:])):
+            return [self.query(x) for x in xs]
+        res, it = [], iter(self.lines)
+        l = next(it)
+        for x in xs:
+            while l.p < x:
+                l = next(it)
+            res.append(l.k * x + l.m)
+        return res
+
+class LiChao:
+    NONE = -(1 << 62)
+
+    def __init__(self, xs):
+        self.X = np.unique(np.asarray(xs, dtype=np.int64))
+        self.n = n = len(self.X)
+        if not n:
+            raise ValueError("LiChao needs at least one point")
+        self.size = size = 1 << max(n - 1, 0).bit_length()
+        # Points past the end repeat the last one, so every node has a valid midpoint
+        self.xs = self.X.tolist() + [self.X[-1].item()] * (size - n)
+        self.k = array('q', [0]) * (2 * size)
+        self.m = array('q', [self.NONE]) * (2 * size)
+
+    def add(self, k, m):
+        """Add line y = kx + m"""
+        K, M, X = self.k, self.m, self.xs
+        node, lo, hi = 1, 0, self.size
+        while True:
+            mid = (lo + hi) // 2
+            x0, x1 = X[lo], X[mid]
+            left = k * x0 + m > K[node] * x0 + M[node]
+            better = k * x1 + m > K[node] * x1 + M[node]
+            if better:
+                K[node], k = k, K[node]
+                M[node], m = m, M[node]
+            if hi - lo == 1:
+                return
+            if left != better:
+                node, hi = 2 * node, mid
+            else:
+                node, lo = 2 * node + 1, mid
+
+    def query(self, x):
+        """Query maximum value at point x, which must be one of xs"""
+        i = bisect_left(self.xs, x, 0, self.n)
+        assert i < self.n and self.xs[i] == x
+        node, res = i + self.size, self.NONE
+        while node:
+            res = max(res, self.k[node] * x + self.m[node])
+            node >>= 1
+        return res
+
+    def query_many(self, xs):
+        """Maximum values at all points xs, which must be among the xs of the tree"""
+        q = np.asarray(xs, dtype=np.int64)
+        order = None
+        if len(q) > 1 and (q[1:] < q[:-1]).any():
+            order = np.argsort(q, kind='stable')
+            q = q[order]
+        pos = np.searchsorted(self.X, q)
+        assert (pos < self.n).all() and (self.X[np.minimum(pos, self.n - 1)] == q).all()
+        K = np.frombuffer(self.k, dtype=np.int64)
+        M = np.frombuffer(self.m, dtype=np.int64)
+        node = pos + self.size
+        res = np.full(len(q), self.NONE, dtype=np.int64)
+        for _ in range(self.size.bit_length()):
+            np.maximum(res, K[node] * q + M[node], out=res)
+            node >>= 1
+        if order is not None:
+            out = np.empty_like(res)
+            out[order] = res
+            res = out
+        return res
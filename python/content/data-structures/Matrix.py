@@ -8,10 +8,20 @@
  *  A.d = [[1,2,3], [4,5,6], [7,8,9]]
  *  vec = [1,2,3]
  *  vec = (A ** N) * vec
+ * ModMatrix(d, mod) is the same over Z/mod for mod < 2^31, on int64 numpy arrays.
+ * mod_mul splits both factors into 16-bit limbs and multiplies them as float64 (BLAS),
+ * where every partial sum is an integer below 2^53 and so exact, for N <= 2^20.
+ * It broadcasts over stacks of matrices, which mod_pow_many uses to raise many
+ * matrices to (different) powers at once. pow_vec(p, v) caches A^(2^i) on the matrix
+ * for i below the bit length of the largest p used, and at most cache_bits of them
+ * (N^2 * 8 bytes each), so repeated calls only cost O(N^2 log p) for the products.
+ * Time: O(N^3 log p) for ** (BLAS speed), O(N^2 log p) for cached pow_vec
  * Status: tested
 
 """
 
+import numpy as np
+
 class Matrix:
     def __init__(self, n):
         self.n = n
@@ -52,3 +62,63 @@ class Matrix:
             base = base * base
             p >>= 1
         return result
+
+
+def mod_mul(A, B, mod):
+    """A @ B % mod for entries in [0, mod); stacks of matrices broadcast"""
+    a0, a1 = (A & 0xffff).astype(np.float64), (A >> 16).astype(np.float64)
+    b0, b1 = (B & 0xffff).astype(np.float64), (B >> 16).astype(np.float64)
+    lo = (a0 @ b0).astype(np.int64) % mod
+    mid = (a0 @ b1 + a1 @ b0).astype(np.int64) % mod
+    hi = (a1 @ b1).astype(np.int64) % mod
+    return (lo + (mid << 16) % mod + ((hi << 16) % mod << 16)) % mod
+
+def mod_pow_many(As, ps, mod):
+    """As[i] ** ps[i] % mod for a stack of square matrices"""
+    res = np.zeros_like(As)
+    res[:] = np.eye(As.shape[-1], dtype=np.int64) % mod
+    base = As % mod
+    ps = np.asarray(ps, dtype=np.uint64) * np.ones(len(As), dtype=np.uint64)
+    while ps.any():
+        odd = np.flatnonzero(ps & 1)
+        if len(odd):
+            res[odd] = mod_mul(res[odd], base[odd], mod)
+        ps >>= np.uint64(1)
+        act = np.flatnonzero(ps)
+        base[act] = mod_mul(base[act], base[act], mod)
+    return res
+
+class ModMatrix:
+    def __init__(self, d, mod, cache_bits=64):
+        self.mod = mod
+        self.cache_bits = cache_bits
+        self.d = np.asarray(d, dtype=np.int64) % mod
+        self.n = len(self.d)
+        self.sq = [self.d]
+
+    def __mul__(self, other):
+        if isinstance(other, ModMatrix):
+            return ModMatrix(mod_mul(self.d, other.d, self.mod), self.mod)
+        # Matrix-vector (or matrix times a stack of column vectors)
+        return mod_mul(self.d, np.asarray(other, dtype=np.int64) % self.mod, self.mod)
+
+    def __pow__(self, p):
+        assert p >= 0
+        return ModMatrix(mod_pow_many(self.d[None], [p], self.mod)[0], self.mod)
+
+    def pow_vec(self, p, v):
+        """A^p v, caching A^(2^i) for i < min(p.bit_length(), cache_bits)"""
+        assert p >= 0
+        v = np.asarray(v, dtype=np.int64) % self.mod
+        i, sq = 0, self.d
+        while p >> i:
+            if i < len(self.sq):
+                sq = self.sq[i]
+            elif i:
+                sq = mod_mul(sq, sq, self.mod)
+                if i < self.cache_bits:
+                    self.sq.append(sq)
+            if p >> i & 1:
+                v = mod_mul(sq, v, self.mod)
+            i += 1
+        return v
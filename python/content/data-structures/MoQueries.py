@@ -5,53 +5,130 @@
  * Source: https://github.com/hoke-t/tamu-kactl/blob/master/content/data-structures/MoQueries.h
  * Description: Answer interval or tree path queries by finding an approximate TSP through the queries,
  * and moving from one query to the next by adding/removing points at the ends.
- * Time: O(N sqrt Q)
+ * Queries are visited in Hilbert curve order of (L, R) by default, with all keys
+ * computed in one vectorized pass; order='block' gives the classic zigzag block order,
+ * with the block size N/sqrt(Q) chosen from the input. mo_updates handles point updates
+ * too: query (l, r, t) sees the first t updates, and the block size is about
+ * (N^2 T / Q)^(1/3), ordering by (l block, r block, t).
+ * Time: O(N sqrt Q), O(N^(2/3) Q^(1/3) T^(1/3) + N sqrt Q) with updates
  * Status: stress-tested
 
 """
 
+import numpy as np
+from math import isqrt
+
 # User must define these functions before calling mo():
 # def add(ind, end): pass  # add a[ind] (end = 0 or 1)
 # def del_elem(ind, end): pass  # remove a[ind]
 # def calc(): pass  # compute current answer
-
-def mo(Q, add_func, del_func, calc_func):
+# For mo_updates() also:
+# def upd(i, L, R): pass  # apply update i if it is not applied, else undo it; [L, R) is the current range
+
+def hilbert(x, y):
+    """Position of the points (x[i], y[i]) along a Hilbert curve covering them all"""
+    x = np.asarray(x, dtype=np.int64).copy()
+    y = np.asarray(y, dtype=np.int64).copy()
+    n = 1 << int(max(x.max(initial=0), y.max(initial=0))).bit_length()
+    d = np.zeros(len(x), dtype=np.int64)
+    s = n >> 1
+    while s:
+        rx, ry = (x & s) > 0, (y & s) > 0
+        d += s * s * ((3 * rx) ^ ry)
+        # Rotate the quadrant so the curve inside it starts at the origin
+        flip = rx & ~ry
+        x[flip], y[flip] = n - 1 - x[flip], n - 1 - y[flip]
+        x[~ry], y[~ry] = y[~ry], x[~ry]
+        s >>= 1
+    return d
+
+def mo_order(x, y, order='hilbert'):
+    """Order in which to visit the queries with ends x[i], y[i]"""
+    x = np.asarray(x, dtype=np.int64)
+    y = np.asarray(y, dtype=np.int64)
+    if order == 'hilbert':
+        return np.argsort(hilbert(x, y), kind='stable')
+    N = int(max(x.max(initial=0), y.max(initial=0))) + 1
+    blk = max(1, N // max(isqrt(len(x)), 1))
+    b = x // blk
+    return np.lexsort((np.where(b & 1, -y, y), b))
+
+def mo(Q, add_func, del_func, calc_func, order='hilbert'):
     """
     Q: list of (first, second) tuples representing queries
     Returns: list of answers for each query
     """
     L = 0
     R = 0
-    blk = 350  # ~N/sqrt(Q)
-    s = list(range(len(Q)))
     res = [0] * len(Q)
+    if not len(Q):
+        return res
+    q = np.asarray(Q, dtype=np.int64).reshape(-1, 2)
+    ql, qr = q[:, 0].tolist(), q[:, 1].tolist()
+
+    for qi in mo_order(q[:, 0], q[:, 1], order).tolist():
+        l, r = ql[qi], qr[qi]
+        while L > l:
+            L -= 1
+            add_func(L, 0)
+        while R < r:
+            add_func(R, 1)
+            R += 1
+        while L < l:
+            del_func(L, 0)
+            L += 1
+        while R > r:
+            R -= 1
+            del_func(R, 1)
+        res[qi] = calc_func()
 
-    def key(x):
-        q = Q[x]
-        return (q[0] // blk, q[1] ^ (-(q[0] // blk & 1)))
+    return res
 
-    s.sort(key=key)
 
-    for qi in s:
-        q = Q[qi]
-        while L > q[0]:
+def mo_updates(Q, T, add_func, del_func, upd_func, calc_func):
+    """
+    Q: list of (first, second, time) queries, time = number of updates applied
+    T: number of updates
+    Returns: list of answers for each query
+    """
+    L = R = t = 0
+    res = [0] * len(Q)
+    if not len(Q):
+        return res
+    q = np.asarray(Q, dtype=np.int64).reshape(-1, 3)
+    N = int(q[:, :2].max()) + 1
+    blk = max(1, round(max(N / len(q) ** 0.5, (N * N * max(T, 1) / len(q)) ** (1 / 3))))
+    bl, br = q[:, 0] // blk, q[:, 1] // blk
+    # Zigzag in R within an L block and in time within an (L, R) block pair
+    s = np.lexsort((np.where((bl + br) & 1, -q[:, 2], q[:, 2]), np.where(bl & 1, -br, br), bl))
+    ql, qr, qt = q[:, 0].tolist(), q[:, 1].tolist(), q[:, 2].tolist()
+
+    for qi in s.tolist():
+        l, r = ql[qi], qr[qi]
+        while L > l:
             L -= 1
             add_func(L, 0)
-        while R < q[1]:
+        while R < r:
             add_func(R, 1)
             R += 1
-        while L < q[0]:
+        while L < l:
             del_func(L, 0)
             L += 1
-        while R > q[1]:
+        while R > r:
             R -= 1
             del_func(R, 1)
+        while t < qt[qi]:
+            upd_func(t, L, R)
+            t += 1
+        while t > qt[qi]:
+            t -= 1
+            upd_func(t, L, R)
         res[qi] = calc_func()
 
     return res
 
 
-def mo_tree(Q, ed, add_func, del_func, calc_func, root=0):
+def mo_tree(Q, ed, add_func, del_func, calc_func, root=0, order='hilbert'):
     """
     Q: list of [a, b] queries on tree
     ed: adjacency list of tree
@@ -59,67 +136,74 @@ def mo_tree(Q, ed, add_func, del_func, calc_func, root=0):
     """
     N = len(ed)
     pos = [0, 0]
-    blk = 350  # ~N/sqrt(Q)
-    s = list(range(len(Q)))
     res = [0] * len(Q)
     I = [0] * N
     L_arr = [0] * N
     R_arr = [0] * N
     in_arr = [0] * N
     par = [0] * N
+    dep = [0] * N
 
     add_func(0, 0)
     in_arr[0] = 1
 
-    # DFS to compute I, L, R, par arrays
-    def dfs(x, p, dep):
-        nonlocal N
-        par[x] = p
-        L_arr[x] = N
-        if dep:
-            I[x] = N
-            N += 1
-        for y in ed[x]:
-            if y != p:
-                dfs(y, x, 1 - dep)
-        if not dep:
-            I[x] = N
-            N += 1
-        R_arr[x] = N
-
-    N_orig = N
-    N = 0
-    dfs(root, -1, 0)
-
-    def key(x):
-        return (I[Q[x][0]] // blk, I[Q[x][1]] ^ (-(I[Q[x][0]] // blk & 1)))
-
-    s.sort(key=key)
-
-    for qi in s:
+    # Iterative DFS to compute I, L, R, par arrays; ~x marks leaving x
+    t = 0
+    par[root] = -1
+    stack = [root]
+    while stack:
+        x = stack.pop()
+        if x < 0:
+            x = ~x
+            if not dep[x]:
+                I[x] = t
+                t += 1
+            R_arr[x] = t
+            continue
+        L_arr[x] = t
+        if dep[x]:
+            I[x] = t
+            t += 1
+        stack.append(~x)
+        for y in reversed(ed[x]):
+            if y != par[x]:
+                par[y] = x
+                dep[y] = 1 - dep[x]
+                stack.append(y)
+
+    if not len(Q):
+        return res
+    q = np.asarray(Q, dtype=np.int64).reshape(-1, 2)
+    Iq = np.asarray(I, dtype=np.int64)[q]
+    path = []
+
+    for qi in mo_order(Iq[:, 0], Iq[:, 1], order).tolist():
         for end in range(2):
             a = pos[end]
             b = Q[qi][end]
-            path = []
-            while not (L_arr[b] <= L_arr[a] <= R_arr[b]):
+            # Walk a up to the first ancestor of b, then down to b; a step to a node
+            # on the current path removes the node we leave, otherwise adds the new one
+            while not (L_arr[b] <= L_arr[a] and R_arr[a] <= R_arr[b]):
                 path.append(b)
                 b = par[b]
             while a != b:
-                if in_arr[a]:
+                c = par[a]
+                if in_arr[c]:
                     del_func(a, end)
                     in_arr[a] = 0
                 else:
-                    add_func(a, end)
-                    in_arr[a] = 1
-                a = par[a]
-            for i in reversed(path):
-                if in_arr[i]:
-                    del_func(i, end)
-                    in_arr[i] = 0
+                    add_func(c, end)
+                    in_arr[c] = 1
+                a = c
+            while path:
+                c = path.pop()
+                if in_arr[c]:
+                    del_func(a, end)
+                    in_arr[a] = 0
                 else:
-                    add_func(i, end)
-                    in_arr[i] = 1
-                a = i
+                    add_func(c, end)
+                    in_arr[c] = 1
+                a = c
             pos[end] = a
             if end:
                 res[qi] = calc_func()
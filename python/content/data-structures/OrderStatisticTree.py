@@ -5,22 +5,81 @@
  * Source: hacKIT, NWERC 2015
  * Description: A set (not multiset!) with support for finding the n'th
  * element, and finding the index of an element.
- * Time: O(log N)
+ * Given a universe bound U (elements in [0, U)), it uses FenwickSet instead of
+ * sortedcontainers: a bytearray of which elements are present and a Fenwick tree of
+ * the same 0/1 counts in an array('i'), about 5 bytes per possible element, built in
+ * O(U) from an initial array. find_by_order is the Fenwick lower_bound. Inserting
+ * (or bulk-loading) an element outside [0, U), or a non-integer, raises ValueError;
+ * queries take any real x (order_of_key(2.5) counts elements <= 2).
+ * Time: O(log N), O(log U) with a universe bound
 
 """
 
-from sortedcontainers import SortedSet
+import numpy as np
+from math import ceil
+from FenwickTree import FT
+
+class FenwickSet:
+    """The part of the SortedSet interface OrderStatisticTree needs, over [0, U)"""
+    def __init__(self, U, a=()):
+        a = np.asarray(a, dtype=np.int64)
+        if len(a) and (a.min() < 0 or a.max() >= U):
+            raise ValueError("element outside [0, U)")
+        cnt = np.zeros(U, dtype=np.int32)
+        cnt[a] = 1
+        self.has = bytearray(cnt.astype(np.uint8).tobytes())
+        self.n = int(cnt.sum())
+        self.ft = FT(U, cnt, 'i')
+
+    def _index(self, x):
+        """x as an index into has, or -1 if it is not an integer in [0, U)"""
+        return int(x) if 0 <= x < len(self.has) and x == int(x) else -1
+
+    def add(self, x):
+        i = self._index(x)
+        if i < 0:
+            raise ValueError(f"{x} is not an integer in [0, {len(self.has)})")
+        if not self.has[i]:
+            self.has[i] = 1
+            self.n += 1
+            self.ft.update(i, 1)
+
+    def discard(self, x):
+        x = self._index(x)
+        if x >= 0 and self.has[x]:
+            self.has[x] = 0
+            self.n -= 1
+            self.ft.update(x, -1)
+
+    def __getitem__(self, k):
+        return self.ft.lower_bound(k + 1)
+
+    def bisect_left(self, x):
+        return self.ft.query(min(max(ceil(x), 0), len(self.has)))
+
+    def __contains__(self, x):
+        x = self._index(x)
+        return x >= 0 and self.has[x] == 1
+
+    def __len__(self):
+        return self.n
 
 class OrderStatisticTree:
     """
-    A set with order statistics support using sortedcontainers.
+    A set with order statistics support using sortedcontainers,
+    or a FenwickSet if a universe bound is given.
     Provides O(log N) operations for:
     - insert/remove
     - find k-th element
     - count elements less than x
     """
-    def __init__(self):
-        self.tree = SortedSet()
+    def __init__(self, universe=None, a=()):
+        if universe is not None:
+            self.tree = FenwickSet(universe, a)
+        else:
+            # Imported here so bounded universes do not need sortedcontainers
+            from sortedcontainers import SortedSet
+            self.tree = SortedSet(a)
 
     def insert(self, x):
         """Insert element x"""
@@ -0,0 +1,97 @@
+"""
+ * Author: agent
+ * Date: 2026-10-18
+ * License: CC0
+ * Source: folklore (path copying)
+ * Description: Zero-indexed persistent sum-tree. update(root, pos, val) returns the root
+ * of a new version and leaves the old one intact, so any number of versions can be queried.
+ * Versions share nodes, which live in flat arrays (about 20 bytes per node) and are
+ * reference counted: release(root) frees a version's nodes that no other version uses,
+ * and they are reused by later updates. Bounds are inclusive to the left and exclusive
+ * to the right. Can be changed by modifying f and unit.
+ * Usage: t = PersistentTree(v); r1 = t.update(t.root, 3, 5);
+ *  t.query(r1, 0, 4); t.query(t.root, 0, 4); t.release(t.root)
+ * Time: O(N) to build, O(log N) per update, query and freed node. Memory O(log N) per version.
+ * Status: stress-tested
+
+"""
+
+from array import array
+
+class PersistentTree:
+    unit = 0
+
+    def f(self, a, b):
+        """Associative function - sum in this case"""
+        return a + b
+
+    def __init__(self, v):
+        self.log = max(len(v) - 1, 0).bit_length()
+        # Node 0 is a sentinel: leaves have l = r = 0
+        self.l = array('i', [0])
+        self.r = array('i', [0])
+        self.s = array('q', [0])
+        self.ref = array('i', [0])
+        self.free = array('i')
+        level = [self._new(x, 0, 0) for x in v]
+        level += [self._new(self.unit, 0, 0) for _ in range((1 << self.log) - len(v))]
+        while len(level) > 1:
+            level = [self._new(self.f(self.s[a], self.s[b]), a, b)
+                     for a, b in zip(level[0::2], level[1::2])]
+        self.root = level[0]
+
+    def _new(self, val, a, b):
+        """New node with children a, b, referenced once"""
+        if self.free:
+            k = self.free.pop()
+            self.l[k], self.r[k], self.s[k], self.ref[k] = a, b, val, 1
+            return k
+        self.l.append(a)
+        self.r.append(b)
+        self.s.append(val)
+        self.ref.append(1)
+        return len(self.s) - 1
+
+    def update(self, root, pos, val):
+        """Root of the version of root with position pos set to val"""
+        l, r, s, ref = self.l, self.r, self.s, self.ref
+        path = []
+        k = root
+        for i in range(self.log - 1, -1, -1):
+            path.append(k)
+            k = r[k] if pos >> i & 1 else l[k]
+        k = self._new(val, 0, 0)
+        for i in range(self.log):
+            p = path[-1 - i]
+            a, b = (l[p], k) if pos >> i & 1 else (k, r[p])
+            ref[a if b == k else b] += 1
+            k = self._new(self.f(s[a], s[b]), a, b)
+        return k
+
+    def query(self, root, b, e):
+        """Query [b, e) in the version of root"""
+        res = self.unit
+        stack = [(root, 0, 1 << self.log)]
+        while stack:
+            k, lo, hi = stack.pop()
+            if e <= lo or hi <= b:
+                continue
+            if b <= lo and hi <= e:
+                res = self.f(res, self.s[k])
+                continue
+            mid = (lo + hi) // 2
+            stack.append((self.r[k], mid, hi))
+            stack.append((self.l[k], lo, mid))
+        return res
+
+    def release(self, root):
+        """Drop the version of root; its nodes are reused once no version uses them"""
+        stack = [root]
+        while stack:
+            k = stack.pop()
+            self.ref[k] -= 1
+            if not self.ref[k]:
+                self.free.append(k)
+                if self.l[k]:
+                    stack.append(self.l[k])
+                    stack.append(self.r[k])
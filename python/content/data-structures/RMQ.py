@@ -5,27 +5,146 @@
  * Source: Folklore
  * Description: Range Minimum Queries on an array. Returns
  * min(V[a], V[a + 1], ... V[b - 1]) in constant time.
+ * op can also be 'max', or 'argmin'/'argmax' for the (leftmost) index of the extremum.
+ * query_many(a, b) answers arrays of queries at once.
+ * Numeric V is stored as a NumPy table; anything else (tuples, strings, other
+ * comparable objects) falls back to lists of Python values with the same interface.
+ * BlockRMQ (numbers only) has the same interface but O(N) memory (about 4 bytes per element plus a
+ * small table): a sparse table over blocks of 32, and within a block a bitmask per
+ * position of the minimum candidates to its left, whose lowest bit at or after a
+ * is the answer.
  * Usage:
  *  rmq = RMQ(values)
  *  rmq.query(inclusive, exclusive)
- * Time: O(|V| log |V| + Q)
+ * Time: O(|V| log |V| + Q), O(|V| + Q) for BlockRMQ
  * Status: stress-tested
 
 """
 
+import numpy as np
+
+def _log2(x):
+    """floor(log2(x)) elementwise, for 0 < x < 2^53"""
+    return np.frexp(np.asarray(x, dtype=np.float64))[1] - 1
+
 class RMQ:
-    def __init__(self, V):
-        self.jmp = [V[:]]
+    def __init__(self, V, op='min'):
+        self.op = op
+        try:
+            arr = np.asarray(V)
+        except ValueError:
+            arr = None
+        if arr is None or arr.ndim != 1 or arr.dtype.kind not in 'iufb':
+            self._init_generic(list(V), op)
+            return
+        self.V = V = arr
+        self.generic = False
+        n = len(V)
+        self.arg = op in ('argmin', 'argmax')
+        better = np.less if op in ('min', 'argmin') else np.greater
+        if self.arg:
+            row = np.arange(n, dtype=np.int32 if n < 1 << 31 else np.int64)
+            # Take the right index only if strictly better, so ties go to the leftmost
+            f = lambda a, b: np.where(better(V[b], V[a]), b, a)
+        else:
+            row = V
+            f = np.minimum if op == 'min' else np.maximum
+        K = max(n, 1).bit_length()
+        self.jmp = np.empty((K, n), dtype=row.dtype)
+        self.jmp[0] = row
+        for k in range(1, K):
+            pw, m = 1 << (k - 1), n - (1 << k) + 1
+            self.jmp[k, :m] = f(self.jmp[k - 1, :m], self.jmp[k - 1, pw:pw + m])
+        self.f = f
+
+    def _init_generic(self, V, op):
+        """Sparse table as lists, for values NumPy cannot compare"""
+        self.V, self.generic = V, True
+        self.arg = op in ('argmin', 'argmax')
+        if op == 'argmin':
+            self.f = lambda a, b: b if V[b] < V[a] else a
+        elif op == 'argmax':
+            self.f = lambda a, b: b if V[b] > V[a] else a
+        else:
+            self.f = min if op == 'min' else max
+        self.jmp = [list(range(len(V))) if self.arg else V[:]]
         pw = 1
-        k = 1
         while pw * 2 <= len(V):
-            self.jmp.append([0] * (len(V) - pw * 2 + 1))
-            for j in range(len(self.jmp[k])):
-                self.jmp[k][j] = min(self.jmp[k - 1][j], self.jmp[k - 1][j + pw])
+            prev = self.jmp[-1]
+            self.jmp.append([self.f(prev[j], prev[j + pw]) for j in range(len(V) - pw * 2 + 1)])
             pw *= 2
-            k += 1
 
     def query(self, a, b):
         assert a < b
         dep = (b - a).bit_length() - 1
-        return min(self.jmp[dep][a], self.jmp[dep][b - (1 << dep)])
+        return self.f(self.jmp[dep][a], self.jmp[dep][b - (1 << dep)])
+
+    def query_many(self, a, b):
+        """Answers to all queries [a[i], b[i]), which must be nonempty"""
+        if self.generic:
+            return [self.query(x, y) for x, y in zip(a, b)]
+        a = np.asarray(a, dtype=np.int64)
+        b = np.asarray(b, dtype=np.int64)
+        dep = _log2(b - a)
+        return self.f(self.jmp[dep, a], self.jmp[dep, b - (1 << dep)])
+
+class BlockRMQ:
+    B = 32
+
+    def __init__(self, V, op='min'):
+        self.V = V = np.asarray(V)
+        self.op = op
+        n, B = len(V), self.B
+        self.better = better = np.less if op in ('min', 'argmin') else np.greater
+        nb = (n + B - 1) // B
+        pad = np.resize(V, nb * B)
+        pad[n:] = V[n - 1] if n else 0
+        blk = pad.reshape(nb, B)
+
+        # mask[i] has bit j set if V[j] beats or ties everything in (j, i], same block
+        self.mask = mask = np.empty((nb, B), dtype=np.uint32)
+        cur = np.zeros(nb, dtype=np.uint32)
+        rows = np.arange(nb)
+        for t in range(B):
+            act = rows[cur != 0]
+            while len(act):
+                top = _log2(cur[act])
+                pop = better(blk[act, t], blk[act, top])
+                act, top = act[pop], top[pop]
+                cur[act] ^= (np.uint32(1) << top.astype(np.uint32))
+                act = act[cur[act] != 0]
+            cur |= np.uint32(1 << t)
+            mask[:, t] = cur
+        self.mask = mask.ravel()
+
+        # Index of the best element of each block, and a sparse table over blocks
+        self.barg = np.arange(nb) * B + self._inblock(np.arange(nb) * B, np.arange(nb) * B + B - 1)
+        self.table = RMQ(pad[self.barg], 'argmin' if better is np.less else 'argmax')
+
+    def _inblock(self, l, r):
+        """Offset from the block start of the best element in [l, r], same block"""
+        m = self.mask[r] >> (l % self.B).astype(np.uint32)
+        low = m & (~m + np.uint32(1))
+        return _log2(low) + l % self.B
+
+    def query_many(self, a, b):
+        """Answers to all queries [a[i], b[i]), which must be nonempty"""
+        V, B = self.V, self.B
+        l = np.asarray(a, dtype=np.int64)
+        r = np.asarray(b, dtype=np.int64) - 1
+        lb, rb = l // B, r // B
+        # Combine left part, whole blocks and right part, in order, so ties go left
+        res = l - l % B + self._inblock(l, np.where(lb == rb, r, lb * B + B - 1))
+        mid = np.flatnonzero(lb + 1 < rb)
+        if len(mid):
+            cand = self.barg[self.table.query_many(lb[mid] + 1, rb[mid])]
+            take = self.better(V[cand], V[res[mid]])
+            res[mid[take]] = cand[take]
+        cand = rb * B + self._inblock(rb * B, r)
+        take = (lb < rb) & self.better(V[cand], V[res])
+        res[take] = cand[take]
+        return res if self.op in ('argmin', 'argmax') else V[res]
+
+    def query(self, a, b):
+        assert a < b
+        return self.query_many([a], [b])[0]
@@ -5,11 +5,17 @@
  * Source: folklore
  * Description: Zero-indexed max-tree. Bounds are inclusive to the left and exclusive to the right.
  * Can be changed by modifying T, f and unit.
+ * MonoidTree(a, op) is built bottom-up in O(N) from a list or NumPy array, for op one of
+ * 'sum', 'min', 'max', 'gcd', 'xor' (stored in a NumPy array; query_many/update_many
+ * then handle whole batches with one vectorized step per tree level), or for op an
+ * associative function with identity unit (stored in a list).
  * Time: O(log N)
  * Status: stress-tested
 
 """
 
+import numpy as np
+
 class Tree:
     def __init__(self, n=0, def_val=None):
         self.n = n
@@ -45,3 +51,100 @@ class Tree:
             b //= 2
             e //= 2
         return self.f(ra, rb)
+
+MONOIDS = {'sum': np.add, 'min': np.minimum, 'max': np.maximum,
+           'gcd': np.gcd, 'xor': np.bitwise_xor}
+
+class MonoidTree:
+    def __init__(self, a, op='max', unit=None):
+        n = self.n = len(a)
+        if op in MONOIDS:
+            a = np.asarray(a)
+            f = self.f = MONOIDS[op]
+            if a.dtype.kind == 'f':
+                lo, hi = -np.inf, np.inf
+            else:
+                lo, hi = np.iinfo(a.dtype).min, np.iinfo(a.dtype).max
+            unit = {'min': hi, 'max': lo}.get(op, 0)
+            self.unit = a.dtype.type(unit)
+            self.s = s = np.full(2 * n, self.unit, dtype=a.dtype)
+            s[n:] = a
+            # Nodes [lo, hi) only have children in [hi, 2 hi)
+            hi = n
+            while hi > 1:
+                lo = (hi + 1) // 2
+                s[lo:hi] = f(s[2 * lo:2 * hi:2], s[2 * lo + 1:2 * hi:2])
+                hi = lo
+            self.vec = True
+        else:
+            self.f, self.unit, self.vec = op, unit, False
+            self.s = s = [unit] * n + list(a)
+            for i in range(n - 1, 0, -1):
+                s[i] = op(s[2 * i], s[2 * i + 1])
+
+    def update(self, pos, val):
+        s, f = self.s, self.f
+        pos += self.n
+        s[pos] = val
+        while pos > 1:
+            pos //= 2
+            s[pos] = f(s[pos * 2], s[pos * 2 + 1])
+
+    def query(self, b, e):
+        """Query [b, e)"""
+        s, f = self.s, self.f
+        ra = rb = self.unit
+        b += self.n
+        e += self.n
+        while b < e:
+            if b % 2:
+                ra = f(ra, s[b])
+                b += 1
+            if e % 2:
+                e -= 1
+                rb = f(s[e], rb)
+            b //= 2
+            e //= 2
+        return f(ra, rb)
+
+    def update_many(self, idx, vals):
+        """Set a[idx[i]] = vals[i] for all i, in order"""
+        if not self.vec:
+            for i, v in zip(idx, vals):
+                self.update(i, v)
+            return
+        s, f = self.s, self.f
+        p = np.asarray(idx, dtype=np.int64) + self.n
+        s[p] = vals
+        p = np.unique(p >> 1)
+        p = p[p > 0]
+        while len(p):
+            # Leaves differ in depth by one, so recompute the deepest nodes first
+            top = p >= 1 << (int(p[-1]).bit_length() - 1)
+            q = p[top]
+            s[q] = f(s[2 * q], s[2 * q + 1])
+            p = np.unique(np.concatenate((p[~top], q >> 1)))
+            p = p[p > 0]
+
+    def query_many(self, ls, rs):
+        """Answers to all queries [ls[i], rs[i])"""
+        if not self.vec:
+            return [self.query(b, e) for b, e in zip(ls, rs)]
+        s, f = self.s, self.f
+        b = np.asarray(ls, dtype=np.int64) + self.n
+        e = np.asarray(rs, dtype=np.int64) + self.n
+        ra = np.full(len(b), self.unit, dtype=s.dtype)
+        rb = ra.copy()
+        while True:
+            act = b < e
+            if not act.any():
+                break
+            m = act & (b % 2 == 1)
+            ra[m] = f(ra[m], s[b[m]])
+            b[m] += 1
+            m = act & (e % 2 == 1)
+            e[m] -= 1
+            rb[m] = f(s[e[m]], rb[m])
+            b //= 2
+            e //= 2
+        return f(ra, rb)
@@ -5,12 +5,17 @@
  * Description: A short self-balancing tree. It acts as a
  * sequential container with log-time splits/joins, and
  * is easy to augment with additional data.
+ * ArrayTreap is the same as a class over parallel arrays (node 0 is null), with a
+ * free list, iterative split/merge/traversal, an O(N) Cartesian-tree build, and lazy
+ * range reverse and range add. Nodes are ints, values are 64-bit ints; methods that
+ * change the tree return the new root.
  * Time: O(log N)
  * Status: stress-tested
 
 """
 
 import random
+from array import array
 
 class Node:
     def __init__(self, val):
@@ -76,3 +81,189 @@ def move(t, l, r, k):
         return merge(ins(a, b, k), c)
     else:
         return merge(a, ins(c, b, k - r))
+
+class ArrayTreap:
+    def __init__(self):
+        self.l = array('i', [0])
+        self.r = array('i', [0])
+        self.y = array('q', [0])
+        self.c = array('i', [0])
+        self.val = array('q', [0])
+        self.lz = array('q', [0])
+        self.rev = bytearray(1)
+        self.free_list = array('i')
+
+    def new(self, val):
+        """A new single-node tree"""
+        if self.free_list:
+            n = self.free_list.pop()
+            self.l[n] = self.r[n] = self.lz[n] = self.rev[n] = 0
+            self.y[n], self.c[n], self.val[n] = random.getrandbits(62), 1, val
+            return n
+        for a, x in ((self.l, 0), (self.r, 0), (self.y, random.getrandbits(62)),
+                     (self.c, 1), (self.val, val), (self.lz, 0)):
+            a.append(x)
+        self.rev.append(0)
+        return len(self.c) - 1
+
+    def cnt(self, n):
+        return self.c[n]
+
+    def _recalc(self, n):
+        self.c[n] = self.c[self.l[n]] + self.c[self.r[n]] + 1
+
+    def _push(self, n):
+        l, r = self.l, self.r
+        for ch in (l[n], r[n]):
+            if ch:
+                if self.rev[n]:
+                    l[ch], r[ch] = r[ch], l[ch]
+                    self.rev[ch] ^= 1
+                if self.lz[n]:
+                    self.val[ch] += self.lz[n]
+                    self.lz[ch] += self.lz[n]
+        self.rev[n] = 0
+        self.lz[n] = 0
+
+    def build(self, vals):
+        """Tree of the values in order, in O(N)"""
+        nodes = [self.new(v) for v in vals]
+        y, l, r = self.y, self.l, self.r
+        stack = []
+        for n in nodes:
+            last = 0
+            while stack and y[stack[-1]] < y[n]:
+                last = stack.pop()
+            l[n] = last
+            if stack:
+                r[stack[-1]] = n
+            stack.append(n)
+        root = stack[0] if stack else 0
+        for n in reversed(self._order(root)):
+            self._recalc(n)
+        return root
+
+    def _order(self, t):
+        """Nodes of t in preorder, without pushing"""
+        res, stack = [], [t] if t else []
+        while stack:
+            n = stack.pop()
+            res.append(n)
+            if self.r[n]:
+                stack.append(self.r[n])
+            if self.l[n]:
+                stack.append(self.l[n])
+        return res
+
+    def split(self, t, k):
+        """Split tree into two: first k elements and the rest"""
+        l, r, c = self.l, self.r, self.c
+        L = R = lh = rh = 0
+        path = []
+        while t:
+            self._push(t)
+            path.append(t)
+            if c[l[t]] >= k:
+                if rh:
+                    l[rh] = t
+                else:
+                    R = t
+                rh, t = t, l[t]
+            else:
+                k -= c[l[t]] + 1
+                if lh:
+                    r[lh] = t
+                else:
+                    L = t
+                lh, t = t, r[t]
+        if lh:
+            r[lh] = 0
+        if rh:
+            l[rh] = 0
+        for n in reversed(path):
+            self._recalc(n)
+        return L, R
+
+    def merge(self, a, b):
+        """Merge two trees"""
+        l, r, y = self.l, self.r, self.y
+        root = par = 0
+        right = False
+        path = []
+        while a and b:
+            if y[a] > y[b]:
+                n, nxt = a, True
+                self._push(n)
+                a = r[n]
+            else:
+                n, nxt = b, False
+                self._push(n)
+                b = l[n]
+            if not par:
+                root = n
+            elif right:
+                r[par] = n
+            else:
+                l[par] = n
+            path.append(n)
+            par, right = n, nxt
+        rest = a or b
+        if not par:
+            return rest
+        if right:
+            r[par] = rest
+        else:
+            l[par] = rest
+        for n in reversed(path):
+            self._recalc(n)
+        return root
+
+    def ins(self, t, pos, val):
+        """Insert val at position pos"""
+        a, b = self.split(t, pos)
+        return self.merge(self.merge(a, self.new(val)), b)
+
+    def erase(self, t, pos):
+        """Remove the element at position pos"""
+        a, b = self.split(t, pos)
+        m, b = self.split(b, 1)
+        self.free(m)
+        return self.merge(a, b)
+
+    def free(self, t):
+        """Return all nodes of t to the free list"""
+        self.free_list.extend(self._order(t))
+
+    def _range(self, t, lo, hi, f):
+        a, b = self.split(t, lo)
+        b, c = self.split(b, hi - lo)
+        if b:
+            f(b)
+        return self.merge(self.merge(a, b), c)
+
+    def reverse(self, t, lo, hi):
+        """Reverse the range [lo, hi)"""
+        def f(n):
+            self.l[n], self.r[n] = self.r[n], self.l[n]
+            self.rev[n] ^= 1
+        return self._range(t, lo, hi, f)
+
+    def add(self, t, lo, hi, x):
+        """Add x to every value in [lo, hi)"""
+        def f(n):
+            self.val[n] += x
+            self.lz[n] += x
+        return self._range(t, lo, hi, f)
+
+    def values(self, t):
+        """All values in order"""
+        res, stack = [], []
+        while stack or t:
+            while t:
+                self._push(t)
+                stack.append(t)
+                t = self.l[t]
+            t = stack.pop()
+            res.append(self.val[t])
+            t = self.r[t]
+        return res
@@ -4,13 +4,22 @@
  * License: CC0
  * Source: folklore
  * Description: Disjoint-set data structure.
+ * e is an array('i') (negative size for roots, else the parent) and find uses
+ * iterative path halving, so there is no recursion. join_many(a, b) joins a whole
+ * edge list in order (e.g. for Kruskal), in chunks of doubling size: edges whose ends are
+ * already connected are dropped by one vectorized find_many per chunk. find_many(xs)
+ * moves all unfinished queries up one parent per step in lockstep, then points them
+ * at their roots; labels() gives the root of every node by pointer jumping.
  * Time: O(alpha(N))
 
 """
 
+import numpy as np
+from array import array
+
 class UF:
     def __init__(self, n):
-        self.e = [-1] * n
+        self.e = array('i', [-1]) * n
 
     def same_set(self, a, b):
         return self.find(a) == self.find(b)
@@ -19,10 +28,12 @@ class UF:
         return -self.e[self.find(x)]
 
     def find(self, x):
-        if self.e[x] < 0:
-            return x
-        self.e[x] = self.find(self.e[x])
-        return self.e[x]
+        e = self.e
+        while e[x] >= 0:
+            if e[e[x]] >= 0:
+                e[x] = e[e[x]]
+            x = e[x]
+        return x
 
     def join(self, a, b):
         a = self.find(a)
@@ -34,3 +45,55 @@ class UF:
         self.e[a] += self.e[b]
         self.e[b] = a
         return True
+
+    def join_many(self, a, b):
+        """Join a[i] and b[i] for all i in order; returns which joins merged two sets"""
+        a = np.asarray(a, dtype=np.int64)
+        b = np.asarray(b, dtype=np.int64)
+        e = self.e
+        res = bytearray(len(a))
+        lo, size = 0, 1024
+        while lo < len(a):
+            # Edges within a set already are dropped in bulk, the rest are joined one by one
+            hi = min(lo + size, len(a))
+            ra, rb = self.find_many(a[lo:hi]), self.find_many(b[lo:hi])
+            idx = np.flatnonzero(ra != rb)
+            for i, x, y in zip((idx + lo).tolist(), ra[idx].tolist(), rb[idx].tolist()):
+                while e[x] >= 0:
+                    x = e[x]
+                while e[y] >= 0:
+                    y = e[y]
+                if x != y:
+                    if e[x] > e[y]:
+                        x, y = y, x
+                    e[x] += e[y]
+                    e[y] = x
+                    res[i] = 1
+            lo, size = hi, 2 * size
+        return np.frombuffer(res, dtype=bool)
+
+    def find_many(self, xs):
+        """Roots of all xs, compressing their paths"""
+        e = np.frombuffer(self.e, dtype=np.int32)
+        xs = np.asarray(xs, dtype=np.int64)
+        r = xs.copy()
+        act = np.flatnonzero(e[r] >= 0)
+        while len(act):
+            r[act] = e[r[act]]
+            act = act[e[r[act]] >= 0]
+        m = r != xs
+        e[xs[m]] = r[m]
+        return r
+
+    def labels(self):
+        """Root of every node, compressing all paths"""
+        e = np.frombuffer(self.e, dtype=np.int32)
+        par = np.where(e < 0, np.arange(len(e), dtype=np.int32), e)
+        while True:
+            nxt = par[par]
+            if (nxt == par).all():
+                break
+            par = nxt
+        roots = e < 0
+        e[~roots] = par[~roots]
+        return par
@@ -20,7 +20,9 @@ class RollbackUF:
         return -self.e[self.find(x)]
 
     def find(self, x):
-        return x if self.e[x] < 0 else self.find(self.e[x])
+        while self.e[x] >= 0:
+            x = self.e[x]
+        return x
 
     def time(self):
         return len(self.st)
@@ -28,7 +30,7 @@ class RollbackUF:
     def rollback(self, t):
         for i in range(len(self.st) - 1, t - 1, -1):
             self.e[self.st[i][0]] = self.st[i][1]
-        self.st = self.st[:t]
+        del self.st[t:]
 
     def join(self, a, b):
         a = self.find(a)
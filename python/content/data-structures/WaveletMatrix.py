@@ -0,0 +1,152 @@
+"""
+ * Author: agent
+ * Date: 2026-10-18
+ * License: CC0
+ * Source: "The Wavelet Matrix", SPIRE 2012
+ * Description: Static range statistics on an integer array: k-th smallest value in
+ * a[l:r], number of values < x in a[l:r], and number of values in [lo, hi) in a[l:r];
+ * select(x, k) is the position of the k-th occurrence (0-indexed) of x, or -1.
+ * Values are compressed to codes 0..sigma-1 first. Level i stably moves the elements
+ * whose code has bit (L-1-i) clear to the front; each level is a bit vector packed into
+ * uint64 words with the number of ones before every word, so rank is one popcount and
+ * select a binary search plus a byte table (popcounts use a byte table too, so
+ * NumPy 1.x works). All queries come in _many versions taking
+ * arrays, doing one vectorized step per level for all queries at once.
+ * Usage: wm = WaveletMatrix([3, 1, 4, 1, 5])
+ *  wm.kth(1, 4, 0) == 1; wm.count_less(0, 5, 4) == 3; wm.count(0, 5, 1, 2) == 2
+ * Time: O(N log sigma) build, O(log sigma) per query
+ * Status: stress-tested
+
+"""
+
+import numpy as np
+
+# _SEL[b, r] is the position of the r-th set bit of byte b, _POP[b] its number of set bits
+_SEL = np.zeros((256, 8), dtype=np.int64)
+_POP = np.zeros(256, dtype=np.int64)
+for _b in range(256):
+    _ones = [j for j in range(8) if _b >> j & 1]
+    _SEL[_b, :len(_ones)] = _ones
+    _POP[_b] = len(_ones)
+
+def _popcount(x):
+    """Set bits of each entry of a uint64 array"""
+    x = np.ascontiguousarray(x, dtype=np.uint64)
+    return _POP[x.view(np.uint8)].reshape(x.shape + (8,)).sum(axis=-1)
+
+class WaveletMatrix:
+    def __init__(self, a):
+        self.vals, code = np.unique(np.asarray(a, dtype=np.int64), return_inverse=True)
+        self.n = n = len(code)
+        self.L = L = max(1, (len(self.vals) - 1).bit_length())
+        nw = n // 64 + 1
+        self.words = np.zeros((L, nw), dtype=np.uint64)
+        self.cum = np.zeros((L, nw + 1), dtype=np.int64)
+        self.Z = np.zeros(L, dtype=np.int64)
+        code = code.ravel()
+        for i in range(L):
+            bit = (code >> (L - 1 - i)) & 1
+            packed = np.packbits(bit.astype(np.uint8), bitorder='little')
+            buf = np.zeros(nw * 8, dtype=np.uint8)
+            buf[:len(packed)] = packed
+            self.words[i] = buf.view(np.uint64)
+            self.cum[i, 1:] = np.cumsum(_popcount(self.words[i]))
+            self.Z[i] = n - int(bit.sum())
+            code = np.concatenate((code[bit == 0], code[bit == 1]))
+
+    def _rank1(self, i, p):
+        """Ones before position p (array) at level i"""
+        w = p >> 6
+        mask = (np.uint64(1) << (p & 63).astype(np.uint64)) - np.uint64(1)
+        return self.cum[i, w] + _popcount(self.words[i, w] & mask)
+
+    def _select(self, i, k, one):
+        """Position of the k-th (0-indexed, array) one or zero at level i"""
+        cum = self.cum[i] if one else 64 * np.arange(len(self.cum[i])) - self.cum[i]
+        w = np.searchsorted(cum, k, side='right') - 1
+        r = k - cum[w]
+        word = self.words[i, w] if one else ~self.words[i, w]
+        by = (word[:, None] >> (8 * np.arange(8, dtype=np.uint64))) & np.uint64(255)
+        cs = np.cumsum(_POP[by.astype(np.int64)], axis=1)
+        j = (cs <= r[:, None]).sum(axis=1)
+        r -= np.where(j > 0, cs[np.arange(len(j)), np.maximum(j - 1, 0)], 0)
+        return 64 * w + 8 * j + _SEL[by[np.arange(len(j)), j].astype(np.int64), r]
+
+    def _args(self, *xs):
+        return np.broadcast_arrays(*(np.asarray(x, dtype=np.int64) for x in xs))
+
+    def kth_many(self, l, r, k):
+        """k[j]-th smallest (0-indexed) of a[l[j]:r[j]], with k[j] < r[j] - l[j]"""
+        l, r, k = (x.copy() for x in self._args(l, r, k))
+        code = np.zeros(len(l), dtype=np.int64)
+        for i in range(self.L):
+            ol, orr = self._rank1(i, l), self._rank1(i, r)
+            z = (r - l) - (orr - ol)
+            go = k >= z
+            k -= np.where(go, z, 0)
+            code = code * 2 + go
+            l = np.where(go, self.Z[i] + ol, l - ol)
+            r = np.where(go, self.Z[i] + orr, r - orr)
+        return self.vals[code]
+
+    def _less(self, l, r, c):
+        """Number of codes < c[j] in a[l[j]:r[j]]"""
+        l, r = l.copy(), r.copy()
+        res = np.where(c >> self.L > 0, r - l, 0)
+        for i in range(self.L):
+            ol, orr = self._rank1(i, l), self._rank1(i, r)
+            go = (c >> (self.L - 1 - i)) & 1 == 1
+            res += np.where(go, (r - l) - (orr - ol), 0)
+            l = np.where(go, self.Z[i] + ol, l - ol)
+            r = np.where(go, self.Z[i] + orr, r - orr)
+        return res
+
+    def count_less_many(self, l, r, x):
+        """Number of values < x[j] in a[l[j]:r[j]]"""
+        l, r, x = self._args(l, r, x)
+        return self._less(l, r, np.searchsorted(self.vals, x))
+
+    def count_many(self, l, r, lo, hi):
+        """Number of values in [lo[j], hi[j]) in a[l[j]:r[j]]"""
+        l, r, lo, hi = self._args(l, r, lo, hi)
+        res = self._less(l, r, np.searchsorted(self.vals, hi)) - self._less(l, r, np.searchsorted(self.vals, lo))
+        return np.maximum(res, 0)
+
+    def select_many(self, x, k):
+        """Position of the k[j]-th (0-indexed) occurrence of x[j], -1 if none"""
+        x, k = self._args(x, k)
+        c = np.minimum(np.searchsorted(self.vals, x), len(self.vals) - 1)
+        ok = (self.vals[c] == x) & (k >= 0) if self.n else np.zeros(len(x), dtype=bool)
+        # Start and end of the code's block at the bottom level
+        b, e = np.zeros(len(x), dtype=np.int64), np.full(len(x), self.n, dtype=np.int64)
+        for i in range(self.L):
+            go = (c >> (self.L - 1 - i)) & 1 == 1
+            ob, oe = self._rank1(i, b), self._rank1(i, e)
+            b = np.where(go, self.Z[i] + ob, b - ob)
+            e = np.where(go, self.Z[i] + oe, e - oe)
+        ok &= k < e - b
+        act = np.flatnonzero(ok)
+        p = (b + k)[act]
+        for i in reversed(range(self.L)):
+            go = (c[act] >> (self.L - 1 - i)) & 1 == 1
+            res = np.empty(len(act), dtype=np.int64)
+            g = np.flatnonzero(go)
+            res[g] = self._select(i, p[g] - self.Z[i], True)
+            g = np.flatnonzero(~go)
+            res[g] = self._select(i, p[g], False)
+            p = res
+        out = np.full(len(x), -1, dtype=np.int64)
+        out[act] = p
+        return out
+
+    def kth(self, l, r, k):
+        return self.kth_many([l], [r], [k])[0].item()
+
+    def count_less(self, l, r, x):
+        return self.count_less_many([l], [r], [x])[0].item()
+
+    def count(self, l, r, lo, hi):
+        return self.count_many([l], [r], [lo], [hi])[0].item()
+
+    def select(self, x, k):
+        return self.select_many([x], [k])[0].item()
@@ -15,44 +15,86 @@
  *     ed[b].append((a, eid))
  *     eid += 1
  * bicomps(lambda edgelist: ...)
+ * For big graphs, comp, ncomps = bicomp_ids(N, ea, eb) takes the edges (ea[i], eb[i])
+ * and returns comp[i], the component of edge i or -1 for a bridge, as an array('i').
+ * The DFS uses an explicit stack, so no recursion limit is needed.
  * Time: O(E + V)
  * Status: tested during MIPT ICPC Workshop 2017
 
 """
 
-num = []
-st = []
-ed = []
-Time = 0
+from array import array
+from SCC import csr
 
-def dfs(at, par, f):
-    """DFS to find biconnected components"""
-    global Time, num, st
+ed = []
 
-    me = Time
-    num[at] = Time
-    Time += 1
-    top = me
+def _bicomps(n, start, adj, eid, m):
+    """Component id of each of the m edges (-1 for bridges) of a CSR graph whose
+    arc p goes to adj[p] along edge eid[p], and the number of components"""
+    num = array('i', [-1]) * n
+    top = array('i', [0]) * n
+    pe = array('i', [-1]) * n
+    si = array('i', [0]) * n
+    ptr = start[:n]
+    comp = array('i', [-1]) * m
+    st = array('i')
+    Time = nc = 0
 
-    for y, e in ed[at]:
-        if e != par:
-            if num[y] is not None:
-                top = min(top, num[y])
-                if num[y] < me:
-                    st.append(e)
+    for r in range(n):
+        if num[r] >= 0:
+            continue
+        num[r] = top[r] = Time
+        Time += 1
+        cs = [r]
+        while cs:
+            at = cs[-1]
+            p, end, me = ptr[at], start[at + 1], num[at]
+            while p < end:
+                y, e = adj[p], eid[p]
+                p += 1
+                if e != pe[at]:
+                    if num[y] < 0:
+                        break
+                    if num[y] < top[at]:
+                        top[at] = num[y]
+                    if num[y] < me:
+                        st.append(e)
             else:
-                si = len(st)
-                up = dfs(y, e, f)
-                top = min(top, up)
-                if up == me:
-                    st.append(e)
-                    f(st[si:])
-                    del st[si:]
-                elif up < me:
-                    st.append(e)
-                # else: e is a bridge
+                # All edges of at are done, return to its parent
+                ptr[at] = p
+                cs.pop()
+                if cs:
+                    par, up = cs[-1], top[at]
+                    if up < top[par]:
+                        top[par] = up
+                    if up == num[par]:
+                        st.append(pe[at])
+                        for x in st[si[at]:]:
+                            comp[x] = nc
+                        del st[si[at]:]
+                        nc += 1
+                    elif up < num[par]:
+                        st.append(pe[at])
+                    # else: pe[at] is a bridge
+                continue
+            ptr[at] = p
+            num[y] = top[y] = Time
+            Time += 1
+            pe[y] = e
+            si[y] = len(st)
+            cs.append(y)
 
-    return top
+    return comp, nc
+
+def bicomp_ids(n, ea, eb):
+    """Component of every edge (ea[i], eb[i]) (-1 for bridges), and the number of components"""
+    m = len(ea)
+    ea, eb = list(ea), list(eb)
+    start, adj, idx = csr(n, ea + eb, eb + ea)
+    for p in range(len(idx)):
+        if idx[p] >= m:
+            idx[p] -= m
+    return _bicomps(n, start, adj, idx, m)
 
 def bicomps(f):
     """
@@ -60,13 +102,17 @@ def bicomps(f):
     f: callback function that takes a list of edge indices
     ed: global edge list where ed[i] = [(neighbor, edge_id), ...]
     """
-    global Time, num, st
-
     n = len(ed)
-    num = [None] * n
-    st = []
-    Time = 0
+    start = array('i', [0]) * (n + 1)
+    for v in range(n):
+        start[v + 1] = start[v] + len(ed[v])
+    adj = array('i', (y for l in ed for y, _ in l))
+    eid = array('i', (e for l in ed for _, e in l))
+    comp, nc = _bicomps(n, start, adj, eid, max(eid, default=-1) + 1)
 
-    for i in range(n):
-        if num[i] is None:
-            dfs(i, -1, f)
+    cont = [[] for _ in range(nc)]
+    for e in range(len(comp)):
+        if comp[e] >= 0:
+            cont[comp[e]].append(e)
+    for c in cont:
+        f(c)
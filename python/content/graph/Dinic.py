@@ -5,6 +5,9 @@
  * Source: https://cp-algorithms.com/graph/dinic.html
  * Description: Flow algorithm with complexity O(VE log U) where U = max |cap|.
  * O(min(E^(1/2), V^(2/3))E) if U = 1; O(sqrt(V)E) for bipartite matching.
+ * calc() continues from the current flow, so after add_edge() it returns the extra flow.
+ * set_cap(e, c, s, t) changes the capacity of edge e (as returned by add_edge) on a solved
+ * instance, cancels flow that no longer fits and returns the new max flow.
  * Status: Tested on SPOJ FASTFLOW and SPOJ MATCHING, stress-tested
 
 """
@@ -32,6 +35,7 @@ class Dinic:
         """Add edge from a to b with capacity c and reverse capacity rcap"""
         self.adj[a].append(Dinic.Edge(b, len(self.adj[b]), c))
         self.adj[b].append(Dinic.Edge(a, len(self.adj[a]) - 1, rcap))
+        return (a, len(self.adj[a]) - 1)
 
     def dfs(self, v, t, f):
         """DFS to find augmenting path"""
@@ -50,12 +54,13 @@ class Dinic:
 
         return 0
 
-    def calc(self, s, t):
-        """Calculate max flow from s to t"""
+    def calc(self, s, t, lim=float('inf')):
+        """Calculate max flow from s to t, stopping once it reaches lim"""
         flow = 0
         self.q[0] = s
 
-        for L in range(31):  # 30 iterations might be faster for random data
+        # 30 iterations might be faster for random data; bounded pushes skip the scaling
+        for L in range(0 if lim == float('inf') else 30, 31):
             while True:
                 self.lvl = [0] * self.n
                 self.ptr = [0] * self.n
@@ -75,16 +80,38 @@ class Dinic:
 
                 # Find blocking flow using DFS
                 while True:
-                    p = self.dfs(s, t, float('inf'))
+                    p = self.dfs(s, t, lim - flow)
                     if p == 0:
                         break
                     flow += p
 
+                if flow == lim:
+                    return flow
                 if not self.lvl[t]:
                     break
 
         return flow
 
+    def set_cap(self, edge, c, s, t):
+        """Set capacity of edge (a, i) to c and return the new max flow from s to t"""
+        a, i = edge
+        e = self.adj[a][i]
+        e.c += c - e.oc
+        e.oc = c
+        if e.c < 0:
+            # Take the excess off the edge, then reroute it from a to e.to,
+            # and return what cannot be rerouted to s and t
+            x = -e.c
+            e.c = 0
+            self.adj[e.to][e.rev].c -= x
+            y = x - (self.calc(a, e.to, x) if a != e.to else x)
+            if y and a not in (s, t):
+                self.calc(a, s, y)
+            if y and e.to not in (s, t):
+                self.calc(t, e.to, y)
+        self.calc(s, t)
+        return sum(f.oc - f.c for f in self.adj[s])
+
     def left_of_min_cut(self, a):
         """Check if node a is on the source side of min cut"""
         return self.lvl[a] != 0
@@ -0,0 +1,141 @@
+"""
+ * Author: chilli, agent
+ * Date: 2026-10-18
+ * License: CC0
+ * Source: Dinic.py
+ * Description: Dinic's algorithm over a packed (CSR) edge list, for graphs with millions
+ * of edges. Arcs live in typed arrays to, rev, cap, sorted by source, with the arcs of
+ * node v at start[v]..start[v+1]-1; the augmenting DFS uses an explicit stack, so long
+ * level graphs do not hit the recursion limit. add_edge() may be called until freeze()
+ * (called by calc() if needed); edges added later are packed in by the next freeze().
+ * edge_flow(i) is the net flow a -> b through the i-th added edge (negative if b -> a).
+ * Capacities must be < 2^31 and each edge uses about 64 bytes (32 per arc).
+ * Time: Same as Dinic.py, O(VE log U).
+ * Status: stress-tested against Dinic.py
+
+"""
+
+from array import array
+
+class DinicCSR:
+    def __init__(self, n):
+        self.n = n
+        self.lvl = [0] * n
+        self.q = array('i', [0]) * n
+        # Per arc, in insertion order: arc 2i is a -> b, arc 2i+1 is b -> a
+        self.src = array('i')
+        self.oc = array('q')
+        self.pos = array('i')
+        self.start = array('i', [0]) * (n + 1)
+        self.to = array('i')
+        self.rev = array('i')
+        self.cap = array('q')
+
+    def add_edge(self, a, b, c, rcap=0):
+        """Add edge from a to b with capacity c and reverse capacity rcap"""
+        self.src.append(a)
+        self.src.append(b)
+        self.oc.append(c)
+        self.oc.append(rcap)
+
+    def freeze(self):
+        """Pack all edges into CSR arrays, keeping the flow on already packed ones"""
+        n, src, m, old = self.n, self.src, len(self.src), len(self.pos)
+        if old == m:
+            return
+        # Residual capacity of every arc, in insertion order
+        ecap = array('q', self.oc)
+        for k in range(old):
+            ecap[k] = self.cap[self.pos[k]]
+
+        start = array('i', [0]) * (n + 1)
+        for v in src:
+            start[v + 1] += 1
+        for v in range(n):
+            start[v + 1] += start[v]
+        fill = start[:n]
+        pos = array('i', [0]) * m
+        for k in range(m):
+            pos[k] = fill[src[k]]
+            fill[src[k]] += 1
+
+        to = array('i', [0]) * m
+        rev = array('i', [0]) * m
+        cap = array('q', [0]) * m
+        for k in range(m):
+            p = pos[k]
+            to[p] = src[k ^ 1]
+            rev[p] = pos[k ^ 1]
+            cap[p] = ecap[k]
+        self.start, self.pos, self.to, self.rev, self.cap = start, pos, to, rev, cap
+
+    def calc(self, s, t):
+        """Calculate max flow from s to t"""
+        self.freeze()
+        n, q, start, to, rev, cap = self.n, self.q, self.start, self.to, self.rev, self.cap
+        flow = 0
+
+        for L in range(31):
+            sh = 30 - L
+            while True:
+                lvl = [0] * n
+                lvl[s] = 1
+                q[0] = s
+                qi, qe = 0, 1
+
+                # BFS to build level graph
+                while qi < qe and not lvl[t]:
+                    v = q[qi]
+                    qi += 1
+                    for p in range(start[v], start[v + 1]):
+                        w = to[p]
+                        if not lvl[w] and cap[p] >> sh:
+                            q[qe] = w
+                            qe += 1
+                            lvl[w] = lvl[v] + 1
+                self.lvl = lvl
+                if not lvl[t]:
+                    break
+
+                # Blocking flow by iterative DFS; es holds the arcs on the current path
+                ptr = start[:n]
+                vs = [s]
+                es = []
+                while True:
+                    v = vs[-1]
+                    if v == t:
+                        f = min(cap[p] for p in es)
+                        for p in es:
+                            cap[p] -= f
+                            cap[rev[p]] += f
+                        flow += f
+                        # Retreat to the tail of the first saturated arc
+                        i = 0
+                        while cap[es[i]]:
+                            i += 1
+                        del es[i:]
+                        del vs[i + 1:]
+                        continue
+                    end, p, lw = start[v + 1], ptr[v], lvl[v] + 1
+                    while p < end and not (cap[p] and lvl[to[p]] == lw):
+                        p += 1
+                    ptr[v] = p
+                    if p < end:
+                        es.append(p)
+                        vs.append(to[p])
+                    elif len(vs) > 1:
+                        vs.pop()
+                        ptr[vs[-1]] += 1
+                        es.pop()
+                    else:
+                        break
+
+        return flow
+
+    def edge_flow(self, i):
+        """Net flow through the i-th added edge"""
+        return self.oc[2 * i] - self.cap[self.pos[2 * i]]
+
+    def left_of_min_cut(self, a):
+        """Check if node a is on the source side of min cut"""
+        return self.lvl[a] != 0
@@ -0,0 +1,210 @@
+"""
+ * Author: agent
+ * Date: 2026-10-18
+ * License: CC0
+ * Source: Ahuja, Magnanti, Orlin, Network Flows, ch. 10.3 (capacity scaling)
+ * Description: Min-cost max-flow for large networks. Edges live in flat arrays packed by
+ * source node, and flow is found by capacity scaling: in phase D only arcs with residual
+ * >= D are used, arcs of negative reduced cost are saturated, and imbalances are fixed along
+ * shortest paths. Negative costs need no setpi. The shortest-path strategy is selectable:
+ * sp='heap' (binary heap, sparse graphs), sp='dense' (O(V^2) array scan with vectorized
+ * relaxation, for dense graphs such as assignment problems) or sp='radix' (radix heap,
+ * best for small integer costs). sum |cost| * sum cap must fit in 62 bits.
+ * Usage: mc = MCMFScaling(n); i = mc.add_edge(a, b, cap, cost);
+ *  flow, cost = mc.maxflow(s, t, 'dense'); mc.edge_flow(i)
+ * Time: O(E log U (E + V log V)) with a heap, O(E log U (E + V^2)) dense.
+ * Status: stress-tested against MinCostMaxFlow.py
+
+"""
+
+import heapq
+import numpy as np
+from array import array
+
+INF = 1 << 62
+
+class MCMFScaling:
+    def __init__(self, n):
+        self.n = n
+        # Per arc, in insertion order: arc 2i is a -> b, arc 2i+1 is b -> a
+        self.src = array('i')
+        self.oc = array('q')
+        self.cost0 = array('q')
+        self.pos = None
+        self.cap = None
+
+    def add_edge(self, a, b, cap, cost):
+        """Add edge from a to b with capacity cap and cost, return its index"""
+        if a == b:
+            return None
+        self.src.extend((a, b))
+        self.oc.extend((cap, 0))
+        self.cost0.extend((cost, -cost))
+        return len(self.src) // 2 - 1
+
+    def _pack(self, s, t, U, M):
+        """Pack arcs (plus an artificial s -> t arc of capacity U and cost M) by source,
+        each node's arcs by decreasing cost"""
+        src = np.array(self.src, dtype=np.int64)
+        src = np.append(src, [s, t])
+        dst = src.reshape(-1, 2)[:, ::-1].ravel()
+        cost = np.append(np.array(self.cost0, dtype=np.int64), [M, -M])
+        cap = np.append(np.array(self.oc, dtype=np.int64), [U, 0])
+
+        order = np.lexsort((-cost, src))
+        pos = np.empty_like(order)
+        pos[order] = np.arange(len(order))
+        self.pos = pos
+        self.start = np.searchsorted(src[order], np.arange(self.n + 1)).tolist()
+        self.fr = src[order]
+        self.to = dst[order]
+        self.cost = cost[order]
+        self.rev = pos[order ^ 1]
+        self.cap = array('q', cap[order].tobytes())
+        self.capv = np.frombuffer(self.cap, dtype=np.int64)
+
+    def _heap(self, ex, pi, D):
+        """Dijkstra from all nodes with excess >= D until a node with excess <= -D is settled"""
+        n, start, to, cost, cap = self.n, self.start, self.to_l, self.cost_l, self.cap
+        dist = [INF] * n
+        par = [-1] * n
+        pq = []
+        sources, ex = np.flatnonzero(ex >= D).tolist(), ex.tolist()
+        for v in sources:
+            dist[v] = 0
+            pq.append((0, v))
+        while pq:
+            d, v = heapq.heappop(pq)
+            if d > dist[v]:
+                continue
+            if ex[v] <= -D:
+                return v, dist, par
+            di = d + pi[v]
+            for p in range(start[v], start[v + 1]):
+                w = to[p]
+                if cap[p] >= D:
+                    val = di - pi[w] + cost[p]
+                    if val < dist[w]:
+                        dist[w] = val
+                        par[w] = p
+                        heapq.heappush(pq, (val, w))
+        return -1, dist, par
+
+    def _radix(self, ex, pi, D):
+        """Same as _heap, with a radix heap (keys only grow, so bucket by highest differing bit)"""
+        n, start, to, cost, cap = self.n, self.start, self.to_l, self.cost_l, self.cap
+        dist = [INF] * n
+        par = [-1] * n
+        buckets = [[] for _ in range(64)]
+        last = size = 0
+        sources, ex = np.flatnonzero(ex >= D).tolist(), ex.tolist()
+        for v in sources:
+            dist[v] = 0
+            buckets[0].append((0, v))
+            size += 1
+        while size:
+            if not buckets[0]:
+                i = 1
+                while not buckets[i]:
+                    i += 1
+                last = min(buckets[i])[0]
+                for k, v in buckets[i]:
+                    buckets[(k ^ last).bit_length()].append((k, v))
+                buckets[i] = []
+            d, v = buckets[0].pop()
+            size -= 1
+            if d > dist[v]:
+                continue
+            if ex[v] <= -D:
+                return v, dist, par
+            di = d + pi[v]
+            for p in range(start[v], start[v + 1]):
+                w = to[p]
+                if cap[p] >= D:
+                    val = di - pi[w] + cost[p]
+                    if val < dist[w]:
+                        dist[w] = val
+                        par[w] = p
+                        buckets[(val ^ last).bit_length()].append((val, w))
+                        size += 1
+        return -1, dist, par
+
+    def _dense(self, ex, pi, D):
+        """Same as _heap, picking the closest node by a scan and relaxing all its arcs at once"""
+        start, to, cost, cap = self.start, self.to, self.cost, self.capv
+        pi = np.array(pi, dtype=np.int64)
+        dist = np.full(self.n, INF, dtype=np.int64)
+        dist[ex >= D] = 0
+        key = dist.copy()
+        par = np.full(self.n, -1, dtype=np.int64)
+        while True:
+            v = int(key.argmin())
+            d = int(key[v])
+            if d == INF:
+                return -1, dist, par
+            if ex[v] <= -D:
+                return v, dist, par
+            key[v] = INF
+            a, b = start[v], start[v + 1]
+            w = to[a:b]
+            val = d + pi[v] - pi[w] + cost[a:b]
+            # Arcs are sorted by decreasing cost, so among parallel arcs the cheapest is written last
+            m = (cap[a:b] >= D) & (val < dist[w])
+            w, val = w[m], val[m]
+            dist[w] = val
+            key[w] = val
+            par[w] = np.flatnonzero(m) + a
+
+    def maxflow(self, s, t, sp='heap'):
+        """Compute min-cost max-flow from s to t. Returns (flow, cost)"""
+        oc = np.array(self.oc, dtype=np.int64)
+        src = np.array(self.src, dtype=np.int64)
+        U = int(oc[src == s].sum())
+        M = int(np.abs(np.array(self.cost0, dtype=np.int64)).sum()) + 1
+        self._pack(s, t, U, M)
+        self.to_l, self.cost_l = self.to.tolist(), self.cost.tolist()
+        fr, to, cost, rev, cap, capv = self.fr, self.to, self.cost, self.rev, self.cap, self.capv
+        search = {'heap': self._heap, 'radix': self._radix, 'dense': self._dense}[sp]
+
+        # Send U units from s to t, the overflow along the artificial arc of huge cost
+        ex = np.zeros(self.n, dtype=np.int64)
+        ex[s] += U
+        ex[t] -= U
+        pi = np.zeros(self.n, dtype=np.int64)
+        D = 1 << max(int(capv.max()), 1).bit_length() - 1
+        while D:
+            # Saturate D-arcs of negative reduced cost
+            m = (capv >= D) & (cost + pi[fr] - pi[to] < 0)
+            r = capv[m]
+            np.add.at(capv, rev[m], r)
+            capv[m] = 0
+            np.add.at(ex, to[m], r)
+            np.subtract.at(ex, fr[m], r)
+
+            while True:
+                l, dist, par = search(ex, pi.tolist() if sp != 'dense' else pi, D)
+                if l < 0:
+                    break
+                dl = dist[l]
+                pi += np.minimum(np.asarray(dist, dtype=np.int64), dl)
+                path = []
+                v = l
+                while par[v] >= 0:
+                    path.append(int(par[v]))
+                    v = int(fr[par[v]])
+                f = min(int(ex[v]), -int(ex[l]), min((cap[p] for p in path), default=INF))
+                for p in path:
+                    cap[p] -= f
+                    cap[rev[p]] += f
+                ex[v] -= f
+                ex[l] += f
+            D >>= 1
+
+        real = self.pos[:len(self.oc)][0::2]
+        totcost = int((np.array(self.cost0[0::2], dtype=np.int64) *
+                       (oc[0::2] - capv[real])).sum())
+        return (cap[self.pos[-2]], totcost)
+
+    def edge_flow(self, i):
+        """Flow through the i-th added edge after maxflow"""
+        return self.oc[2 * i] - self.cap[self.pos[2 * i]]
@@ -5,6 +5,10 @@
  * Source: Wikipedia, tinyKACTL
  * Description: Push-relabel using the highest label selection rule and the gap heuristic. Quite fast in practice.
  * To obtain the actual flow, look at positive values only.
+ * calc() starts from the current flow, so it can be called again after add_edge().
+ * set_cap(e, c, s, t) changes the capacity of edge e (as returned by add_edge) on a solved
+ * instance, cancels flow that no longer fits and returns the new max flow. It repairs the
+ * flow with augment(), which pushes along BFS paths and is cheap when little flow changes.
  * Time: O(V^2 sqrt(E))
  * Status: Tested on Kattis and SPOJ, and stress-tested
 
@@ -29,9 +33,10 @@ class PushRelabel:
     def add_edge(self, s, t, cap, rcap=0):
         """Add edge from s to t with capacity cap and reverse capacity rcap"""
         if s == t:
-            return
+            return None
         self.g[s].append(PushRelabel.Edge(t, len(self.g[t]), 0, cap))
         self.g[t].append(PushRelabel.Edge(s, len(self.g[s]) - 1, 0, rcap))
+        return (s, len(self.g[s]) - 1)
 
     def add_flow(self, e, f):
         """Add flow f to edge e"""
@@ -48,7 +53,9 @@ class PushRelabel:
     def calc(self, s, t):
         """Calculate max flow from s to t"""
         v = self.n
+        self.H = [0] * v
         self.H[s] = v
+        self.hs = [[] for _ in range(2 * v)]
         self.ec[t] = 1
         co = [0] * (2 * v)
         co[0] = v - 1
@@ -96,6 +103,50 @@ class PushRelabel:
                     else:
                         self.cur[u] += 1
 
+    def augment(self, s, t, lim):
+        """Push up to lim units from s to t along shortest residual paths, return the amount"""
+        flow = 0
+        while flow < lim:
+            par = [None] * self.n
+            q = [s]
+            for u in q:
+                for e in self.g[u]:
+                    if e.c and par[e.dest] is None and e.dest != s:
+                        par[e.dest] = e
+                        q.append(e.dest)
+            if par[t] is None:
+                # Label the residual reach of s as the source side of the cut
+                self.H = [self.n if par[u] is not None or u == s else 0 for u in range(self.n)]
+                break
+            path = []
+            x = t
+            while x != s:
+                path.append(par[x])
+                x = self.g[par[x].dest][par[x].back].dest
+            f = min(lim - flow, min(e.c for e in path))
+            for e in path:
+                self.add_flow(e, f)
+            flow += f
+        return flow
+
+    def set_cap(self, edge, c, s, t):
+        """Set capacity of edge (a, i) to c and return the new max flow from s to t"""
+        a, i = edge
+        e = self.g[a][i]
+        e.c = c - e.f
+        if e.c < 0:
+            # Take the excess off the edge, then reroute it from a to e.dest,
+            # and return what cannot be rerouted to s and t
+            x = -e.c
+            self.add_flow(e, -x)
+            y = x - self.augment(a, e.dest, x)
+            if y and a not in (s, t):
+                self.augment(a, s, y)
+            if y and e.dest not in (s, t):
+                self.augment(t, e.dest, y)
+        self.augment(s, t, float('inf'))
+        return -self.ec[s]
+
     def left_of_min_cut(self, a):
         """Check if node a is on the source side of min cut"""
         return self.H[a] >= self.n
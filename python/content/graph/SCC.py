@@ -10,60 +10,102 @@
  * in reverse topological order. comp[i] holds the component
  * index of a node (a component only has edges to components with
  * lower index). ncomps will contain the number of components.
+ * For big graphs, skip the adjacency lists: start, adj = csr(n, ea, eb)[:2] packs
+ * the edges ea[i] -> eb[i], and comp, ncomps = tarjan(n, start, adj) returns comp as
+ * an array('i'). The DFS uses an explicit stack, so no recursion limit is needed.
  * Time: O(E + V)
  * Status: Bruteforce-tested for N <= 5
 
 """
 
+from array import array
+from itertools import chain
+
 # Global variables (can be encapsulated in a class if preferred)
-val = []
-comp = []
-z = []
-cont = []
-Time = 0
+comp = array('i')
 ncomps = 0
 
-def dfs(j, g, f):
-    global Time, ncomps, val, comp, z, cont
-    low = val[j] = Time
-    Time += 1
-    z.append(j)
+def csr(n, ea, eb):
+    """Pack edges ea[i] -> eb[i] by source: the arcs of v are adj[start[v]:start[v+1]],
+    and idx[p] is the edge index of arc p"""
+    start = array('i', [0]) * (n + 1)
+    for a in ea:
+        start[a + 1] += 1
+    for v in range(n):
+        start[v + 1] += start[v]
+    fill = start[:n]
+    adj = array('i', [0]) * len(ea)
+    idx = array('i', [0]) * len(ea)
+    for i in range(len(ea)):
+        p = fill[ea[i]]
+        fill[ea[i]] += 1
+        adj[p] = eb[i]
+        idx[p] = i
+    return start, adj, idx
 
-    for e in g[j]:
-        if comp[e] < 0:
-            if val[e] == 0:
-                low = min(low, dfs(e, g, f))
-            else:
-                low = min(low, val[e])
+def tarjan(n, start, adj):
+    """Component ids (in reverse topological order) of a CSR graph, and their number"""
+    val = array('i', [0]) * n
+    low = array('i', [0]) * n
+    comp = array('i', [-1]) * n
+    ptr = start[:n]
+    z = array('i')
+    Time = nc = 0
 
-    if low == val[j]:
-        while True:
-            x = z.pop()
-            comp[x] = ncomps
-            cont.append(x)
-            if x == j:
-                break
-        f(cont)
-        cont = []
-        ncomps += 1
+    for r in range(n):
+        if val[r]:
+            continue
+        Time += 1
+        val[r] = low[r] = Time
+        z.append(r)
+        st = [r]
+        while st:
+            v = st[-1]
+            p, end = ptr[v], start[v + 1]
+            while p < end:
+                w = adj[p]
+                p += 1
+                if comp[w] < 0:
+                    if not val[w]:
+                        break
+                    if val[w] < low[v]:
+                        low[v] = val[w]
+            else:
+                # All arcs of v are done
+                ptr[v] = p
+                st.pop()
+                if low[v] == val[v]:
+                    while True:
+                        x = z.pop()
+                        comp[x] = nc
+                        if x == v:
+                            break
+                    nc += 1
+                if st and low[v] < low[st[-1]]:
+                    low[st[-1]] = low[v]
+                continue
+            ptr[v] = p
+            Time += 1
+            val[w] = low[w] = Time
+            z.append(w)
+            st.append(w)
 
-    val[j] = low
-    return low
+    return comp, nc
 
 def scc(g, f):
     """
     g: adjacency list
     f: callback function to process each SCC
     """
-    global Time, ncomps, val, comp, z, cont
+    global comp, ncomps
     n = len(g)
-    val = [0] * n
-    comp = [-1] * n
-    z = []
-    cont = []
-    Time = 0
-    ncomps = 0
+    start = array('i', [0]) * (n + 1)
+    for v in range(n):
+        start[v + 1] = start[v] + len(g[v])
+    comp, ncomps = tarjan(n, start, array('i', chain.from_iterable(g)))
 
-    for i in range(n):
-        if comp[i] < 0:
-            dfs(i, g, f)
+    cont = [[] for _ in range(ncomps)]
+    for v in range(n):
+        cont[comp[v]].append(v)
+    for c in cont:
+        f(c)
@@ -14,25 +14,26 @@
  *  ts.at_most_one([0,~1,2])  // <= 1 of vars 0, ~1 and 2 are true
  *  ts.solve()  // Returns True iff it is solvable
  *  ts.values[0..N-1] holds the assigned values to the vars
+ * Clauses are kept in flat arrays and solved with the iterative tarjan() of SCC.py,
+ * so instances with millions of variables need no recursion and little memory.
  * Time: O(N+E), where N is the number of boolean variables, and E is the number of clauses.
  * Status: stress-tested
 
 """
 
+from array import array
+from SCC import csr, tarjan
+
 class TwoSat:
     def __init__(self, n=0):
         self.N = n
-        self.gr = [[] for _ in range(2 * n)]
-        self.values = []
-        self.val = []
-        self.comp = []
-        self.z = []
-        self.time = 0
+        # Implication graph: edges ea[i] -> eb[i] between literals, 2x is x and 2x+1 is ~x
+        self.ea = array('i')
+        self.eb = array('i')
+        self.values = array('b')
 
     def add_var(self):
         """Optional: add a new boolean variable"""
-        self.gr.append([])
-        self.gr.append([])
         self.N += 1
         return self.N - 1
 
@@ -40,8 +41,10 @@ class TwoSat:
         """Add clause: f OR j must be true"""
         f = max(2 * f, -1 - 2 * f)
         j = max(2 * j, -1 - 2 * j)
-        self.gr[f].append(j ^ 1)
-        self.gr[j].append(f ^ 1)
+        self.ea.append(f)
+        self.eb.append(j ^ 1)
+        self.ea.append(j)
+        self.eb.append(f ^ 1)
 
     def set_value(self, x):
         """Set variable x to true"""
@@ -60,48 +63,18 @@ class TwoSat:
             cur = ~next_var
         self.either(cur, ~li[1])
 
-    def dfs(self, i):
-        low = self.val[i] = self.time
-        self.time += 1
-        x = i
-        self.z.append(i)
-
-        for e in self.gr[i]:
-            if not self.comp[e]:
-                if self.val[e] == 0:
-                    low = min(low, self.dfs(e))
-                else:
-                    low = min(low, self.val[e])
-
-        if low == self.val[i]:
-            while True:
-                x = self.z.pop()
-                self.comp[x] = low
-                if self.values[x >> 1] == -1:
-                    self.values[x >> 1] = x & 1
-                if x == i:
-                    break
-
-        self.val[i] = low
-        return low
-
     def solve(self):
         """
         Solve the 2-SAT problem.
         Returns True if satisfiable, False otherwise.
         After solving, self.values contains the assignment.
         """
-        self.values = [-1] * self.N
-        self.val = [0] * (2 * self.N)
-        self.comp = [0] * (2 * self.N)
-        self.time = 0
-        self.z = []
-
-        for i in range(2 * self.N):
-            if not self.comp[i]:
-                self.dfs(i)
-
+        n = 2 * self.N
+        comp = tarjan(n, *csr(n, self.ea, self.eb)[:2])[0]
+        self.values = array('b', [0]) * self.N
         for i in range(self.N):
-            if self.comp[2 * i] == self.comp[2 * i + 1]:
+            if comp[2 * i] == comp[2 * i + 1]:
                 return False
+            # The literal whose component is finished first is made true
+            self.values[i] = comp[2 * i + 1] < comp[2 * i]
         return True
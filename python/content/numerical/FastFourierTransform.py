@@ -12,6 +12,9 @@
  * Rounding is safe if (sum a_i^2 + sum b_i^2)*log_2(N) < 9*10^14
  * (in practice 10^16; higher for random inputs).
  * Otherwise, use NTT/FFTMod.
+ * fft_arr/conv_arr work directly on NumPy arrays, doing the bit reversal
+ * and each butterfly stage as whole-array operations; fft/conv are list wrappers.
+ * fft_arr works in place, so its input must be C-contiguous (not e.g. x[::2]).
  * Time: O(N log N) with N = |A|+|B| (~1s for N=2^22)
  * Status: somewhat tested
  * Details: An in-depth examination of precision for both FFT and FFTMod can be found
@@ -19,82 +22,87 @@
 
 """
 
-import math
-import cmath
-
-# Static variables to cache roots
-_R = [1, 1]
-_rt = [1, 1]
-_k_cache = 2
-
-def fft(a):
-    """Compute FFT in-place on list of complex numbers"""
-    global _R, _rt, _k_cache
-
+import numpy as np
+
+# Static caches: roots of unity as one contiguous complex128 array,
+# and bit-reversal permutations per transform size
+_rt = np.ones(2, dtype=np.complex128)
+_rev = {}
+
+def _bit_reverse(n):
+    """Bit-reversal permutation of range(n), cached per n"""
+    rev = _rev.get(n)
+    if rev is None:
+        L = n.bit_length() - 1
+        i = np.arange(n, dtype=np.int64)
+        rev = np.zeros(n, dtype=np.int64)
+        for b in range(L):
+            rev |= ((i >> b) & 1) << (L - 1 - b)
+        _rev[n] = rev
+    return rev
+
+def fft_arr(a):
+    """Compute FFT in-place on complex128 NumPy array a, and return it"""
+    global _rt
+
+    assert a.flags.c_contiguous, "fft_arr works in place on a contiguous array"
     n = len(a)
-    L = n.bit_length() - 1
-
-    # Extend roots cache if needed
-    k = _k_cache
-    while k < n:
-        _R.extend([0] * k)
-        _rt.extend([0] * k)
-        x = cmath.exp(1j * math.pi / k)
-        for i in range(k, 2 * k):
-            if i & 1:
-                _R[i] = _R[i // 2] * x
-            else:
-                _R[i] = _R[i // 2]
-            _rt[i] = complex(_R[i].real, _R[i].imag)
-        k *= 2
-    _k_cache = k
-
-    # Bit-reversal permutation
-    rev = [0] * n
-    for i in range(n):
-        rev[i] = (rev[i // 2] | ((i & 1) << L)) // 2
-    for i in range(n):
-        if i < rev[i]:
-            a[i], a[rev[i]] = a[rev[i]], a[i]
-
-    # FFT computation
+    if n <= 1:
+        return a
+
+    # Extend roots cache if needed: rt[k + j] = exp(i*pi*j/k)
+    k = len(_rt)
+    if k < n:
+        parts = [_rt]
+        while k < n:
+            parts.append(np.exp(1j * np.pi * np.arange(k) / k))
+            k *= 2
+        _rt = np.concatenate(parts)
+
+    a[:] = a[_bit_reverse(n)]
+
+    # Each butterfly stage as one operation on an (n/2k, 2, k) view
+    buf = np.empty(n // 2, dtype=np.complex128)
     k = 1
     while k < n:
-        i = 0
-        while i < n:
-            for j in range(k):
-                z = _rt[j + k] * a[i + j + k]
-                a[i + j + k] = a[i + j] - z
-                a[i + j] = a[i + j] + z
-            i += 2 * k
+        v = a.reshape(-1, 2, k)
+        lo, hi, z = v[:, 0, :], v[:, 1, :], buf.reshape(-1, k)
+        np.multiply(hi, _rt[k:2 * k], out=z)
+        np.subtract(lo, z, out=hi)
+        np.add(lo, z, out=lo)
         k *= 2
+    return a
 
-def conv(a, b):
-    """Compute convolution of two real-valued sequences"""
-    if not a or not b:
-        return []
+def fft(a):
+    """Compute FFT in-place on list of complex numbers"""
+    a[:] = fft_arr(np.array(a, dtype=np.complex128)).tolist()
+
+def conv_arr(a, b):
+    """Compute convolution of two real-valued NumPy arrays, as a float64 array"""
+    if not len(a) or not len(b):
+        return np.zeros(0)
 
     res_len = len(a) + len(b) - 1
     L = res_len.bit_length()
     n = 1 << L
 
-    # Pack a and b into complex array
-    in_arr = [complex(a[i] if i < len(a) else 0,
-                      b[i] if i < len(b) else 0) for i in range(n)]
+    # Pack a and b into one complex array
+    in_arr = np.zeros(n, dtype=np.complex128)
+    in_arr.real[:len(a)] = a
+    in_arr.imag[:len(b)] = b
 
-    fft(in_arr)
-
-    # Multiply
-    for i in range(n):
-        in_arr[i] *= in_arr[i]
+    fft_arr(in_arr)
+    in_arr *= in_arr
 
     # Prepare for inverse FFT
-    out = [0] * n
-    for i in range(n):
-        out[i] = in_arr[(-i) & (n - 1)] - in_arr[i].conjugate()
+    out = in_arr[-np.arange(n) & (n - 1)] - in_arr.conj()
+    fft_arr(out)
 
-    fft(out)
+    return out.imag[:res_len] / (4 * n)
 
-    # Extract result
-    res = [out[i].imag / (4 * n) for i in range(res_len)]
-    return res
+def conv(a, b):
+    """Compute convolution of two real-valued sequences"""
+    if not a or not b:
+        return []
+    return conv_arr(np.asarray(a, dtype=np.float64),
+                    np.asarray(b, dtype=np.float64)).tolist()
@@ -5,7 +5,12 @@
  * Source: http://neerc.ifmo.ru/trains/toulouse/2017/fft2.pdf
  * Description: Higher precision FFT, can be used for convolutions modulo arbitrary integers
  * as long as N*log_2(N)*mod < 8.6*10^14 (in practice 10^16 or higher).
- * Inputs must be in [0, mod).
+ * Inputs must be in [0, mod), mod < 2^31.
+ * mode='fft' splits coefficients into two halves of about sqrt(mod) and does four FFTs;
+ * mode='crt' convolves modulo three NTT primes and combines them with Garner's algorithm,
+ * which is exact for any N <= 2^23. With mode=None, 'fft' is used when the bound above
+ * holds for the largest input coefficient, and 'crt' otherwise.
+ * conv_mod_arr works on NumPy arrays; conv_mod is a list wrapper.
  * Time: O(N log N), where N = |A|+|B| (twice as slow as NTT or FFT)
  * Status: stress-tested
  * Details: An in-depth examination of precision for both FFT and FFTMod can be found
@@ -14,42 +19,74 @@
 """
 
 import math
-from FastFourierTransform import fft
+import numpy as np
+from FastFourierTransform import fft_arr
+from NumberTheoreticTransform import conv_arr, ROOT
 
-def conv_mod(a, b, M):
-    """Compute convolution modulo M using FFT"""
-    if not a or not b:
-        return []
+# NTT primes for the CRT mode; their product exceeds N * mod^2 for N <= 2^23, mod < 2^31
+P1, P2, P3 = (119 << 23) + 1, (5 << 25) + 1, (7 << 26) + 1
 
+def _conv_fft(a, b, M, bound):
+    """Split-double FFT convolution of arrays with entries <= bound"""
     res_len = len(a) + len(b) - 1
-    B = res_len.bit_length()
-    n = 1 << B
-    cut = int(math.sqrt(M))
-
-    # Split into high and low parts
-    L = [complex((a[i] if i < len(a) else 0) // cut,
-                 (a[i] if i < len(a) else 0) % cut) for i in range(n)]
-    R = [complex((b[i] if i < len(b) else 0) // cut,
-                 (b[i] if i < len(b) else 0) % cut) for i in range(n)]
-
-    fft(L)
-    fft(R)
-
-    outs = [0] * n
-    outl = [0] * n
-    for i in range(n):
-        j = (-i) & (n - 1)
-        outl[j] = (L[i] + L[j].conjugate()) * R[i] / (2.0 * n)
-        outs[j] = (L[i] - L[j].conjugate()) * R[i] / (2.0 * n) / 1j
-
-    fft(outl)
-    fft(outs)
-
-    res = []
-    for i in range(res_len):
-        av = int(outl[i].real + 0.5)
-        cv = int(outs[i].imag + 0.5)
-        bv = int(outl[i].imag + 0.5) + int(outs[i].real + 0.5)
-        res.append(((av % M * cut + bv) % M * cut + cv) % M)
-
-    return res
+    n = 1 << res_len.bit_length()
+    cut = math.isqrt(bound) + 1
+
+    L = np.zeros(n, dtype=np.complex128)
+    R = np.zeros(n, dtype=np.complex128)
+    L.real[:len(a)], L.imag[:len(a)] = np.divmod(a, cut)
+    R.real[:len(b)], R.imag[:len(b)] = np.divmod(b, cut)
+
+    fft_arr(L)
+    fft_arr(R)
+
+    j = -np.arange(n) & (n - 1)
+    Lj = L[j].conj()
+    outl = ((L + Lj) * R / (2.0 * n))[j]
+    outs = ((L - Lj) * R / (2.0 * n) / 1j)[j]
+
+    fft_arr(outl)
+    fft_arr(outs)
+
+    av = np.rint(outl.real[:res_len]).astype(np.int64) % M
+    bv = (np.rint(outl.imag[:res_len]).astype(np.int64) +
+          np.rint(outs.real[:res_len]).astype(np.int64)) % M
+    cv = np.rint(outs.imag[:res_len]).astype(np.int64) % M
+    return ((av * cut + bv) % M * cut + cv) % M
+
+def _conv_crt(a, b, M):
+    """Exact convolution modulo three NTT primes, reduced mod M by Garner's algorithm"""
+    a = a.astype(np.uint64)
+    b = b.astype(np.uint64)
+    r1, r2, r3 = (conv_arr(a % np.uint64(p), b % np.uint64(p), p, ROOT) for p in (P1, P2, P3))
+
+    u1 = np.uint64(pow(P1, -1, P2))
+    u2 = np.uint64(pow(P1 * P2, -1, P3))
+    x2 = (r2 + np.uint64(P2) - r1 % np.uint64(P2)) * u1 % np.uint64(P2)
+    x3 = (r1 + np.uint64(P1 % P3) * x2) % np.uint64(P3)
+    x3 = (r3 + np.uint64(P3) - x3) * u2 % np.uint64(P3)
+
+    m = np.uint64(M)
+    res = (r1 % m + np.uint64(P1 % M) * x2 % m) % m
+    return ((res + np.uint64(P1 * P2 % M) * x3 % m) % m).astype(np.int64)
+
+def conv_mod_arr(a, b, M, mode=None):
+    """Convolution of int64 arrays modulo M, as an int64 array"""
+    if mode not in (None, 'fft', 'crt'):
+        raise ValueError(f"unknown mode {mode!r}")
+    if not len(a) or not len(b):
+        return np.zeros(0, dtype=np.int64)
+    bound = max(int(a.max()), int(b.max()), 1)
+    if mode is None:
+        n = 1 << (len(a) + len(b) - 1).bit_length()
+        mode = 'fft' if n * n.bit_length() * bound < 8.6e14 else 'crt'
+    if mode == 'fft':
+        return _conv_fft(a, b, M, bound)
+    return _conv_crt(a, b, M)
+
+def conv_mod(a, b, M, mode=None):
+    """Compute convolution modulo M"""
+    if not a or not b:
+        return []
+    return conv_mod_arr(np.array(a, dtype=np.int64), np.array(b, dtype=np.int64),
+                        M, mode).tolist()
@@ -6,11 +6,18 @@
  * Description: Transform to a basis with fast convolutions of the form
  * c[z] = sum_{z = x op y} a[x] * b[y],
  * where op is one of AND, OR, XOR. The size of a must be a power of two.
+ * fst_arr/conv_arr transform integer NumPy arrays in place, one reshaped-array
+ * operation per level, along the last axis (so every row of a 2-D array at once).
+ * With mod, entries must be in [0, mod) and stay reduced (XOR inverse needs mod odd),
+ * and mod < 2^31 so that products of two entries fit in int64;
+ * without it, int64 overflow is the caller's concern.
  * Time: O(N log N)
  * Status: stress-tested
 
 """
 
+import numpy as np
+
 def fst(a, inv, op='AND'):
     """
     Fast Subset Transform
@@ -63,3 +70,52 @@ def conv(a, b, op='AND'):
         a_copy[i] *= b_copy[i]
     fst(a_copy, True, op)
     return a_copy
+
+def fst_arr(a, inv, op='AND', mod=None):
+    """Fast Subset Transform in-place along the last axis of integer array a, and return it"""
+    assert mod is None or mod < 1 << 31
+    n = a.shape[-1]
+    # x - y, kept non-negative when working modulo mod
+    sub = (lambda x, y: x - y) if mod is None else (lambda x, y: x + (mod - y))
+    step = 1
+    while step < n:
+        v = a.reshape(-1, n // (2 * step), 2, step)
+        u, w = v[:, :, 0, :], v[:, :, 1, :]
+        t = u.copy()
+        if op == 'AND':
+            if inv:
+                u[...] = sub(w, t)
+                w[...] = t
+            else:
+                u[...] = w
+                w += t
+        elif op == 'OR':
+            if inv:
+                u[...] = w
+                w[...] = sub(t, w)
+            else:
+                u += w
+                w[...] = t
+        elif op == 'XOR':
+            u += w
+            w[...] = sub(t, w)
+        if mod is not None:
+            a %= mod
+        step *= 2
+
+    if op == 'XOR' and inv:
+        if mod is None:
+            a //= n
+        else:
+            a *= pow(n, -1, mod)
+            a %= mod
+    return a
+
+def conv_arr(a, b, op='AND', mod=None):
+    """Subset convolution of integer arrays (row-wise for 2-D)"""
+    assert mod is None or mod < 1 << 31
+    a = fst_arr(a.copy(), False, op, mod)
+    a *= fst_arr(b.copy(), False, op, mod)
+    if mod is not None:
+        a %= mod
+    return fst_arr(a, True, op, mod)
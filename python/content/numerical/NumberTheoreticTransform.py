@@ -11,11 +11,17 @@
  * For manual convolution: NTT the inputs, multiply
  * pointwise, divide by n, reverse(start+1, end), NTT back.
  * Inputs must be in [0, mod).
+ * ntt_arr/conv_arr run on uint64 NumPy arrays (mod < 2^32, so residue products
+ * fit in 64 bits), cache bit-reversal and twiddles per size, and transform
+ * every row of a 2-D array at once; ntt/conv are list wrappers. ntt_arr works
+ * in place, so its input must be C-contiguous (not e.g. x[::2] or x[:, :4]).
  * Time: O(N log N)
  * Status: stress-tested
 
 """
 
+import numpy as np
+
 MOD = (119 << 23) + 1  # = 998244353
 ROOT = 62
 # For p < 2^30 there is also e.g. 5 << 25, 7 << 26, 479 << 21
@@ -32,71 +38,107 @@ def mod_pow(base, exp, mod):
         base = (base * base) % mod
     return result
 
-# Static cache for roots
-_rt = [1, 1]
-_k_cache = 2
-_s_cache = 2
-
-def ntt(a, mod=MOD, root=ROOT):
-    """Compute NTT in-place on list a"""
-    global _rt, _k_cache, _s_cache
-
-    n = len(a)
-    L = n.bit_length() - 1
-
-    # Extend roots cache if needed
-    k = _k_cache
-    s = _s_cache
-    while k < n:
-        _rt.extend([0] * k)
-        z = [1, mod_pow(root, mod >> s, mod)]
-        for i in range(k, 2 * k):
-            _rt[i] = _rt[i // 2] * z[i & 1] % mod
-        k *= 2
-        s += 1
-    _k_cache = k
-    _s_cache = s
-
-    # Bit-reversal permutation
-    rev = [0] * n
-    for i in range(n):
-        rev[i] = (rev[i // 2] | ((i & 1) << L)) // 2
-    for i in range(n):
-        if i < rev[i]:
-            a[i], a[rev[i]] = a[rev[i]], a[i]
-
-    # NTT computation
+# Static caches: bit-reversal permutation per size, twiddles per (mod, root)
+# with rt[k + j] = w_{2k}^j, as one contiguous uint64 array
+_rev = {}
+_rt = {}
+
+def _bit_reverse(n):
+    """Bit-reversal permutation of range(n), cached per n"""
+    rev = _rev.get(n)
+    if rev is None:
+        L = n.bit_length() - 1
+        i = np.arange(n, dtype=np.int64)
+        rev = np.zeros(n, dtype=np.int64)
+        for b in range(L):
+            rev |= ((i >> b) & 1) << (L - 1 - b)
+        _rev[n] = rev
+    return rev
+
+def _twiddles(n, mod, root):
+    """Twiddle table of length >= n for (mod, root), extended as needed"""
+    rt = _rt.get((mod, root))
+    if rt is None:
+        rt = np.ones(2, dtype=np.uint64)
+    k = len(rt)
+    if k < n:
+        parts = [rt]
+        while k < n:
+            # Powers 1, w, ..., w^(k-1) of w = root^((mod-1)/2k) by doubling
+            w = mod_pow(root, (mod - 1) // (2 * k), mod)
+            z = np.ones(k, dtype=np.uint64)
+            m = 1
+            while m < k:
+                z[m:2 * m] = z[:m] * np.uint64(mod_pow(w, m, mod)) % np.uint64(mod)
+                m *= 2
+            parts.append(z)
+            k *= 2
+        rt = np.concatenate(parts)
+    _rt[mod, root] = rt
+    return rt
+
+def ntt_arr(a, mod=MOD, root=ROOT):
+    """Compute NTT in-place along the last axis of uint64 array a (1-D or 2-D), and return it"""
+    assert mod < 1 << 32
+    assert a.flags.c_contiguous, "ntt_arr works in place on a contiguous array"
+    n = a.shape[-1]
+    if n <= 1:
+        return a
+    rt = _twiddles(n, mod, root)
+    M = np.uint64(mod)
+
+    a[...] = a[..., _bit_reverse(n)]
+
+    rows = a.reshape(-1, n)
+    buf = np.empty((len(rows), n // 2), dtype=np.uint64)
     k = 1
     while k < n:
-        i = 0
-        while i < n:
-            for j in range(k):
-                z = _rt[j + k] * a[i + j + k] % mod
-                a[i + j + k] = (a[i + j] - z + (mod if z > a[i + j] else 0)) % mod
-                a[i + j] = (a[i + j] + (z - mod if a[i + j] + z >= mod else z)) % mod
-            i += 2 * k
+        v = rows.reshape(len(rows), -1, 2, k)
+        lo, hi, z = v[:, :, 0, :], v[:, :, 1, :], buf.reshape(len(rows), -1, k)
+        np.multiply(hi, rt[k:2 * k], out=z)
+        np.remainder(z, M, out=z)
+        # hi = lo - z, lo = lo + z; min(x, x - mod) wraps to the reduced value
+        np.add(lo, M - z, out=hi)
+        np.minimum(hi, hi - M, out=hi)
+        np.add(lo, z, out=lo)
+        np.minimum(lo, lo - M, out=lo)
         k *= 2
+    return a
+
+def ntt(a, mod=MOD, root=ROOT):
+    """Compute NTT in-place on list a"""
+    a[:] = ntt_arr(np.array(a, dtype=np.uint64), mod, root).tolist()
+
+def conv_arr(a, b, mod=MOD, root=ROOT):
+    """Convolve uint64 arrays modulo mod; 2-D inputs convolve row i of a with row i of b"""
+    la, lb = a.shape[-1], b.shape[-1]
+    if not la or not lb:
+        return np.zeros(a.shape[:-1] + (0,), dtype=np.uint64)
+
+    s = la + lb - 1
+    n = 1 << s.bit_length()
+    M = np.uint64(mod)
+    inv = np.uint64(mod_pow(n, mod - 2, mod))
+
+    L = np.zeros(a.shape[:-1] + (n,), dtype=np.uint64)
+    R = np.zeros(b.shape[:-1] + (n,), dtype=np.uint64)
+    L[..., :la] = a
+    R[..., :lb] = b
+    ntt_arr(L, mod, root)
+    ntt_arr(R, mod, root)
+
+    L *= R
+    L %= M
+    L *= inv
+    L %= M
+    L[...] = L[..., -np.arange(n) & (n - 1)]
+    ntt_arr(L, mod, root)
+
+    return L[..., :s]
 
 def conv(a, b, mod=MOD, root=ROOT):
     """Compute convolution modulo mod"""
     if not a or not b:
         return []
-
-    s = len(a) + len(b) - 1
-    B = s.bit_length()
-    n = 1 << B
-    inv = mod_pow(n, mod - 2, mod)
-
-    L = a[:] + [0] * (n - len(a))
-    R = b[:] + [0] * (n - len(b))
-    out = [0] * n
-
-    ntt(L, mod, root)
-    ntt(R, mod, root)
-
-    for i in range(n):
-        out[(-i) & (n - 1)] = L[i] * R[i] % mod * inv % mod
-
-    ntt(out, mod, root)
-
-    return out[:s]
+    return conv_arr(np.array(a, dtype=np.uint64), np.array(b, dtype=np.uint64),
+                    mod, root).tolist()
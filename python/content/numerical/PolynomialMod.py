@@ -0,0 +1,171 @@
+"""
+ * Author: agent
+ * Date: 2026-10-18
+ * License: CC0
+ * Source: https://cp-algorithms.com/algebra/polynomial.html
+ * Description: Power series and polynomial algebra modulo 998244353 on top of
+ * NTT conv_arr. Polynomials are uint64 arrays (or lists) [a0, a1, ...].
+ * inverse/log/exp/sqrt(a, n) give the first n terms of 1/a, log a, e^a, sqrt a;
+ * they need a[0] != 0, a[0] == 1, a[0] == 0 and a square respectively.
+ * poly_divmod(a, b) gives (q, r) with a = b*q + r, deg r < deg b.
+ * multipoint(a, x) evaluates a at all x; interpolate(x, y) returns the
+ * polynomial of degree < n through all (x[i], y[i]), for distinct x.
+ * The subproduct tree is built over a power-of-two number of points (padding
+ * with x = 0), so every level is a single batched NTT over all its nodes.
+ * Time: O(N log N) for inverse, divmod, log, exp, sqrt;
+ * O(N log^2 N) for multipoint and interpolate.
+ * Status: stress-tested
+
+"""
+
+import numpy as np
+from NumberTheoreticTransform import conv_arr, MOD
+from ModSqrt import mod_sqrt
+
+M = np.uint64(MOD)
+_inv = np.zeros(2, dtype=np.uint64)
+
+def _resize(a, n):
+    """Truncate or zero-pad a to length n along the last axis"""
+    if a.shape[-1] >= n:
+        return a[..., :n]
+    res = np.zeros(a.shape[:-1] + (n,), dtype=np.uint64)
+    res[..., :a.shape[-1]] = a
+    return res
+
+def _pow_arr(x, e):
+    """Elementwise x^e mod MOD"""
+    res = np.ones_like(x)
+    while e:
+        if e & 1:
+            res = res * x % M
+        x = x * x % M
+        e >>= 1
+    return res
+
+def _inverses(n):
+    """Modular inverses of 0..n-1 (0 maps to 0), cached"""
+    global _inv
+    if len(_inv) < n:
+        inv = [0, 1] + [0] * (n - 2)
+        for i in range(2, n):
+            inv[i] = (MOD - MOD // i) * inv[MOD % i] % MOD
+        _inv = np.array(inv, dtype=np.uint64)
+    return _inv[:n]
+
+def _deriv(a):
+    return a[..., 1:] * np.arange(1, a.shape[-1], dtype=np.uint64) % M
+
+def _integ(a):
+    res = np.zeros(a.shape[:-1] + (a.shape[-1] + 1,), dtype=np.uint64)
+    res[..., 1:] = a * _inverses(a.shape[-1] + 1)[1:] % M
+    return res
+
+def inverse(a, n):
+    """First n terms of 1/a; works row-wise on 2-D arrays"""
+    a = np.asarray(a, dtype=np.uint64)
+    b = _pow_arr(a[..., :1].copy(), MOD - 2)
+    m = 1
+    while m < n:
+        m *= 2
+        t = conv_arr(conv_arr(_resize(a, m), b)[..., :m], b)[..., :m]
+        b = (2 * _resize(b, m) + M - t) % M
+    return b[..., :n]
+
+def _divmod(a, b):
+    """Row-wise division, b's last coefficient must be nonzero"""
+    m = b.shape[-1]
+    k = a.shape[-1] - m + 1
+    if k <= 0:
+        return np.zeros(a.shape[:-1] + (0,), dtype=np.uint64), _resize(a, m - 1)
+    q = conv_arr(a[..., ::-1][..., :k], inverse(b[..., ::-1], k))[..., :k][..., ::-1]
+    r = (a[..., :m - 1] + M - conv_arr(b, q)[..., :m - 1]) % M
+    return q, r
+
+def poly_divmod(a, b):
+    """Return (q, r) with a = b*q + r and len(r) = len(b) - 1, b nonzero"""
+    a = np.asarray(a, dtype=np.uint64)
+    b = np.asarray(b, dtype=np.uint64)
+    b = b[:np.flatnonzero(b)[-1] + 1]
+    return _divmod(a, b)
+
+def log(a, n):
+    """First n terms of log(a), a[0] must be 1"""
+    a = _resize(np.asarray(a, dtype=np.uint64), n)
+    assert a[0] == 1
+    return _integ(conv_arr(_deriv(a), inverse(a, n))[:n - 1])
+
+def exp(a, n):
+    """First n terms of exp(a), a[0] must be 0"""
+    a = np.asarray(a, dtype=np.uint64)
+    assert not len(a) or a[0] == 0
+    f = np.ones(1, dtype=np.uint64)
+    m = 1
+    while m < n:
+        m *= 2
+        g = (_resize(a, m) + M - log(f, m)) % M
+        g[0] = (g[0] + 1) % M
+        f = conv_arr(f, g)[:m]
+    return _resize(f, n)
+
+def sqrt(a, n):
+    """First n terms of a square root of a, or None if there is none"""
+    a = np.asarray(a, dtype=np.uint64)
+    nz = np.flatnonzero(a[:2 * n])
+    if not len(nz):
+        return np.zeros(n, dtype=np.uint64)
+    k = nz[0]
+    s = mod_sqrt(int(a[k]), MOD)
+    if k % 2 or s < 0:
+        return None
+    b = a[k:]
+    g = np.array([s], dtype=np.uint64)
+    inv2 = M // 2 + 1
+    m = 1
+    while m < n - k // 2:
+        m *= 2
+        g = (_resize(g, m) + conv_arr(_resize(b, m), inverse(g, m))[:m]) % M * inv2 % M
+    return _resize(np.concatenate([np.zeros(k // 2, dtype=np.uint64), g]), n)
+
+def _tree(x):
+    """Subproduct tree levels: tree[l] holds the monic products of 2^l consecutive (X - x_i)"""
+    size = 1 << max(len(x) - 1, 0).bit_length()
+    t = np.zeros((size, 2), dtype=np.uint64)
+    t[:len(x), 0] = (M - x % M) % M
+    t[:, 1] = 1
+    tree = [t]
+    while len(t) > 1:
+        t = conv_arr(t[0::2], t[1::2])
+        tree.append(t)
+    return tree
+
+def _multipoint(a, tree):
+    r = _divmod(a[None, :], tree[-1])[1]
+    for t in reversed(tree[:-1]):
+        r = _divmod(np.repeat(r, 2, axis=0), t)[1]
+    return r[:, 0]
+
+def multipoint(a, x):
+    """Evaluate polynomial a at every point of x"""
+    a = np.asarray(a, dtype=np.uint64)
+    x = np.asarray(x, dtype=np.uint64)
+    if not len(x):
+        return np.zeros(0, dtype=np.uint64)
+    return _multipoint(a, _tree(x))[:len(x)]
+
+def interpolate(x, y):
+    """Coefficients of the polynomial of degree < n through (x[i], y[i])"""
+    x = np.asarray(x, dtype=np.uint64)
+    y = np.asarray(y, dtype=np.uint64) % M
+    n = len(x)
+    if not n:
+        return np.zeros(0, dtype=np.uint64)
+    tree = _tree(x)
+    pad = len(tree[0]) - n
+    # The padding points are all 0, so the root is X^pad * prod(X - x_i)
+    w = np.zeros(len(tree[0]), dtype=np.uint64)
+    w[:n] = y * _pow_arr(_multipoint(_deriv(tree[-1][0, pad:]), tree)[:n], MOD - 2) % M
+    v = w[:, None]
+    for t in tree[:-1]:
+        v = (conv_arr(v[0::2], t[1::2]) + conv_arr(v[1::2], t[0::2])) % M
+    return v[0, pad:]
@@ -6,50 +6,137 @@
  * input from file.
  * Note: In Python, sys.stdin.read() or input() are already quite efficient.
  * For competitive programming, using sys.stdin.buffer can provide speed improvements.
+ * Input is streamed: a file is memory-mapped, anything else (a pipe) is read in
+ * chunks of buffer_size into a fixed buffer, so the input is never held in full.
+ * Tokens are split off a whole chunk at a time; read_ints(n) parses n integers
+ * into an array('q') (or NumPy array), and tokens()/ints() are lazy generators.
+ * The token readers may be mixed freely, but not with read_char.
  * Usage: ./a.py < input.txt
+ *  reader = FastInput(); n = reader.read_int(); a = reader.read_ints(n)
+ *  for x in reader.ints(): ...
  * Time: About 5x as fast as cin/scanf in C++. In Python, use sys.stdin for fast input.
  * Status: tested on SPOJ INTEST, unit tested
 
 """
 
+import mmap
+import re
 import sys
+import numpy as np
+from array import array
+
+_WS = re.compile(rb'[ \t\r\n\v\f]')
+
+def _cut(buf, lo, hi):
+    """One past the last whitespace byte in buf[lo:hi], or lo if there is none"""
+    r = max(buf.rfind(c, lo, hi) for c in (b' ', b'\t', b'\r', b'\n', b'\v', b'\f'))
+    return r + 1 if r >= 0 else lo
 
 class FastInput:
     """
     Fast input reader for competitive programming.
     Uses buffered reading for better performance.
     """
-    def __init__(self, buffer_size=1 << 16):
-        self.buffer = sys.stdin.buffer.read()
+    def __init__(self, buffer_size=1 << 16, f=None):
+        self.f = f or sys.stdin.buffer
+        self.size = buffer_size
+        self.toks = []
+        self.ti = 0
+        try:
+            pos = self.f.tell()
+            self.buf = mmap.mmap(self.f.fileno(), 0, access=mmap.ACCESS_READ)
+            self.pos = pos
+            self.eof = True
+        except (OSError, ValueError):
+            # Not a regular file (or an empty one): read chunks into a fixed buffer
+            self.view = memoryview(bytearray(buffer_size))
+            self.buf = b''
+            self.pos = 0
+            self.eof = False
+
+    def _fill(self):
+        """Append the next chunk of input to the unread part of buf"""
+        k = self.f.readinto(self.view)
+        if not k:
+            self.eof = True
+        self.buf = self.buf[self.pos:] + self.view[:k]
         self.pos = 0
-        self.size = len(self.buffer)
+
+    def _chunk(self):
+        """Next run of whole tokens of about buffer_size bytes, or None at the end"""
+        skip = 0  # bytes after pos already known to hold no whitespace
+        while True:
+            buf, pos = self.buf, self.pos
+            end = min(pos + self.size, len(buf))
+            cut = _cut(buf, pos, end)
+            if cut <= pos and end < len(buf):
+                # A token longer than buffer_size: the chunk is just that token
+                m = _WS.search(buf, max(end, pos + skip))
+                if m:
+                    cut = m.end()
+                else:
+                    skip = len(buf) - pos
+            if cut <= pos and self.eof:
+                cut = len(buf)
+            if cut > pos:
+                self.pos = cut
+                return buf[pos:cut]
+            if self.eof:
+                return None
+            self._fill()
+
+    def _more(self):
+        """Make sure toks has an unread token, return False at the end of input"""
+        while self.ti == len(self.toks):
+            chunk = self._chunk()
+            if chunk is None:
+                return False
+            self.toks = chunk.split()
+            self.ti = 0
+        return True
 
     def read_char(self):
         """Read a single character"""
-        if self.pos >= self.size:
-            return 0
-        c = self.buffer[self.pos]
+        if self.pos >= len(self.buf):
+            if self.eof:
+                return 0
+            self._fill()
+            if self.pos >= len(self.buf):
+                return 0
+        c = self.buf[self.pos]
         self.pos += 1
         return c
 
+    def read_token(self):
+        """Read a whitespace-separated token as bytes, None at the end of input"""
+        if not self._more():
+            return None
+        self.ti += 1
+        return self.toks[self.ti - 1]
+
     def read_int(self):
         """Read an integer from input"""
-        # Skip whitespace and other characters until digit or minus
-        c = self.read_char()
-        while c and c < 40:
-            c = self.read_char()
-
-        if c == ord('-'):
-            return -self.read_int()
-
-        # Read digits
-        a = c
-        c = self.read_char()
-        while c >= 48:
-            a = a * 10 + c - 480
-            c = self.read_char()
-
-        return a - 48
+        return int(self.read_token())
+
+    def read_ints(self, n, numpy=False):
+        """Read n integers into an array('q'), or an int64 NumPy array"""
+        res = array('q')
+        while len(res) < n and self._more():
+            k = min(n - len(res), len(self.toks) - self.ti)
+            res.extend(map(int, self.toks[self.ti:self.ti + k]))
+            self.ti += k
+        assert len(res) == n, "Unexpected end of input"
+        return np.frombuffer(res, dtype=np.int64) if numpy else res
+
+    def tokens(self):
+        """Lazily yield all remaining tokens"""
+        while self._more():
+            self.ti += 1
+            yield self.toks[self.ti - 1]
+
+    def ints(self):
+        """Lazily yield all remaining tokens as integers"""
+        return map(int, self.tokens())
 
 # Simpler Python alternative for fast input
 def fast_input_setup():
@@ -0,0 +1,42 @@
+import sys
+import random
+from DynamicConnectivity import dyn_con
+from UnionFind import UF
+
+def test_dynamic_connectivity():
+    random.seed(18)
+
+    for _ in range(3000):
+        n = random.randint(1, 8)
+        edges = []
+        events = []
+        expected = []
+        for _ in range(random.randint(0, 40)):
+            r = random.randint(0, 9)
+            if r < 4:
+                a, b = random.randint(0, n - 1), random.randint(0, n - 1)
+                events.append(('add', a, b))
+                edges.append((a, b))
+            elif r < 6 and edges:
+                a, b = edges.pop(random.randrange(len(edges)))
+                events.append(('del', b, a) if random.randint(0, 1) else ('del', a, b))
+            else:
+                uf = UF(n)
+                comps = n
+                for a, b in edges:
+                    comps -= uf.join(a, b)
+                if r < 8:
+                    a, b = random.randint(0, n - 1), random.randint(0, n - 1)
+                    events.append(('query', a, b))
+                    expected.append(uf.same_set(a, b))
+                else:
+                    events.append(('count',))
+                    expected.append(comps)
+
+        got = dyn_con(n, events)
+        assert got == expected, f"Expected {expected}, got {got}"
+
+    print("Tests passed!")
+
+if __name__ == "__main__":
+    test_dynamic_connectivity()
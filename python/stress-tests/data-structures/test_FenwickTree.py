@@ -1,6 +1,7 @@
 import sys
 import random
-from FenwickTree import FT
+import numpy as np
+from FenwickTree import FT, RangeFT
 
 def test_fenwick_tree():
     for it in range(100000):
@@ -28,5 +29,58 @@ def test_fenwick_tree():
 
     print("Tests passed!")
 
+def test_fenwick_batch():
+    for it in range(3000):
+        N = random.randint(0, 40)
+        t = [random.randint(-9, 9) for _ in range(N)]
+        fws = [FT(N, t), FT(N, np.array(t, dtype=np.int64))]
+        rfs = [RangeFT(N, t), RangeFT(N, np.array(t, dtype=np.int64))]
+        r = t[:]
+
+        for _ in range(5):
+            pos = [random.randint(0, N - 1) for _ in range(random.randint(0, 10))] if N else []
+            dif = [random.randint(-9, 9) for _ in pos]
+            for fw in fws:
+                fw.update_many(pos, dif)
+            for p, d in zip(pos, dif):
+                t[p] += d
+
+            ls = [random.randint(0, N) for _ in range(random.randint(0, 10))]
+            rs = [random.randint(l, N) for l in ls]
+            xs = [random.randint(-9, 9) for _ in ls]
+            for l, rr, x in zip(ls, rs, xs):
+                rfs[0].update(l, rr, x)
+            rfs[1].update_many(ls, rs, xs)
+            for l, rr, x in zip(ls, rs, xs):
+                for i in range(l, rr):
+                    r[i] += x
+
+            qs = [random.randint(0, N) for _ in range(10)]
+            for fw in fws:
+                assert list(fw.query_many(qs)) == [sum(t[:q]) for q in qs], "FT query_many failed"
+                assert [fw.query(q) for q in qs] == [sum(t[:q]) for q in qs], "FT query failed"
+            for rf in rfs:
+                assert list(rf.query_many(qs)) == [sum(r[:q]) for q in qs], "RangeFT query_many failed"
+                assert [rf.query(q) for q in qs] == [sum(r[:q]) for q in qs], "RangeFT query failed"
+
+    # lower_bound beyond the old fixed 2^25 limit, on a tree that is not a power of two
+    N = (1 << 26) + 5
+    fw = FT(0)
+    fw.s = np.zeros(N, dtype=np.int64)  # pages untouched by updates are never allocated
+    fw.update_many([N - 3, 7], [1, 1])
+    assert fw.lower_bound(1) == 7 and fw.lower_bound(2) == N - 3 and fw.lower_bound(3) == N
+
+    # Compact typed-array storage behaves like the list one, batch calls included
+    for a in ([random.randint(0, 9) for _ in range(50)], np.random.randint(0, 10, 50)):
+        ref, ft = FT(50, list(a)), FT(50, a, 'i')
+        pos = [random.randrange(50) for _ in range(30)]
+        ref.update_many(pos, [1] * 30)
+        ft.update_many(pos, [1] * 30)
+        assert ft.query_many(range(51)) == ref.query_many(range(51)), "typecode FT mismatch"
+        assert all(ft.lower_bound(k) == ref.lower_bound(k) for k in range(0, 600, 7))
+
+    print("Tests passed!")
+
 if __name__ == "__main__":
     test_fenwick_tree()
+    test_fenwick_batch()
@@ -1,6 +1,7 @@
 import sys
 import random
-from FenwickTree2d import FT2
+import numpy as np
+from FenwickTree2d import FT2, FlatFT2
 
 def test_fenwick_tree_2d():
     for _ in range(1000000):
@@ -38,5 +39,38 @@ def test_fenwick_tree_2d():
 
     print("Tests passed!")
 
+def test_flat_fenwick_tree_2d():
+    for _ in range(2000):
+        c = random.randint(0, 30)
+        lim = random.choice([3, 12, 10**9])
+        pts = [(random.randint(-lim, lim), random.randint(-lim, lim)) for _ in range(c)]
+        ft = FlatFT2(np.array([x for x, _ in pts], dtype=np.int64),
+                     np.array([y for _, y in pts], dtype=np.int64))
+        grid = {}
+
+        for _ in range(3):
+            upd = random.sample(pts, random.randint(0, c)) * random.randint(1, 2)
+            difs = [random.randint(-5, 4) for _ in upd]
+            ft.update_many(np.array([x for x, _ in upd], dtype=np.int64),
+                           np.array([y for _, y in upd], dtype=np.int64), np.array(difs))
+            for (x, y), d in zip(upd, difs):
+                grid[x, y] = grid.get((x, y), 0) + d
+
+            qs = []
+            for _ in range(20):
+                xa, xb, ya, yb = (random.randint(-lim - 1, lim + 1) for _ in range(4))
+                qs.append([min(xa, xb), min(ya, yb), max(xa, xb), max(ya, yb)])
+            qs += [[x0, y0, x0 + 1, y0 + 1] for x0, y0 in pts[:5]]
+            x0, y0, x1, y1 = (np.array(v, dtype=np.int64) for v in zip(*qs))
+            got = ft.rect_many(x0, y0, x1, y1)
+            for (a, b, c1, d), g in zip(qs, got):
+                exp = sum(v for (x, y), v in grid.items() if a <= x < c1 and b <= y < d)
+                assert g == exp, f"Rectangle query failed: expected {exp}, got {g}"
+            a, b = qs[0][:2]
+            assert ft.query(a, b) == sum(v for (x, y), v in grid.items() if x < a and y < b)
+
+    print("Tests passed!")
+
 if __name__ == "__main__":
     test_fenwick_tree_2d()
+    test_flat_fenwick_tree_2d()
@@ -0,0 +1,67 @@
+import sys
+import random
+import numpy as np
+from HashMap import IntHashMap
+
+class TinyPad(IntHashMap):
+    # Probes run into the guard slot often, forcing early growth
+    PAD = 2
+
+def check_robin(hm):
+    """Every run of occupied slots is sorted by home slot"""
+    K = list(hm.K)
+    for i in range(1, len(K)):
+        if K[i] != hm.EMPTY and K[i - 1] != hm.EMPTY:
+            assert hm._home(K[i - 1]) <= hm._home(K[i]), "Robin Hood order broken"
+
+def test_int_hash_map():
+    random.seed(23)
+    np.random.seed(23)
+
+    for it in range(400):
+        value = random.choice(['int', 'float'])
+        robin = random.randint(0, 1)
+        hm = random.choice([IntHashMap, TinyPad])(value, robin, random.randint(0, 1), cap=random.randint(1, 40))
+        ref = {}
+        lim = random.choice([5, 100, 10**18])
+        for _ in range(random.randint(1, 30)):
+            r = random.randint(0, 4)
+            if r == 0:
+                x, v = random.randint(-lim, lim), random.randint(-100, 100)
+                hm[x] = v
+                ref[x] = v
+            elif r == 1:
+                x, v = random.randint(-lim, lim), random.randint(-100, 100)
+                hm.add(x, v)
+                ref[x] = ref.get(x, 0) + v
+            elif r == 2:
+                xs = [random.randint(-lim, lim) for _ in range(random.randint(0, 50))]
+                vs = [random.randint(-100, 100) for _ in range(len(xs))]
+                add = random.randint(0, 1)
+                hm.insert_many(np.array(xs, dtype=np.int64), vs, add)
+                for x, v in zip(xs, vs):
+                    ref[x] = ref.get(x, 0) + v if add else v
+            else:
+                xs = [random.randint(-lim, lim) for _ in range(20)]
+                got = hm.get_many(xs, -7)
+                assert got.tolist() == [ref.get(x, -7) for x in xs], "get_many mismatch"
+                for x in xs:
+                    assert (x in hm) == (x in ref), "contains mismatch"
+                    assert hm.get(x, -7) == ref.get(x, -7), "get mismatch"
+            assert len(hm) == len(ref), "size mismatch"
+        keys, vals = hm.items()
+        assert dict(zip(keys.tolist(), vals.tolist())) == ref, "items mismatch"
+        if robin:
+            check_robin(hm)
+
+    # Counting a large batch in one go
+    xs = np.random.randint(0, 10**5, 10**6)
+    hm = IntHashMap(robin=True)
+    hm.insert_many(xs, 1, add=True)
+    u, c = np.unique(xs, return_counts=True)
+    assert (hm.get_many(u) == c).all() and len(hm) == len(u)
+
+    print("Tests passed!")
+
+if __name__ == "__main__":
+    test_int_hash_map()
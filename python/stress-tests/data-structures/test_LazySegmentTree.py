@@ -1,6 +1,6 @@
 import sys
 import random
-from LazySegmentTree import Node, INF
+from LazySegmentTree import Node, LazyTree, SparseLazyTree, INF
 
 class RandomGen:
     def __init__(self):
@@ -57,5 +57,43 @@ def test_lazy_segment_tree():
 
     print("Tests passed!")
 
+def test_flat_lazy_trees():
+    rg = RandomGen()
+
+    for N in range(1, 20):
+        v = [rg.ra() % 100 for _ in range(N)]
+        base = random.randint(-10**18, 10**18)
+        trees = [(LazyTree(N, v), 0), (SparseLazyTree(base - 10**12, base + N + 5), base)]
+        # The sparse tree starts at -INF everywhere
+        for i in range(N):
+            trees[1][0].set(base + i, base + i + 1, v[i])
+
+        for _ in range(5000):
+            i = rg.ra() % (N + 1)
+            j = rg.ra() % (N + 1)
+            if i > j:
+                i, j = j, i
+            x = (rg.ra() % 10) - 5
+
+            r = rg.ra() % 100
+            if r < 30:
+                ma = max(v[i:j], default=-INF)
+                for tr, off in trees:
+                    result = tr.query(off + i, off + j)
+                    assert ma == result, f"Query failed: expected {ma}, got {result} for range [{i}, {j})"
+            elif r < 70:
+                for tr, off in trees:
+                    tr.add(off + i, off + j, x)
+                for k in range(i, j):
+                    v[k] += x
+            else:
+                for tr, off in trees:
+                    tr.set(off + i, off + j, x)
+                for k in range(i, j):
+                    v[k] = x
+
+    print("Tests passed!")
+
 if __name__ == "__main__":
     test_lazy_segment_tree()
+    test_flat_lazy_trees()
@@ -0,0 +1,52 @@
+import sys
+import random
+import numpy as np
+from LineContainer import LineContainer, LiChao
+
+def test_line_container():
+    random.seed(20)
+
+    for _ in range(1000):
+        lim = random.choice([3, 10, 1000])
+        pts = sorted(set(random.randint(-lim, lim) for _ in range(random.randint(1, 20))))
+        lc = LineContainer()
+        lct = LiChao(pts)
+        lines = []
+        for _ in range(random.randint(1, 20)):
+            k, m = random.randint(-lim, lim), random.randint(-lim * lim, lim * lim)
+            lc.add(k, m)
+            lct.add(k, m)
+            lines.append((k, m))
+            x = random.randint(-lim, lim)
+            best = max(k * x + m for k, m in lines)
+            assert lc.query(x) == best, "LineContainer query mismatch"
+            assert list(lc.ps) == [l.p for l in lc.lines], "Breakpoint list out of sync"
+            x = random.choice(pts)
+            assert lct.query(x) == max(k * x + m for k, m in lines), "LiChao query mismatch"
+
+        for xs in (sorted(random.choices(pts, k=15)), random.choices(pts, k=15)):
+            expected = [max(k * x + m for k, m in lines) for x in xs]
+            assert lc.query_many(xs) == expected, "LineContainer query_many mismatch"
+            assert lct.query_many(np.array(xs)).tolist() == expected, "LiChao query_many mismatch"
+
+    # Sorted batch against a big hull must not be quadratic
+    lc = LineContainer()
+    for i in range(10**4):
+        lc.add(i, -i * i)
+    xs = list(range(-10**5, 10**5))
+    res = lc.query_many(xs)
+    for x in random.sample(xs, 50):
+        best = max(i * x - i * i for i in range(10**4))
+        assert res[x + 10**5] == lc.query(x) == best, "Big hull mismatch"
+
+    # A Li Chao tree over no points has nothing to query
+    try:
+        LiChao([])
+        assert False, "LiChao([]) should raise"
+    except ValueError:
+        pass
+
+    print("Tests passed!")
+
+if __name__ == "__main__":
+    test_line_container()
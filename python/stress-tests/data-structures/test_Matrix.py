@@ -0,0 +1,66 @@
+import sys
+import random
+import numpy as np
+from Matrix import Matrix, ModMatrix, mod_mul, mod_pow_many
+
+def naive_pow(d, p, mod):
+    n = len(d)
+    res = [[int(i == j) % mod for j in range(n)] for i in range(n)]
+    base = [row[:] for row in d]
+    while p:
+        if p & 1:
+            res = [[sum(res[i][k] * base[k][j] for k in range(n)) % mod for j in range(n)] for i in range(n)]
+        base = [[sum(base[i][k] * base[k][j] for k in range(n)) % mod for j in range(n)] for i in range(n)]
+        p >>= 1
+    return res
+
+def test_matrix():
+    random.seed(21)
+
+    for _ in range(300):
+        n = random.randint(1, 6)
+        mod = random.choice([1, 2, 7, 10**9 + 7, 998244353, (1 << 31) - 1])
+        d = [[random.randint(0, mod - 1) for _ in range(n)] for _ in range(n)]
+        A = ModMatrix(d, mod)
+        p = random.choice([0, 1, random.randint(0, 100), random.randint(0, 10**18)])
+
+        # Small exponents agree with the plain Matrix class
+        if p <= 100:
+            M = Matrix(n)
+            M.d = d
+            expected = [[x % mod for x in row] for row in (M ** p).d]
+        else:
+            expected = naive_pow(d, p, mod)
+        assert (A ** p).d.tolist() == expected, "ModMatrix pow mismatch"
+
+        v = [random.randint(0, mod - 1) for _ in range(n)]
+        want = [sum(expected[i][j] * v[j] for j in range(n)) % mod for i in range(n)]
+        assert A.pow_vec(p, v).tolist() == want, "pow_vec mismatch"
+        assert A.pow_vec(p, v).tolist() == want, "cached pow_vec mismatch"
+        assert len(A.sq) <= max(p.bit_length(), 1), "Cache past the largest exponent"
+        small = ModMatrix(d, mod, cache_bits=3)
+        assert small.pow_vec(p, v).tolist() == want and len(small.sq) <= 3, "Cache cap broken"
+
+        B = ModMatrix([[random.randint(0, mod - 1) for _ in range(n)] for _ in range(n)], mod)
+        prod = [[sum(d[i][k] * int(B.d[k][j]) for k in range(n)) % mod for j in range(n)] for i in range(n)]
+        assert (A * B).d.tolist() == prod, "ModMatrix product mismatch"
+
+    # Batched exponentiation with a different power per matrix
+    for _ in range(30):
+        n, b = random.randint(1, 5), random.randint(1, 6)
+        mod = random.choice([3, 10**9 + 7, (1 << 31) - 1])
+        As = np.random.randint(0, mod, (b, n, n)).astype(np.int64)
+        ps = [random.randint(0, 10**18) for _ in range(b)]
+        res = mod_pow_many(As, ps, mod)
+        for i in range(b):
+            assert res[i].tolist() == naive_pow(As[i].tolist(), ps[i], mod), "mod_pow_many mismatch"
+
+    # Worst case entries must stay exact for large n
+    mod = (1 << 31) - 1
+    A = np.full((300, 300), mod - 1, dtype=np.int64)
+    assert (mod_mul(A, A, mod) == 300 % mod).all()
+
+    print("Tests passed!")
+
+if __name__ == "__main__":
+    test_matrix()
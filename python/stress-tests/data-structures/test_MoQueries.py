@@ -0,0 +1,110 @@
+import sys
+import random
+import numpy as np
+from MoQueries import hilbert, mo, mo_updates, mo_tree
+
+def test_mo_queries():
+    random.seed(22)
+
+    # The Hilbert curve visits a 2^k grid with unit steps
+    for k in range(5):
+        n = 1 << k
+        xs, ys = np.divmod(np.arange(n * n), n)
+        d = hilbert(np.append(xs, n - 1), np.append(ys, n - 1))[:-1]
+        assert sorted(d.tolist()) == list(range(n * n)), "Hilbert index not a bijection"
+        o = np.argsort(d)
+        assert (np.abs(np.diff(xs[o])) + np.abs(np.diff(ys[o])) == 1).all(), "Hilbert curve jumps"
+
+    for _ in range(300):
+        n = random.randint(1, 30)
+        a = [random.randint(0, 5) for _ in range(n)]
+        Q = []
+        for _ in range(random.randint(0, 30)):
+            l = random.randint(0, n)
+            Q.append((l, random.randint(l, n)))
+
+        cnt = [0] * 6
+        distinct = 0
+        def add(i, end):
+            nonlocal distinct
+            cnt[a[i]] += 1
+            distinct += cnt[a[i]] == 1
+        def rem(i, end):
+            nonlocal distinct
+            cnt[a[i]] -= 1
+            distinct -= cnt[a[i]] == 0
+        def calc():
+            return distinct
+
+        expected = [len(set(a[l:r])) for l, r in Q]
+        for order in ('hilbert', 'block'):
+            assert mo(Q, add, rem, calc, order) == expected, "mo mismatch"
+            cnt = [0] * 6
+            distinct = 0
+
+        # Point assignments, applied by swapping the old and new value
+        U = [[random.randrange(n), random.randint(0, 5)] for _ in range(random.randint(0, 10))]
+        Qt = [(l, r, random.randint(0, len(U))) for l, r in Q]
+        def upd(i, L, R):
+            p, v = U[i]
+            if L <= p < R:
+                rem(p, 0)
+                a[p], U[i][1] = v, a[p]
+                add(p, 0)
+            else:
+                a[p], U[i][1] = v, a[p]
+        b0, U0 = a[:], [u[:] for u in U]
+        expected = []
+        for l, r, t in Qt:
+            b = b0[:]
+            for p, v in U0[:t]:
+                b[p] = v
+            expected.append(len(set(b[l:r])))
+        assert mo_updates(Qt, len(U), add, rem, upd, calc) == expected, "mo_updates mismatch"
+
+    for _ in range(300):
+        n = random.randint(1, 15)
+        par = [-1] + [random.randrange(i) for i in range(1, n)]
+        ed = [[] for _ in range(n)]
+        for i in range(1, n):
+            ed[i].append(par[i])
+            ed[par[i]].append(i)
+        Q = [(random.randrange(n), random.randrange(n)) for _ in range(random.randint(0, 15))]
+        S = set()
+        def tadd(i, end):
+            assert i not in S
+            S.add(i)
+        def tdel(i, end):
+            assert i in S
+            S.remove(i)
+        def anc(x):
+            r = []
+            while x != -1:
+                r.append(x)
+                x = par[x]
+            return r
+        expected = []
+        for u, v in Q:
+            A, B = anc(u), anc(v)
+            c = next(x for x in A if x in B)
+            expected.append(set(A[:A.index(c) + 1]) | set(B[:B.index(c) + 1]))
+        res = mo_tree(Q, ed, tadd, tdel, lambda: set(S), 0, random.choice(['hilbert', 'block']))
+        assert res == expected, "mo_tree path mismatch"
+
+    # Deep path must not hit the recursion limit
+    n = 10**5
+    ed = [[] for _ in range(n)]
+    for i in range(1, n):
+        ed[i].append(i - 1)
+        ed[i - 1].append(i)
+    cnt = [0]
+    def inc(i, end):
+        cnt[0] += 1
+    def dec(i, end):
+        cnt[0] -= 1
+    assert mo_tree([(0, n - 1), (5, 7)], ed, inc, dec, lambda: cnt[0]) == [n, 3]
+
+    print("Tests passed!")
+
+if __name__ == "__main__":
+    test_mo_queries()
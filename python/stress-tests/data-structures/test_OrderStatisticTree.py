@@ -0,0 +1,79 @@
+import sys
+import random
+import bisect
+from OrderStatisticTree import OrderStatisticTree, example
+
+def test_order_statistic_tree():
+    random.seed(25)
+    example()
+
+    for _ in range(500):
+        U = random.randint(1, 50)
+        init = [random.randrange(U) for _ in range(random.randint(0, 10))]
+        trees = [OrderStatisticTree(None, init), OrderStatisticTree(U, init)]
+        ref = sorted(set(init))
+
+        for _ in range(50):
+            r = random.randint(0, 3)
+            x = random.randrange(U)
+            if r == 0:
+                for t in trees:
+                    t.insert(x)
+                if x not in ref:
+                    bisect.insort(ref, x)
+            elif r == 1:
+                x = random.randint(-2, U + 2)
+                for t in trees:
+                    t.remove(x)
+                if x in ref:
+                    ref.remove(x)
+            else:
+                k = random.randint(-1, len(ref))
+                x = random.randint(-2, U + 2)
+                i = bisect.bisect_left(ref, x)
+                for t in trees:
+                    assert len(t) == len(ref), "size mismatch"
+                    assert t.find_by_order(k) == (ref[k] if 0 <= k < len(ref) else None), "find_by_order mismatch"
+                    assert t.order_of_key(x) == i, "order_of_key mismatch"
+                    assert t.lower_bound(x) == (ref[i] if i < len(ref) else None), "lower_bound mismatch"
+                    assert (x in t) == (x in ref), "contains mismatch"
+
+    # Elements outside the universe are rejected, not wrapped around
+    for bad in (-1, 10, 10**6):
+        try:
+            OrderStatisticTree(10).insert(bad)
+            assert False, "Out of range insert accepted"
+        except ValueError:
+            pass
+        try:
+            OrderStatisticTree(10, [3, bad])
+            assert False, "Out of range bulk load accepted"
+        except ValueError:
+            pass
+
+    # Fractional queries round to the right integer boundary; fractional elements are rejected
+    for _ in range(200):
+        U = random.randint(1, 20)
+        init = [random.randrange(U) for _ in range(random.randint(0, 10))]
+        trees = [OrderStatisticTree(None, init), OrderStatisticTree(U, init)]
+        ref = sorted(set(init))
+        x = random.randint(-4, 4 * U + 4) / 4
+        i = bisect.bisect_left(ref, x)
+        for t in trees:
+            assert t.order_of_key(x) == i, "fractional order_of_key mismatch"
+            assert t.lower_bound(x) == (ref[i] if i < len(ref) else None), "fractional lower_bound mismatch"
+            assert (x in t) == (x in ref), "fractional contains mismatch"
+        t = trees[1]
+        t.remove(x)
+        if x != int(x):
+            assert len(t) == len(ref), "fractional remove changed the set"
+            try:
+                t.insert(x)
+                assert False, "Fractional insert accepted"
+            except ValueError:
+                pass
+
+    print("Tests passed!")
+
+if __name__ == "__main__":
+    test_order_statistic_tree()
@@ -0,0 +1,57 @@
+import sys
+import random
+from PersistentSegmentTree import PersistentTree
+
+def live_nodes(t, roots):
+    """Nodes reachable from any of roots"""
+    seen = set()
+    stack = list(roots)
+    while stack:
+        k = stack.pop()
+        if k not in seen:
+            seen.add(k)
+            if t.l[k]:
+                stack += [t.l[k], t.r[k]]
+    return len(seen)
+
+def test_persistent_segment_tree():
+    random.seed(13)
+    for n in range(1, 20):
+        v = [random.randint(-100, 100) for _ in range(n)]
+        t = PersistentTree(v)
+        versions = {t.root: v}
+
+        for it in range(2000):
+            root = random.choice(list(versions))
+            r = random.randint(0, 99)
+            if r < 40:
+                i = random.randint(0, n)
+                j = random.randint(i, n)
+                assert t.query(root, i, j) == sum(versions[root][i:j]), "Query failed"
+            elif r < 75 or len(versions) == 1:
+                i = random.randint(0, n - 1)
+                x = random.randint(-100, 100)
+                w = versions[root][:]
+                w[i] = x
+                new = t.update(root, i, x)
+                assert new not in versions, "Live node reused"
+                versions[new] = w
+            else:
+                t.release(root)
+                del versions[root]
+
+            if it % 50 == 0:
+                # Exactly the nodes no version can reach are free
+                assert len(t.s) - 1 - len(t.free) == live_nodes(t, versions), "Bad free list"
+
+        for root, w in versions.items():
+            for i in range(n):
+                assert t.query(root, i, i + 1) == w[i]
+        for root in list(versions):
+            t.release(root)
+        assert len(t.free) == len(t.s) - 1, "Nodes leaked"
+
+    print("Tests passed!")
+
+if __name__ == "__main__":
+    test_persistent_segment_tree()
@@ -1,6 +1,7 @@
 import sys
 import random
-from RMQ import RMQ
+import numpy as np
+from RMQ import RMQ, BlockRMQ
 
 def test_rmq():
     random.seed(2)
@@ -19,5 +20,37 @@ def test_rmq():
 
     print("Tests passed!")
 
+def test_rmq_ops():
+    random.seed(3)
+    ops = {'min': lambda w: min(w), 'max': lambda w: max(w),
+           'argmin': lambda w: w.index(min(w)), 'argmax': lambda w: w.index(max(w))}
+    for N in list(range(1, 80)) + [1000, 4099]:
+        v = [random.randint(0, random.choice([2, N])) for _ in range(N)]
+        a = [random.randint(0, N - 1) for _ in range(300)]
+        b = [random.randint(i + 1, N) for i in a]
+        for op, f in ops.items():
+            expected = [f(v[i:j]) for i, j in zip(a, b)]
+            off = [0 if op in ('min', 'max') else i for i in a]
+            expected = [e + o for e, o in zip(expected, off)]
+            for rmq in (RMQ(v, op), BlockRMQ(np.array(v), op)):
+                got = rmq.query_many(a, b)
+                assert list(got) == expected, f"{op} query_many failed for N = {N}"
+                assert all(rmq.query(i, j) == e for i, j, e in zip(a[:20], b[:20], expected))
+
+    # Non-numeric values use the generic list-based table
+    for N in range(1, 40):
+        for v in ([(random.randint(0, 3), random.randint(0, 3)) for _ in range(N)],
+                  [random.choice(['a', 'ab', 'b', 'ba']) for _ in range(N)]):
+            a = [random.randint(0, N - 1) for _ in range(50)]
+            b = [random.randint(i + 1, N) for i in a]
+            for op, f in ops.items():
+                expected = [f(v[i:j]) + i if op in ('argmin', 'argmax') else f(v[i:j]) for i, j in zip(a, b)]
+                rmq = RMQ(v, op)
+                assert rmq.query_many(a, b) == expected, f"generic {op} failed"
+                assert all(rmq.query(i, j) == e for i, j, e in zip(a, b, expected))
+
+    print("Tests passed!")
+
 if __name__ == "__main__":
     test_rmq()
+    test_rmq_ops()
@@ -1,6 +1,9 @@
 import sys
 import random
-from SegmentTree import Tree
+import math
+from functools import reduce
+import numpy as np
+from SegmentTree import Tree, MonoidTree
 
 def test_segment_tree():
     # Test empty tree
@@ -32,5 +35,50 @@ def test_segment_tree():
 
     print("Tests passed!")
 
+def test_monoid_tree():
+    random.seed(11)
+    ops = {'sum': lambda a, b: a + b, 'min': min, 'max': max,
+           'gcd': math.gcd, 'xor': lambda a, b: a ^ b}
+    units = {'sum': 0, 'min': np.iinfo(np.int64).max, 'max': np.iinfo(np.int64).min,
+             'gcd': 0, 'xor': 0}
+
+    for n in range(0, 40):
+        for op in list(ops) + ['concat']:
+            if op == 'concat':
+                # Non-commutative custom monoid
+                v = [chr(97 + random.randint(0, 25)) for _ in range(n)]
+                tr = MonoidTree(v, lambda a, b: a + b, '')
+                f, unit = (lambda a, b: a + b), ''
+                val = lambda: chr(97 + random.randint(0, 25))
+            else:
+                v = [random.randint(-50, 50) for _ in range(n)]
+                if op == 'gcd':
+                    v = [abs(x) for x in v]
+                tr = MonoidTree(np.array(v, dtype=np.int64), op)
+                f, unit = ops[op], units[op]
+                val = lambda: random.randint(0, 50)
+
+            for _ in range(20):
+                ls = [random.randint(0, n) for _ in range(30)]
+                rs = [random.randint(l, n) for l in ls]
+                expected = [reduce(f, v[l:r], unit) for l, r in zip(ls, rs)]
+                got = tr.query_many(ls, rs)
+                assert list(got) == expected, f"{op}: query_many failed"
+                assert all(tr.query(l, r) == x for l, r, x in zip(ls, rs, expected))
+
+                if n:
+                    idx = [random.randint(0, n - 1) for _ in range(random.randint(0, 5))]
+                    vals = [val() for _ in idx]
+                    if random.randint(0, 1):
+                        tr.update_many(idx, vals)
+                    else:
+                        for i, x in zip(idx, vals):
+                            tr.update(i, x)
+                    for i, x in zip(idx, vals):
+                        v[i] = x
+
+    print("Tests passed!")
+
 if __name__ == "__main__":
     test_segment_tree()
+    test_monoid_tree()
@@ -1,6 +1,6 @@
 import sys
 import random
-from Treap import Node, cnt, merge, split, move, each
+from Treap import Node, cnt, merge, split, move, each, ArrayTreap
 
 def split2(n, v):
     """Split by value instead of count"""
@@ -74,5 +74,54 @@ def test_treap():
 
     print("Tests passed!")
 
+def test_array_treap():
+    random.seed(19)
+
+    for _ in range(300):
+        tr = ArrayTreap()
+        exp = sorted(random.randint(-50, 50) for _ in range(random.randint(0, 30)))
+        t = tr.build(exp)
+        for _ in range(50):
+            n = len(exp)
+            assert tr.cnt(t) == n
+            i = random.randint(0, n)
+            j = random.randint(i, n)
+            r = random.randint(0, 5)
+            if r == 0:
+                x = random.randint(-50, 50)
+                t = tr.ins(t, i, x)
+                exp.insert(i, x)
+            elif r == 1 and n:
+                i = min(i, n - 1)
+                t = tr.erase(t, i)
+                del exp[i]
+            elif r == 2:
+                t = tr.reverse(t, i, j)
+                exp[i:j] = exp[i:j][::-1]
+            elif r == 3:
+                x = random.randint(-5, 5)
+                t = tr.add(t, i, j, x)
+                exp[i:j] = [v + x for v in exp[i:j]]
+            else:
+                a, b = tr.split(t, i)
+                assert tr.values(a) == exp[:i] and tr.values(b) == exp[i:]
+                t = tr.merge(a, b)
+            assert tr.values(t) == exp, "ArrayTreap mismatch"
+        # Freed nodes are reused
+        used = len(tr.c)
+        tr.free(t)
+        t = tr.build(range(len(exp)))
+        assert len(tr.c) == used and tr.values(t) == list(range(len(exp)))
+
+    # Deep operations must not recurse
+    tr = ArrayTreap()
+    t = tr.build(range(10**5))
+    t = tr.reverse(t, 10, 10**5 - 10)
+    v = tr.values(t)
+    assert v[:10] == list(range(10)) and v[10] == 10**5 - 11
+
+    print("Tests passed!")
+
 if __name__ == "__main__":
     test_treap()
+    test_array_treap()
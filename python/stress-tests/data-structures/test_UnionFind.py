@@ -0,0 +1,52 @@
+import sys
+import random
+import numpy as np
+from UnionFind import UF
+
+def naive_roots(comp, n):
+    """Canonical labels (smallest member) of the sets in comp"""
+    return [min(v for v in range(n) if comp[v] == comp[u]) for u in range(n)]
+
+def test_union_find():
+    random.seed(17)
+
+    for _ in range(2000):
+        n = random.randint(1, 30)
+        uf = UF(n)
+        comp = list(range(n))
+
+        for _ in range(4):
+            a = [random.randint(0, n - 1) for _ in range(random.randint(0, 2 * n))]
+            b = [random.randint(0, n - 1) for _ in range(len(a))]
+            if random.randint(0, 1):
+                merged = uf.join_many(np.array(a, dtype=np.int64), b)
+            else:
+                merged = [uf.join(x, y) for x, y in zip(a, b)]
+            for (x, y), m in zip(zip(a, b), merged):
+                assert bool(m) == (comp[x] != comp[y]), "Wrong join result"
+                if comp[x] != comp[y]:
+                    old = comp[y]
+                    comp = [comp[x] if c == old else c for c in comp]
+
+            canon = naive_roots(comp, n)
+            xs = [random.randint(0, n - 1) for _ in range(10)]
+            roots = uf.find_many(xs)
+            assert all(uf.find(x) == r for x, r in zip(xs, roots)), "find_many mismatch"
+            lab = uf.labels()
+            for u in range(n):
+                for v in range(n):
+                    assert (lab[u] == lab[v]) == (canon[u] == canon[v]), "Bad labels"
+                assert uf.size(u) == comp.count(comp[u]), "Bad size"
+
+    # A long chain must not hit the recursion limit
+    n = 10**5
+    uf = UF(n)
+    for i in range(n - 1):
+        uf.e[i] = i + 1
+    uf.e[n - 1] = -n
+    assert uf.find(0) == n - 1 and uf.size(0) == n
+
+    print("Tests passed!")
+
+if __name__ == "__main__":
+    test_union_find()
@@ -0,0 +1,52 @@
+import sys
+import random
+import numpy as np
+from WaveletMatrix import WaveletMatrix
+
+def test_wavelet_matrix():
+    random.seed(24)
+    np.random.seed(24)
+
+    for _ in range(500):
+        n = random.randint(0, 40)
+        lim = random.choice([0, 1, 3, 10, 10**12])
+        a = [random.randint(-lim, lim) for _ in range(n)]
+        wm = WaveletMatrix(a)
+
+        for _ in range(20):
+            l = random.randint(0, n)
+            r = random.randint(l, n)
+            x, y = random.randint(-lim - 1, lim + 1), random.randint(-lim - 1, lim + 1)
+            part = sorted(a[l:r])
+            assert wm.count_less(l, r, x) == sum(v < x for v in part), "count_less mismatch"
+            assert wm.count(l, r, x, y) == sum(x <= v < y for v in part), "count mismatch"
+            if l < r:
+                k = random.randrange(r - l)
+                assert wm.kth(l, r, k) == part[k], "kth mismatch"
+            v = random.choice(a) if a and random.randint(0, 3) else x
+            occ = [i for i in range(n) if a[i] == v]
+            k = random.randint(0, len(occ))
+            assert wm.select(v, k) == (occ[k] if k < len(occ) else -1), "select mismatch"
+
+        # Batch versions agree with the scalar ones
+        if n:
+            ls = np.random.randint(0, n, 30)
+            rs = ls + 1 + (np.random.randint(0, 10**9, 30) % (n - ls))
+            ks = np.random.randint(0, 10**9, 30) % (rs - ls)
+            xs = np.random.randint(-lim - 1, lim + 2, 30)
+            assert wm.kth_many(ls, rs, ks).tolist() == [sorted(a[l:r])[k] for l, r, k in zip(ls, rs, ks)]
+            assert wm.count_less_many(ls, rs, xs).tolist() == [sum(v < x for v in a[l:r]) for l, r, x in zip(ls, rs, xs)]
+
+    # Positions past 64 bits and many levels
+    a = np.random.randint(0, 10**6, 5000)
+    wm = WaveletMatrix(a)
+    l, r = 123, 4567
+    assert wm.kth(l, r, 1000) == np.sort(a[l:r])[1000]
+    assert wm.count_less(l, r, 500000) == (a[l:r] < 500000).sum()
+    v = a[4000]
+    assert wm.select(v, (a[:4000] == v).sum()) == 4000
+
+    print("Tests passed!")
+
+if __name__ == "__main__":
+    test_wavelet_matrix()
@@ -0,0 +1,73 @@
+import sys
+import random
+import numpy as np
+import BiconnectedComponents
+from BiconnectedComponents import bicomp_ids, bicomps
+from UnionFind import UF
+
+def brute(n, edges):
+    """Edge classes: edges on a common simple cycle, found by trying every edge subset"""
+    m = len(edges)
+    uf = UF(m)
+    on_cycle = [False] * m
+    for mask in range(1, 1 << m):
+        sub = [i for i in range(m) if mask >> i & 1]
+        deg = [0] * n
+        cu = UF(n)
+        for i in sub:
+            a, b = edges[i]
+            deg[a] += 1
+            deg[b] += 1
+            cu.join(a, b)
+        verts = [v for v in range(n) if deg[v]]
+        if all(deg[v] == 2 for v in verts) and len({cu.find(v) for v in verts}) == 1:
+            for i in sub:
+                on_cycle[i] = True
+                uf.join(sub[0], i)
+    return [uf.find(i) if on_cycle[i] else -1 for i in range(m)]
+
+def same_partition(x, y):
+    return all((x[i] == x[j]) == (y[i] == y[j]) and (x[i] < 0) == (y[i] < 0)
+               for i in range(len(x)) for j in range(len(x)))
+
+def test_biconnected_components():
+    random.seed(9)
+
+    for _ in range(1500):
+        n = random.randint(1, 7)
+        edges = []
+        for _ in range(random.randint(0, min(9, 3 * n))):
+            a, b = random.sample(range(n), 2) if n > 1 else (0, 0)
+            if a != b:
+                edges.append((a, b))
+        expected = brute(n, edges)
+        ea, eb = [a for a, _ in edges], [b for _, b in edges]
+
+        comp, nc = bicomp_ids(n, ea, eb)
+        assert same_partition(list(comp), expected), "bicomp_ids mismatch"
+        assert nc == len({c for c in expected if c >= 0}), "Wrong component count"
+        comp, _ = bicomp_ids(n, np.array(ea, dtype=np.int64), np.array(eb, dtype=np.int64))
+        assert same_partition(list(comp), expected), "bicomp_ids mismatch on arrays"
+
+        BiconnectedComponents.ed = [[] for _ in range(n)]
+        for i, (a, b) in enumerate(edges):
+            BiconnectedComponents.ed[a].append((b, i))
+            BiconnectedComponents.ed[b].append((a, i))
+        got = [-1] * len(edges)
+        cnt = [0]
+        def f(es):
+            for e in es:
+                got[e] = cnt[0]
+            cnt[0] += 1
+        bicomps(f)
+        assert same_partition(got, expected), "bicomps mismatch"
+
+    # A long cycle must not hit the recursion limit
+    n = 10**5
+    comp, nc = bicomp_ids(n, list(range(n)), [(i + 1) % n for i in range(n)])
+    assert nc == 1 and min(comp) == 0
+
+    print("Tests passed!")
+
+if __name__ == "__main__":
+    test_biconnected_components()
@@ -1,6 +1,7 @@
 import sys
 import random
 from graph.Dinic import Dinic
+from graph.DinicCSR import DinicCSR
 
 def edmonds_karp(graph, s, t):
     """Simple EdmondsKarp for reference"""
@@ -115,5 +116,62 @@ def test_dinic():
 
     print("Tests passed!")
 
+def test_dinic_csr():
+    random.seed(321)
+
+    for _ in range(20000):
+        n = 2 + random.randint(0, 9)
+        s = random.randint(0, n - 1)
+        t = random.randint(0, n - 2)
+        if t >= s:
+            t += 1
+
+        dinic = Dinic(n)
+        csr = DinicCSR(n)
+        edges = []
+        total = 0
+        m = random.randint(0, 39)
+        for i in range(m):
+            a = random.randint(0, n - 1)
+            b = random.randint(0, n - 1)
+            c = random.randint(0, 3)
+            d = random.randint(0, 2) if random.randint(0, 3) == 0 else 0
+            dinic.add_edge(a, b, c, d)
+            csr.add_edge(a, b, c, d)
+            edges.append((a, b))
+            # Edges added after a solve are packed in by the next freeze
+            if i == m // 2 and random.randint(0, 1):
+                total += csr.calc(s, t)
+
+        flow = dinic.calc(s, t)
+        total += csr.calc(s, t)
+        assert total == flow, f"Flow mismatch: Dinic={flow}, DinicCSR={total}"
+
+        flows = [0] * n
+        for i, (a, b) in enumerate(edges):
+            flows[a] += csr.edge_flow(i)
+            flows[b] -= csr.edge_flow(i)
+        assert flows[s] == flow, "Source flow mismatch"
+        for i in range(n):
+            if i != s and i != t:
+                assert flows[i] == 0, f"Flow conservation violated at node {i}"
+        assert csr.left_of_min_cut(s) and not csr.left_of_min_cut(t), "Bad cut"
+
+        across_cut = 0
+        for i, (a, b) in enumerate(edges):
+            if csr.left_of_min_cut(a) != csr.left_of_min_cut(b):
+                across_cut += csr.edge_flow(i) if csr.left_of_min_cut(a) else -csr.edge_flow(i)
+        assert across_cut == flow, "Min cut != max flow"
+
+    # Long path: recursion depth would exceed the default limit
+    n = 20000
+    csr = DinicCSR(n)
+    for i in range(n - 1):
+        csr.add_edge(i, i + 1, 5)
+    assert csr.calc(0, n - 1) == 5
+
+    print("Tests passed!")
+
 if __name__ == "__main__":
     test_dinic()
+    test_dinic_csr()
@@ -0,0 +1,57 @@
+import sys
+import random
+from graph.MinCostFlowScaling import MCMFScaling
+from graph.MinCostMaxFlow import MCMF
+
+def test_min_cost_flow_scaling():
+    random.seed(8)
+
+    for _ in range(3000):
+        n = 2 + random.randint(0, 8)
+        s = random.randint(0, n - 1)
+        t = random.randint(0, n - 2)
+        if t >= s:
+            t += 1
+        # With negative costs all edges go from a lower to a higher node, so there are no cycles
+        neg = random.randint(0, 1)
+
+        ref = MCMF(n)
+        mcs = [MCMFScaling(n) for _ in range(3)]
+        edges = []
+        for _ in range(random.randint(0, 30)):
+            a = random.randint(0, n - 1)
+            b = random.randint(0, n - 1)
+            if neg:
+                a, b = min(a, b), max(a, b)
+            c = random.randint(0, 1 << random.randint(0, 10))
+            w = random.randint(-20 if neg else 0, 20)
+            ref.add_edge(a, b, c, w)
+            edges.append((a, b, c, w, [mc.add_edge(a, b, c, w) for mc in mcs]))
+        if neg:
+            ref.setpi(s)
+        expected = ref.maxflow(s, t)
+
+        for k, sp in enumerate(('heap', 'dense', 'radix')):
+            mc = mcs[k]
+            res = mc.maxflow(s, t, sp)
+            assert res == expected, f"{sp}: expected {expected}, got {res}"
+
+            # The reported edge flows must form a feasible flow of that value and cost
+            ex = [0] * n
+            cost = 0
+            for a, b, c, w, ids in edges:
+                if ids[0] is None:
+                    continue
+                f = mc.edge_flow(ids[k])
+                assert 0 <= f <= c, "Capacity violated"
+                ex[a] -= f
+                ex[b] += f
+                cost += f * w
+            assert cost == expected[1], "Edge flows do not match the cost"
+            for v in range(n):
+                assert ex[v] == (expected[0] if v == t else -expected[0] if v == s else 0)
+
+    print("Tests passed!")
+
+if __name__ == "__main__":
+    test_min_cost_flow_scaling()
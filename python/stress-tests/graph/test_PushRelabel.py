@@ -0,0 +1,66 @@
+import sys
+import random
+from graph.PushRelabel import PushRelabel
+from graph.Dinic import Dinic
+
+def check_flow(pr, n, s, t, flow):
+    """Verify capacities and conservation of the flow stored in pr"""
+    ex = [0] * n
+    for u in range(n):
+        for e in pr.g[u]:
+            assert e.c >= 0, "Negative residual capacity"
+            ex[e.dest] += e.f
+    for u in range(n):
+        if u != s and u != t:
+            assert ex[u] == 0, f"Flow conservation violated at node {u}"
+    assert ex[t] == flow, "Sink flow mismatch"
+
+def test_push_relabel():
+    random.seed(77)
+
+    for _ in range(5000):
+        n = 2 + random.randint(0, 7)
+        s = random.randint(0, n - 1)
+        t = random.randint(0, n - 2)
+        if t >= s:
+            t += 1
+
+        pr = PushRelabel(n)
+        dinic = Dinic(n)
+        edges = []
+        for _ in range(random.randint(0, 25)):
+            a = random.randint(0, n - 1)
+            b = random.randint(0, n - 1)
+            c = random.randint(0, 5)
+            d = random.randint(0, 2) if random.randint(0, 3) == 0 else 0
+            edges.append([a, b, c, d, pr.add_edge(a, b, c, d), dinic.add_edge(a, b, c, d)])
+
+        flow = pr.calc(s, t)
+        assert flow == dinic.calc(s, t), "Flow mismatch"
+        check_flow(pr, n, s, t, flow)
+
+        # Change capacities on the solved instances and compare against a cold solve
+        for _ in range(5):
+            if not edges:
+                break
+            i = random.randrange(len(edges))
+            edges[i][2] = random.randint(0, 5)
+            a, b, c, d, e_pr, e_dinic = edges[i]
+            if e_pr is not None:
+                flow = pr.set_cap(e_pr, c, s, t)
+            f2 = dinic.set_cap(e_dinic, c, s, t)
+
+            cold = Dinic(n)
+            for a, b, c, d, _, _ in edges:
+                cold.add_edge(a, b, c, d)
+            expected = cold.calc(s, t)
+            assert flow == expected, f"PushRelabel re-solve: expected {expected}, got {flow}"
+            assert f2 == expected, f"Dinic re-solve: expected {expected}, got {f2}"
+            check_flow(pr, n, s, t, flow)
+            assert pr.left_of_min_cut(s) and not pr.left_of_min_cut(t), "Bad cut"
+            assert dinic.left_of_min_cut(s) and not dinic.left_of_min_cut(t), "Bad cut"
+
+    print("Tests passed!")
+
+if __name__ == "__main__":
+    test_push_relabel()
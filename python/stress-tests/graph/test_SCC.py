@@ -1,6 +1,8 @@
 import sys
 import random
-from graph.SCC import scc, comp, ncomps
+from array import array
+from graph import SCC
+from graph.SCC import scc, csr, tarjan
 
 def old_scc(g):
     """Old reference implementation for testing"""
@@ -41,8 +43,6 @@ def old_scc(g):
     return comp_old
 
 def test_scc():
-    global comp, ncomps
-
     r = 1
     for N in range(5):
         adj = [[] for _ in range(N)]
@@ -66,6 +66,7 @@ def test_scc():
             compsize = [0] * N
 
             scc(adj, lambda v: None)
+            comp, ncomps = SCC.comp, SCC.ncomps
 
             # Compare results
             for i in range(N):
@@ -95,6 +96,17 @@ def test_scc():
 
             count += 1
 
+    # Long paths and cycles must not hit the recursion limit
+    n = 200000
+    ea = array('i', range(n - 1))
+    eb = array('i', range(1, n))
+    comp, ncomps = tarjan(n, *csr(n, ea, eb)[:2])
+    assert ncomps == n and all(comp[i] == n - 1 - i for i in range(n))
+    ea.append(n - 1)
+    eb.append(0)
+    comp, ncomps = tarjan(n, *csr(n, ea, eb)[:2])
+    assert ncomps == 1 and not any(comp)
+
     print("Tests passed!")
 
 if __name__ == "__main__":
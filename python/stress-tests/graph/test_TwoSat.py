@@ -0,0 +1,54 @@
+import sys
+import random
+from graph.TwoSat import TwoSat
+
+def brute(n, clauses):
+    """Some satisfying assignment as a bitmask, or None"""
+    for m in range(1 << n):
+        val = lambda x: (m >> x) & 1 if x >= 0 else 1 - ((m >> ~x) & 1)
+        if all(val(a) or val(b) for a, b in clauses):
+            return m
+    return None
+
+def test_two_sat():
+    random.seed(9)
+
+    for _ in range(3000):
+        n = random.randint(1, 8)
+        ts = TwoSat(n)
+        clauses = []
+        lit = lambda: random.randint(0, n - 1) ^ (-random.randint(0, 1))
+        for _ in range(random.randint(0, 2 * n)):
+            a, b = lit(), lit()
+            ts.either(a, b)
+            clauses.append((a, b))
+        if random.randint(0, 3) == 0:
+            x = lit()
+            ts.set_value(x)
+            clauses.append((x, x))
+        if random.randint(0, 3) == 0:
+            li = random.sample(range(n), random.randint(0, n))
+            li = [x ^ -random.randint(0, 1) for x in li]
+            ts.at_most_one(li)
+            clauses += [(~a, ~b) for i, a in enumerate(li) for b in li[:i]]
+
+        ok = ts.solve()
+        assert ok == (brute(n, clauses) is not None), "Wrong satisfiability"
+        if ok:
+            val = lambda x: ts.values[x] if x >= 0 else 1 - ts.values[~x]
+            assert all(val(a) or val(b) for a, b in clauses), "Bad assignment"
+
+    # A long implication chain x0 -> x1 -> ... -> x(n-1), with x0 true
+    n = 200000
+    ts = TwoSat(n)
+    for i in range(n - 1):
+        ts.either(~i, i + 1)
+    ts.set_value(0)
+    assert ts.solve() and all(ts.values), "Chain not propagated"
+    ts.set_value(~(n - 1))
+    assert not ts.solve(), "Contradiction not found"
+
+    print("Tests passed!")
+
+if __name__ == "__main__":
+    test_two_sat()
@@ -2,10 +2,12 @@ import sys
 import random
 import math
 import cmath
-from numerical.FastFourierTransform import fft, conv
+import numpy as np
+from numerical.FastFourierTransform import fft, conv, fft_arr, conv_arr
 
 def test_fft():
     random.seed(42)
+    np.random.seed(42)
 
     # Test basic FFT
     n = 8
@@ -64,6 +66,31 @@ def test_fft():
     for i in range(len(expected)):
         assert abs(C[i] - expected[i]) < 1e-6
 
+    # fft_arr against a direct DFT, growing the roots cache size by size
+    for L in range(8):
+        n = 1 << L
+        a = np.random.uniform(-5, 5, n) + 1j * np.random.uniform(-5, 5, n)
+        x = np.arange(n)
+        expected = np.exp(2j * np.pi * np.outer(x, x) / n) @ a
+        assert np.allclose(fft_arr(a.copy()), expected), f"fft_arr failed for n={n}"
+
+    # conv_arr against naive convolution: length 1, powers of two and others
+    for n1, n2 in [(1, 1), (1, 7), (2, 2), (4, 4), (8, 16), (3, 5), (7, 9), (64, 1), (33, 31)]:
+        A = np.random.randint(-10, 11, n1).astype(np.float64)
+        B = np.random.randint(-10, 11, n2).astype(np.float64)
+        C = conv_arr(A, B)
+        assert len(C) == n1 + n2 - 1 and np.allclose(C, np.convolve(A, B)), \
+            f"conv_arr failed for lengths {n1}, {n2}"
+    assert len(conv_arr(np.zeros(0), np.ones(3))) == 0
+
+    # fft_arr works in place, so strided views are rejected instead of silently copied
+    a = np.zeros(16, dtype=np.complex128)
+    try:
+        fft_arr(a[::2])
+        assert False, "fft_arr accepted a non-contiguous array"
+    except AssertionError as e:
+        assert "contiguous" in str(e)
+
     print("Tests passed!")
 
 if __name__ == "__main__":
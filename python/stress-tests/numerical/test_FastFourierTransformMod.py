@@ -0,0 +1,45 @@
+import sys
+import random
+from numerical.FastFourierTransformMod import conv_mod
+
+def simple_conv(a, b, mod):
+    if not a or not b:
+        return []
+    c = [0] * (len(a) + len(b) - 1)
+    for i in range(len(a)):
+        for j in range(len(b)):
+            c[i + j] = (c[i + j] + a[i] * b[j]) % mod
+    return c
+
+def test_fft_mod():
+    random.seed(3)
+
+    for mod in [1000000007, 998244353, 2, (1 << 31) - 1]:
+        for _ in range(300):
+            a = [random.randrange(mod) for _ in range(random.randint(0, 99))]
+            b = [random.randrange(mod) for _ in range(random.randint(0, 99))]
+            expected = simple_conv(a, b, mod)
+            assert conv_mod(a, b, mod) == expected, "Automatic mode failed"
+            assert conv_mod(a, b, mod, 'crt') == expected, "CRT mode failed"
+            if mod <= 1000000007:
+                assert conv_mod(a, b, mod, 'fft') == expected, "FFT mode failed"
+
+    # Longer inputs with worst-case coefficients
+    mod = 1000000007
+    for n in [1000, 3000]:
+        a = [mod - 1 - random.randint(0, 3) for _ in range(n)]
+        b = [mod - 1 - random.randint(0, 3) for _ in range(n)]
+        assert conv_mod(a, b, mod) == simple_conv(a, b, mod), "Convolution failed"
+
+    # Unknown modes are rejected instead of falling back to CRT
+    for mode in ('CRT', 'ntt', ''):
+        try:
+            conv_mod([1], [1], mod, mode)
+            assert False, "Bad mode accepted"
+        except ValueError:
+            pass
+
+    print("Tests passed!")
+
+if __name__ == "__main__":
+    test_fft_mod()
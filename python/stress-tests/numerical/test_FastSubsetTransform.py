@@ -0,0 +1,38 @@
+import sys
+import random
+import numpy as np
+from numerical.FastSubsetTransform import conv, conv_arr
+
+OPS = {'AND': lambda i, j: i & j, 'OR': lambda i, j: i | j, 'XOR': lambda i, j: i ^ j}
+
+def brute(a, b, op, mod=None):
+    target = [0] * len(a)
+    for i in range(len(a)):
+        for j in range(len(b)):
+            target[OPS[op](i, j)] += a[i] * b[j]
+    return [x % mod for x in target] if mod else target
+
+def test_fst():
+    random.seed(11)
+    mod = 998244353
+
+    for k in range(9):
+        for op in OPS:
+            a = [random.randint(-2, 3) for _ in range(1 << k)]
+            b = [random.randint(-2, 3) for _ in range(1 << k)]
+            target = brute(a, b, op)
+            assert conv(a, b, op) == target, f"{op} convolution failed"
+            c = conv_arr(np.array(a, dtype=np.int64), np.array(b, dtype=np.int64), op)
+            assert c.tolist() == target, f"{op} array convolution failed"
+
+            # Modular, batched over rows
+            A = [[random.randrange(mod) for _ in range(1 << k)] for _ in range(3)]
+            B = [[random.randrange(mod) for _ in range(1 << k)] for _ in range(3)]
+            C = conv_arr(np.array(A, dtype=np.uint64), np.array(B, dtype=np.uint64), op, mod)
+            for i in range(3):
+                assert C[i].tolist() == brute(A[i], B[i], op, mod), f"{op} modular convolution failed"
+
+    print("Tests passed!")
+
+if __name__ == "__main__":
+    test_fst()
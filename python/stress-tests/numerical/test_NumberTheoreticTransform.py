@@ -0,0 +1,61 @@
+import sys
+import random
+import numpy as np
+from numerical.NumberTheoreticTransform import ntt, ntt_arr, conv, conv_arr, mod_pow, MOD, ROOT
+
+def simple_conv(a, b):
+    if not a or not b:
+        return []
+    c = [0] * (len(a) + len(b) - 1)
+    for i in range(len(a)):
+        for j in range(len(b)):
+            c[i + j] = (c[i + j] + a[i] * b[j]) % MOD
+    return c
+
+def test_ntt():
+    random.seed(7)
+
+    for _ in range(2000):
+        a = [random.randint(-50, 49) % MOD for _ in range(random.randint(0, 9))]
+        b = [random.randint(-50, 49) % MOD for _ in range(random.randint(0, 9))]
+        assert conv(a, b) == simple_conv(a, b), "Convolution failed"
+
+        # Check transform against the definition
+        a += [0] * (16 - len(a))
+        a2 = a[:]
+        ntt(a2)
+        for k in range(16):
+            s = 0
+            for x in range(16):
+                s = (s + a[x] * mod_pow(ROOT, k * x * (MOD - 1) // 16, MOD)) % MOD
+            assert s == a2[k], f"NTT verification failed at k={k}"
+
+    # Batched rows match row-by-row convolution
+    for _ in range(50):
+        m = random.randint(1, 20)
+        la = random.randint(1, 30)
+        lb = random.randint(1, 30)
+        A = [[random.randrange(MOD) for _ in range(la)] for _ in range(m)]
+        B = [[random.randrange(MOD) for _ in range(lb)] for _ in range(m)]
+        C = conv_arr(np.array(A, dtype=np.uint64), np.array(B, dtype=np.uint64))
+        for i in range(m):
+            assert C[i].tolist() == simple_conv(A[i], B[i]), "Batched convolution failed"
+
+    # Large values near the modulus, larger sizes
+    for n in [1, 2, 100, 1000]:
+        a = [MOD - 1 - random.randint(0, 5) for _ in range(n)]
+        b = [MOD - 1 - random.randint(0, 5) for _ in range(n)]
+        assert conv(a, b) == simple_conv(a, b), "Convolution failed"
+
+    # ntt_arr works in place, so strided views are rejected instead of silently copied
+    for view in (lambda x: x[0, ::2], lambda x: x[:, :4]):
+        try:
+            ntt_arr(view(np.zeros((2, 8), dtype=np.uint64)), MOD, ROOT)
+            assert False, "ntt_arr accepted a non-contiguous array"
+        except AssertionError as e:
+            assert "contiguous" in str(e)
+
+    print("Tests passed!")
+
+if __name__ == "__main__":
+    test_ntt()
@@ -0,0 +1,64 @@
+import sys
+import random
+from numerical.PolynomialMod import inverse, poly_divmod, log, exp, sqrt, multipoint, interpolate
+from numerical.NumberTheoreticTransform import conv, MOD
+
+def evaluate(a, x):
+    res = 0
+    for c in reversed(a):
+        res = (res * x + c) % MOD
+    return res
+
+def padded(a, n):
+    return (a + [0] * n)[:n]
+
+def test_polynomial_mod():
+    random.seed(5)
+
+    for _ in range(300):
+        n = random.randint(1, 20)
+        m = random.randint(1, 25)
+        a = [random.randrange(MOD) for _ in range(n)]
+        a[0] = random.randrange(1, MOD)
+
+        # Inverse
+        assert conv(a, inverse(a, m).tolist())[:m] == padded([1], m), "Inverse failed"
+
+        # Division with remainder
+        b = [random.randrange(MOD) for _ in range(random.randint(1, 10))]
+        b[-1] = random.randrange(1, MOD)
+        q, r = poly_divmod(a, b)
+        q, r = q.tolist(), r.tolist()
+        assert len(r) == len(b) - 1, "Remainder too long"
+        bq = conv(b, q) if q else []
+        tot = [((bq[i] if i < len(bq) else 0) + (r[i] if i < len(r) else 0)) % MOD
+               for i in range(max(len(bq), n))]
+        assert tot == padded(a, len(tot)), "Division failed"
+
+        # log and exp are inverse to each other
+        a1 = [1] + a[1:]
+        assert exp(log(a1, m), m).tolist() == padded(a1, m), "exp(log(a)) != a"
+        a0 = [0] + a[1:]
+        assert log(exp(a0, m), m).tolist() == padded(a0, m), "log(exp(a)) != a"
+
+        # Square root of a square, with leading zeros
+        sq = [0] * random.choice([0, 1, 2]) + a
+        s2 = conv(sq, sq)
+        s = sqrt(s2, m).tolist()
+        assert conv(s, s)[:m] == padded(s2, m), "Square root failed"
+
+        # Multipoint evaluation and interpolation
+        xs = random.sample(range(MOD), random.randint(1, 20))
+        ys = multipoint(a, xs).tolist()
+        assert ys == [evaluate(a, x) for x in xs], "Multipoint evaluation failed"
+        f = interpolate(xs, ys).tolist()
+        assert len(f) == len(xs), "Interpolation has wrong degree"
+        assert [evaluate(f, x) for x in xs] == ys, "Interpolation failed"
+
+    assert sqrt([0, 5], 3) is None
+    assert sqrt([0, 0, 0], 2).tolist() == [0, 0]
+
+    print("Tests passed!")
+
+if __name__ == "__main__":
+    test_polynomial_mod()
@@ -0,0 +1,99 @@
+import sys
+import io
+import os
+import random
+import tempfile
+from various.FastInput import FastInput
+
+def random_input():
+    """Random integers separated by runs of mixed whitespace"""
+    vals = [random.randint(-10**random.randint(0, 18), 10**random.randint(0, 18))
+            for _ in range(random.randint(0, 300))]
+    parts = []
+    for x in vals:
+        parts.append(''.join(random.choice(' \n\t\r') for _ in range(random.randint(0, 3))))
+        if not parts[-1] and len(parts) > 1:
+            parts[-1] = ' '
+        parts.append(str(x))
+    parts.append(random.choice(['', '\n', '  \n']))
+    return vals, ''.join(parts).encode()
+
+def readers(data, size):
+    """A reader over a buffer, a pipe and a real (memory-mapped) file"""
+    yield FastInput(size, io.BytesIO(data))
+    r, w = os.pipe()
+    os.write(w, data)
+    os.close(w)
+    yield FastInput(size, os.fdopen(r, 'rb'))
+    with tempfile.TemporaryFile() as f:
+        f.write(data)
+        f.seek(0)
+        yield FastInput(size, f)
+
+def test_fast_input():
+    random.seed(10)
+
+    for _ in range(300):
+        vals, data = random_input()
+        size = random.randint(1, 64)
+        for how in range(4):
+            for fi in readers(data, size):
+                if how == 0:
+                    got = [fi.read_int() for _ in vals]
+                    assert fi.read_token() is None
+                elif how == 1:
+                    got = fi.read_ints(len(vals)).tolist()
+                elif how == 2:
+                    got = list(fi.ints())
+                else:
+                    # Mix all token readers
+                    k = random.randint(0, len(vals))
+                    got = fi.read_ints(k, numpy=True).tolist()
+                    gen = fi.ints()
+                    for x in gen:
+                        got.append(x)
+                        if random.randint(0, 3) == 0:
+                            break
+                    got += [fi.read_int() for _ in range(random.randint(0, len(vals) - len(got)))]
+                    got += list(fi.ints())
+                assert got == vals, "Mismatch"
+
+    # Tabs or \r alone still split the input into buffer-sized chunks
+    for sep in (b'\t', b'\r', b'\v\f'):
+        data = sep.join(str(i).encode() for i in range(3000))
+        for fi in readers(data, 64):
+            chunks = []
+            c = fi._chunk()
+            while c is not None:
+                chunks.append(c)
+                c = fi._chunk()
+            assert max(map(len, chunks)) <= 64, "Chunk not cut at whitespace"
+            assert [int(t) for c in chunks for t in c.split()] == list(range(3000))
+
+    # A token longer than buffer_size gets a chunk of its own, and the rest stays bounded
+    long = b'7' * 1000
+    data = b'1 2 ' + long + b'\t' + b'\n'.join(str(i).encode() for i in range(2000))
+    for fi in readers(data, 16):
+        chunks = []
+        c = fi._chunk()
+        while c is not None:
+            chunks.append(c)
+            c = fi._chunk()
+        big = [c for c in chunks if len(c) > 16]
+        assert [c.strip() for c in big] == [long], "Long token not chunked alone"
+        assert [t for c in chunks for t in c.split()] == data.split()
+
+    # read_char on the raw input
+    data = b"12 -3\n7"
+    for fi in readers(data, 2):
+        got = []
+        c = fi.read_char()
+        while c:
+            got.append(c)
+            c = fi.read_char()
+        assert bytes(got) == data
+
+    print("Tests passed!")
+
+if __name__ == "__main__":
+    test_fast_input()